@@ -0,0 +1,265 @@
+"""
+TalentScout AI Hiring Assistant - Batch Runner
+Headless replay of recorded candidate sessions across a process pool
+
+Each input line is one session; only ``turns`` is required:
+
+    {"session_id": "ats-1042", "flow": "senior", "turns": ["Hi", "Ada Lovelace", ...], "replies": [...]}
+
+Turns are fed to ``HiringAssistant.get_response`` in order until the
+interview ends. When a session carries the ``replies`` it got before, the
+replay is compared against them, so a flow or template change can be checked
+against recorded sessions. Replays always draw their technical questions
+from the question bank, even when an LLM generator is configured, seeded by
+session id and without reading or adding to the candidate's question
+history, so a session is asked the same questions on every replay and no
+model is called:
+
+    python batch_runner.py sessions/*.jsonl.gz --dry-run --output replayed.jsonl
+
+Without ``--dry-run`` the sessions' candidates, answers and conversation logs
+are committed to the database, e.g. to backfill legacy ATS data. Candidates
+are upserted by session id, but messages are appended, so replaying the same
+file twice logs its conversations twice.
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice, zip_longest
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from database import DEFAULT_DB_PATH, ConnectionPool, DatabaseManager
+from db_writer import WriteBehindWriter, WriteOp
+from hiring_assistant import HiringAssistant
+from migrations import migrate
+from question_bank import get_question_bank
+from question_generator import BankQuestionGenerator
+
+logger = logging.getLogger(__name__)
+
+# Sessions handed to a worker per task, and ops committed per transaction
+BATCH_CHUNK_SIZE = int(os.getenv("TALENTSCOUT_BATCH_CHUNK_SIZE", "50"))
+BATCH_WRITE_SIZE = int(os.getenv("TALENTSCOUT_BATCH_WRITE_SIZE", "2000"))
+
+# Tasks in flight per worker; bounds memory however large the input is
+TASKS_PER_WORKER = 2
+
+
+class RecordedWrites:
+    """Stands in for WriteBehindWriter in workers, keeping ops for the parent to commit"""
+
+    def __init__(self):
+        self.ops: List[WriteOp] = []
+
+    def submit(self, sql: str, params: Sequence, coalesce_key=None) -> bool:
+        self.ops.append((sql, tuple(params), coalesce_key))
+        return True
+
+    def take(self) -> List[WriteOp]:
+        """Ops recorded since the last call"""
+        ops, self.ops = self.ops, []
+        return ops
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+    def get_stats(self) -> Dict[str, float]:
+        return {"recorded": len(self.ops)}
+
+
+# Deterministic and free, unlike an LLM generator
+_replay_questions = BankQuestionGenerator()
+
+# The worker process's database: an in-memory schema, so nothing but the
+# parent's writer ever touches the real file
+_worker_db: Optional[DatabaseManager] = None
+
+
+def init_worker():
+    global _worker_db
+    # One line per stage change is noise across thousands of sessions
+    logging.getLogger("hiring_assistant").setLevel(logging.WARNING)
+    logging.getLogger("database").setLevel(logging.WARNING)
+    _worker_db = DatabaseManager(":memory:", write_behind=False)
+    _worker_db.writer = RecordedWrites()
+
+
+class ReplayAssistant(HiringAssistant):
+    """HiringAssistant whose writes are recorded instead of committed"""
+
+    __slots__ = ()
+
+    @property
+    def db_manager(self):
+        return _worker_db
+
+    @property
+    def question_generator(self):
+        return _replay_questions
+
+    def question_history_key(self) -> str:
+        return ""
+
+
+def replay_session(record: Dict[str, Any]) -> Tuple[Dict[str, Any], List[WriteOp]]:
+    """Run one session's turns; returns its result and the writes it made"""
+    started = time.perf_counter()
+    assistant = ReplayAssistant(record.get("flow"))
+    if record.get("session_id"):
+        assistant.candidate_info.session_id = str(record["session_id"])
+    get_question_bank().seed(assistant.candidate_info.session_id)
+    result: Dict[str, Any] = {"session_id": assistant.candidate_info.session_id,
+                              "flow": assistant.flow.name}
+    replies = []
+    try:
+        for turn in record["turns"]:
+            if assistant.conversation_ended:
+                break
+            replies.append(assistant.get_response(str(turn)))
+    except Exception as e:
+        # A half-replayed session is not written
+        _worker_db.writer.take()
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result, []
+
+    result.update(stage=assistant.get_current_stage(), completed=assistant.conversation_ended,
+                  replies=replies, seconds=round(time.perf_counter() - started, 4))
+    expected = record.get("replies")
+    if expected is not None:
+        result["mismatches"] = [i for i, (got, want) in enumerate(zip_longest(replies, expected))
+                                if got != want]
+    return result, _worker_db.writer.take()
+
+
+def replay_chunk(records: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[WriteOp]]]:
+    return [replay_session(record) for record in records]
+
+
+def read_sessions(paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+    """Session records from JSONL files, gzipped when named .gz; bad lines are logged and skipped"""
+    for path in paths:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record.get("turns"), list):
+                        raise ValueError("no turns list")
+                except (ValueError, AttributeError) as e:
+                    logger.error(f"Skipping {path}:{line_no}: {e}")
+                    continue
+                yield record
+
+
+def _chunks(records: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _replayed(chunks: Iterator[List[Dict[str, Any]]],
+              workers: int) -> Iterator[Tuple[Dict[str, Any], List[WriteOp]]]:
+    """Replay chunks in input order, on a process pool unless workers is 1"""
+    if workers <= 1:
+        init_worker()
+        for chunk in chunks:
+            yield from replay_chunk(chunk)
+        return
+
+    # Spawned, so workers never inherit the writer thread or open SQLite connections
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=init_worker) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(replay_chunk, chunk))
+            if len(pending) >= workers * TASKS_PER_WORKER:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def run(paths: Sequence[Path], db_path: str = DEFAULT_DB_PATH, workers: int = 0,
+        chunk_size: int = BATCH_CHUNK_SIZE, write_size: int = BATCH_WRITE_SIZE,
+        dry_run: bool = False, output: Optional[Path] = None) -> Dict[str, Any]:
+    """Replay every session in the files; returns summary counts"""
+    workers = workers or os.cpu_count() or 1
+    summary = {"sessions": 0, "turns": 0, "completed": 0, "mismatched": 0, "errors": 0}
+    started = time.perf_counter()
+
+    writer = None
+    if not dry_run:
+        pool = ConnectionPool(db_path)
+        migrate(pool.get_connection())
+        # One writer thread commits every worker's ops in batched transactions
+        writer = WriteBehindWriter(pool, batch_size=write_size)
+    out = open(output, "w", encoding="utf-8") if output is not None else None
+    try:
+        for result, ops in _replayed(_chunks(read_sessions(paths), chunk_size), workers):
+            summary["sessions"] += 1
+            summary["turns"] += len(result.get("replies", ()))
+            summary["completed"] += bool(result.get("completed"))
+            summary["mismatched"] += bool(result.get("mismatches"))
+            if "error" in result:
+                summary["errors"] += 1
+                logger.error(f"Session {result['session_id']} failed: {result['error']}")
+            if writer is not None:
+                for op in ops:
+                    writer.submit(*op)
+            if out is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if out is not None:
+            out.close()
+        if writer is not None:
+            writer.close()
+            pool.close_all()
+
+    summary["seconds"] = round(time.perf_counter() - started, 2)
+    summary["turns_per_second"] = round(summary["turns"] / summary["seconds"], 1) if summary["seconds"] else 0.0
+    if writer is not None:
+        summary["write_errors"] = writer.get_stats()["errors"]
+    return summary
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("inputs", nargs="+", type=Path, help="JSONL session files, optionally gzipped")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--workers", type=int, default=0, help="processes to replay on (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE, help="sessions per worker task")
+    parser.add_argument("--write-size", type=int, default=BATCH_WRITE_SIZE, help="writes per transaction")
+    parser.add_argument("--dry-run", action="store_true", help="replay without writing to the database")
+    parser.add_argument("--output", type=Path, help="JSONL file for each session's replies and outcome")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    try:
+        summary = run(args.inputs, args.db, args.workers, args.chunk_size, args.write_size,
+                      args.dry_run, args.output)
+    except OSError as e:
+        logger.error(f"Batch run failed: {e}")
+        return 1
+
+    logger.info(f"Replayed {summary}")
+    failed = summary["errors"] or summary["mismatched"] or summary.get("write_errors")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+TalentScout AI Hiring Assistant - Candidate Search Benchmark
+Recruiter search latency on a synthetic candidates database
+
+Run from the repository root:  python benchmarks/bench_candidate_search.py --candidates 1000000
+The database is generated on first use and reused afterwards.
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from candidate_search import COUNT_CAP, CandidateFilters, CandidateSearch, CountCache  # noqa: E402
+from database import ConnectionPool  # noqa: E402
+from migrations import INSERT_SKILL_SQL, UPSERT_ANSWER_SQL, migrate  # noqa: E402
+
+POSITIONS = (
+    "Backend Engineer", "Frontend Developer", "Full Stack Developer", "Data Scientist",
+    "DevOps Engineer", "Mobile App Developer", "Machine Learning Engineer", "Data Analyst",
+    "Site Reliability Engineer", "Platform Engineer", "QA Engineer", "Security Engineer",
+)
+LOCATIONS = (
+    "Pune, India", "Bangalore, India", "Hyderabad, India", "Mumbai, India", "New York, USA",
+    "San Francisco, USA", "Austin, USA", "Seattle, USA", "London, UK", "Berlin, Germany",
+    "Amsterdam, Netherlands", "Toronto, Canada", "Sydney, Australia", "Singapore", "Dublin, Ireland",
+    "Paris, France", "Madrid, Spain", "Warsaw, Poland", "Lisbon, Portugal", "Tokyo, Japan",
+)
+SKILLS = (
+    "Python", "JavaScript", "Java", "React", "Node.js", "SQL", "AWS", "Docker", "Kubernetes",
+    "TypeScript", "Django", "Flask", "Spring", "Go", "Rust", "C++", "PostgreSQL", "MongoDB",
+    "Redis", "Kafka", "Terraform", "Angular", "Vue", "Swift", "Kotlin", "GraphQL", "Spark",
+    "TensorFlow", "PyTorch", "Elixir",
+)
+ANSWER_WORDS = (
+    "cache", "index", "latency", "throughput", "replica", "shard", "queue", "retry", "timeout",
+    "transaction", "lock", "deadlock", "profiling", "benchmark", "container", "pipeline",
+    "migration", "schema", "partition", "consistency", "idempotent", "backpressure", "memoize",
+    "observability", "tracing", "rollback", "canary", "feature", "flag", "thread", "async",
+)
+
+
+def generate(path: Path, candidates: int, seed: int = 7, batch: int = 20000):
+    """Fill a fresh database with synthetic candidates, skills and answers"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    migrate(conn)
+    start = datetime(2024, 1, 1)
+    span = 2 * 365 * 24 * 3600
+    skill_weights = [1 / (rank + 1) for rank in range(len(SKILLS))]
+    started = time.perf_counter()
+
+    for first in range(0, candidates, batch):
+        people, skills, answers = [], [], []
+        for n in range(first, min(first + batch, candidates)):
+            session_id = f"bench-{n:08d}"
+            created = (start + timedelta(seconds=span * n // candidates)).isoformat()
+            people.append((session_id, f"Candidate {n}", f"candidate{n}@example.com", "5551234567",
+                           f"{rng.randint(0, 15)} years", rng.choice(POSITIONS), rng.choice(LOCATIONS),
+                           created, created))
+            for skill in set(rng.choices(SKILLS, weights=skill_weights, k=4)):
+                skills.append((session_id, skill.lower(), skill))
+            for question_no in range(1, 4):
+                text = " ".join(rng.choices(ANSWER_WORDS, k=12))
+                answers.append((session_id, question_no, "Question", text, created))
+        with conn:
+            # Answers first, so the candidate insert trigger indexes them in one go
+            conn.executemany(UPSERT_ANSWER_SQL, answers)
+            conn.executemany(INSERT_SKILL_SQL, skills)
+            conn.executemany(
+                "INSERT INTO candidates (session_id, full_name, email, phone, experience_years, "
+                "desired_position, location, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                people,
+            )
+        print(f"\r  generated {min(first + batch, candidates):,} / {candidates:,}", end="", flush=True)
+    conn.execute("ANALYZE")
+    conn.close()
+    print(f"\n  done in {time.perf_counter() - started:.0f} s")
+
+
+CASES = (
+    ("newest page", CandidateFilters()),
+    ("common skill", CandidateFilters(skill="python")),
+    ("rare skill", CandidateFilters(skill="elixir")),
+    ("position", CandidateFilters(position="backend")),
+    ("location prefix", CandidateFilters(location="pune")),
+    ("date range", CandidateFilters(created_from="2025-03-01", created_to="2025-03-31")),
+    ("full text", CandidateFilters(text="deadlock canary")),
+    ("skill + location", CandidateFilters(skill="rust", location="berlin")),
+    ("skill + position + text", CandidateFilters(skill="go", position="platform", text="backpressure")),
+    ("everything", CandidateFilters(skill="kafka", position="engineer", location="london",
+                                    created_from="2024-06-01", created_to="2025-06-30", text="idempotent")),
+)
+
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--candidates", type=int, default=1_000_000)
+    parser.add_argument("--db", type=Path, default=None, help="defaults to benchmarks/search_<N>.db")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=20, help="pages to walk for the deep-page timing")
+    args = parser.parse_args()
+
+    path = args.db or Path(__file__).resolve().parent / f"search_{args.candidates}.db"
+    if not path.exists():
+        print(f"Generating {args.candidates:,} candidates in {path}")
+        generate(path, args.candidates)
+
+    search = CandidateSearch(ConnectionPool(str(path)), CountCache())
+    print(f"\n{'query':<26}{'page p50':>10}{'page max':>10}{'deep page':>11}{'count cold':>12}"
+          f"{'count warm':>12}{'rows':>6}{'matches':>10}")
+    for name, filters in CASES:
+        page, samples = timed(lambda filters=filters: search.search(filters), args.repeat)
+        cursor, deep = page.next_cursor, 0.0
+        for _ in range(args.pages):
+            if cursor is None:
+                break
+            started = time.perf_counter()
+            cursor = search.search(filters, cursor).next_cursor
+            deep = max(deep, (time.perf_counter() - started) * 1000)
+        search.counts.clear()
+        count, cold = timed(lambda filters=filters: search.count(filters), 1)
+        matches = f"{count.total:,}" if count.exact else f"~{count.total:,}"
+        if count.total >= COUNT_CAP:
+            matches = f"{COUNT_CAP:,}+"
+        _, warm = timed(lambda filters=filters: search.count(filters), args.repeat)
+        print(f"{name:<26}{statistics.median(samples):>9.2f}ms{max(samples):>8.2f}ms{deep:>9.2f}ms"
+              f"{cold[0]:>10.1f}ms{statistics.median(warm):>10.3f}ms{len(page.rows):>6}{matches:>10}")
+
+
+if __name__ == "__main__":
+    main()
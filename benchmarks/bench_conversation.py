@@ -0,0 +1,323 @@
+"""
+TalentScout AI Hiring Assistant - Conversation Engine Benchmark
+Full synthetic interviews: stage latency, throughput, database writes and session memory
+
+Run from the repository root:  python benchmarks/bench_conversation.py --json results.json
+Record a baseline once with --save-baseline, then later runs given --baseline
+exit non-zero when a gated metric regresses past --tolerance.
+Baselines are only comparable on the machine that recorded them.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Interviews write to a scratch database and question bank, never the real
+# ones; spawned workers inherit the directory through the environment
+if "TALENTSCOUT_BENCH_SCRATCH" not in os.environ:
+    os.environ["TALENTSCOUT_BENCH_SCRATCH"] = tempfile.mkdtemp(prefix="talentscout-bench-")
+SCRATCH_DIR = os.environ["TALENTSCOUT_BENCH_SCRATCH"]
+os.environ.setdefault("TALENTSCOUT_DB_PATH", os.path.join(SCRATCH_DIR, "candidates.db"))
+os.environ.setdefault("TALENTSCOUT_QUESTION_BANK_PATH", os.path.join(SCRATCH_DIR, "question_bank.db"))
+os.environ.setdefault("TALENTSCOUT_QUESTION_BACKEND", "bank")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import DatabaseManager, get_database_manager  # noqa: E402
+from hiring_assistant import HiringAssistant, get_flows  # noqa: E402
+from sessions import estimate_size  # noqa: E402
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "conversation_baseline.json"
+
+FIRST_NAMES = (
+    "Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "James", "Olivia", "Lucas", "Sofia",
+    "Chen", "Yuki", "Fatima", "Omar", "Elena", "Mateo", "Zara", "Noah", "Ingrid", "Kwame",
+)
+LAST_NAMES = (
+    "Sharma", "Patel", "Iyer", "Reddy", "Smith", "Garcia", "Müller", "Rossi", "Nguyen", "Kim",
+    "Okafor", "Haddad", "Novak", "Silva", "O'Brien", "Tanaka", "Kowalski", "Andersson",
+)
+POSITIONS = (
+    "Backend Engineer", "Frontend Developer", "Full Stack Developer", "Data Scientist",
+    "DevOps Engineer", "Machine Learning Engineer", "Site Reliability Engineer", "Mobile Developer",
+)
+LOCATIONS = ("Pune, India", "Bangalore, India", "New York, USA", "Berlin, Germany", "London, UK", "Remote")
+TECH_STACKS = (
+    "Python, Django, PostgreSQL", "React, TypeScript, Node.js", "Java, Spring Boot, Kafka",
+    "Go, Kubernetes, Docker, AWS", "Python, PyTorch, TensorFlow, SQL", "Swift, Kotlin, Flutter",
+    "C++, Rust", "Vue, Angular, GraphQL, MongoDB", "Terraform, AWS, Redis, Linux",
+    "I mostly write Python with FastAPI and Celery, deploy on GCP, and use Postgres and Redis",
+)
+ANSWER_WORDS = (
+    "I", "would", "start", "by", "profiling", "the", "service", "then", "add", "a", "cache", "in",
+    "front", "of", "database", "because", "latency", "matters", "more", "than", "throughput",
+    "here", "and", "partition", "queue", "so", "consumers", "can", "retry", "idempotently",
+    "with", "backpressure", "when", "replicas", "lag", "behind", "measure", "everything",
+)
+
+# Metrics checked against the baseline; tail latencies are reported but too
+# noisy to gate on
+GATED_SUFFIXES = ("p50_ms", "turns_per_second", "session_bytes")
+
+
+class SyntheticCandidate:
+    """Deterministic replies for one interview, keyed by stage"""
+
+    def __init__(self, rng: random.Random, flows: List[str], number: int):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        self.flow = rng.choice(flows)
+        self.replies = {
+            "greeting": "Hi, I'm ready to start",
+            "name_collection": f"{first} {last}",
+            "email_collection": f"{first.lower()}.{number}@example.com",
+            "phone_collection": f"+91 98{rng.randint(10000000, 99999999)}",
+            "experience_collection": f"{rng.randint(0, 20)} years",
+            "position_collection": rng.choice(POSITIONS),
+            "location_collection": rng.choice(LOCATIONS),
+            "tech_stack_collection": rng.choice(TECH_STACKS),
+            "conclusion": "Looking forward to hearing from the team",
+        }
+        self.answers = [" ".join(rng.choices(ANSWER_WORDS, k=rng.randint(30, 600))) for _ in range(8)]
+
+    def reply(self, stage: str, turn: int) -> str:
+        return self.replies.get(stage) or self.answers[turn % len(self.answers)]
+
+
+def run_interviews(count: int, seed: int) -> Tuple[int, Dict[str, List[float]], List[int]]:
+    """Play full interviews; returns turns, turn latency per stage and each session's size"""
+    rng = random.Random(seed)
+    flows = sorted(get_flows().flows)
+    latencies: Dict[str, List[float]] = {}
+    sizes = []
+    turns = 0
+    for number in range(count):
+        candidate = SyntheticCandidate(rng, flows, seed * 1_000_000 + number)
+        assistant = HiringAssistant(candidate.flow)
+        turn = 0
+        while not assistant.conversation_ended and turn < 50:
+            stage = assistant.get_current_stage()
+            text = candidate.reply(stage, turn)
+            started = time.perf_counter()
+            assistant.get_response(text)
+            latencies.setdefault(stage, []).append((time.perf_counter() - started) * 1000)
+            turn += 1
+        turns += turn
+        sizes.append(estimate_size(assistant))
+    return turns, latencies, sizes
+
+
+def _flushed_interviews(count: int, seed: int) -> Tuple[int, Dict[str, List[float]], List[int]]:
+    """run_interviews in a worker process, waiting for its writes before returning"""
+    result = run_interviews(count, seed)
+    get_database_manager().close()
+    return result
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+
+    def at(q: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    return {"count": len(ordered), "p50_ms": at(0.50), "p90_ms": at(0.90), "p99_ms": at(0.99),
+            "max_ms": round(ordered[-1], 3)}
+
+
+def measure_single(sessions: int, seed: int) -> Tuple[Dict, Dict, List[int]]:
+    started = time.perf_counter()
+    turns, latencies, sizes = run_interviews(sessions, seed)
+    elapsed = time.perf_counter() - started
+    stages = {stage: percentiles(samples) for stage, samples in latencies.items()}
+    return stages, {"turns": turns, "seconds": round(elapsed, 3),
+                    "turns_per_second": round(turns / elapsed, 1)}, sizes
+
+
+def measure_concurrent(executor, workers: int, sessions: int, seed: int, fn=run_interviews) -> Dict:
+    """Split the sessions across workers and time the whole batch"""
+    shares = [sessions // workers + (i < sessions % workers) for i in range(workers)]
+    started = time.perf_counter()
+    results = list(executor.map(fn, shares, [seed + i for i in range(workers)]))
+    elapsed = time.perf_counter() - started
+    turns = sum(result[0] for result in results)
+    samples = [ms for result in results for stage_samples in result[1].values() for ms in stage_samples]
+    return {"workers": workers, "turns": turns, "seconds": round(elapsed, 3),
+            "turns_per_second": round(turns / elapsed, 1), "turn": percentiles(samples)}
+
+
+def measure_db_writes(samples: int) -> Dict:
+    """Synchronous write latency, and the write-behind queue's flush timings from the runs so far"""
+    manager = get_database_manager()
+    manager.flush()
+    queued = manager.get_write_stats()
+
+    direct = DatabaseManager(manager.db_path, write_behind=False)
+    timings = []
+    for n in range(samples):
+        started = time.perf_counter()
+        direct.log_conversation("bench-db-writes", "user", ANSWER_WORDS[n % len(ANSWER_WORDS)] * 40, "greeting")
+        timings.append((time.perf_counter() - started) * 1000)
+    direct.close()
+    return {
+        "sync_log_conversation": percentiles(timings),
+        "write_behind": {key: round(queued[key], 3) for key in
+                         ("written", "flushes", "avg_flush_ms", "max_flush_ms", "max_queue_depth", "errors")},
+    }
+
+
+def measure_memory(sessions: int, seed: int, sizes: List[int]) -> Dict:
+    """Estimated size of finished sessions, and heap growth per session held in memory"""
+    manager = get_database_manager()
+    rng = random.Random(seed)
+    flows = sorted(get_flows().flows)
+    candidates = [SyntheticCandidate(rng, flows, n) for n in range(sessions)]
+    manager.flush()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    held = []
+    for candidate in candidates:
+        assistant = HiringAssistant(candidate.flow)
+        for turn in range(12):
+            if assistant.conversation_ended:
+                break
+            assistant.get_response(candidate.reply(assistant.get_current_stage(), turn))
+        held.append(assistant)
+    manager.flush()
+    grown = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(before, "filename"))
+    tracemalloc.stop()
+    return {
+        "estimated_session_bytes": round(sum(sizes) / len(sizes)),
+        "max_estimated_session_bytes": max(sizes),
+        "traced_session_bytes": round(grown / len(held)),
+    }
+
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float, slack_ms: float) -> List[str]:
+    """Gated metrics worse than the baseline by more than the tolerance
+
+    Latencies must also be ``slack_ms`` slower in absolute terms, since
+    stages that take microseconds jitter by more than any sane tolerance.
+    """
+    current, previous = flatten(results), flatten(baseline)
+    regressions = []
+    for path, before in sorted(previous.items()):
+        if not path.endswith(GATED_SUFFIXES) or path not in current or not before:
+            continue
+        now = current[path]
+        change = (now - before) / before
+        worse = -change if path.endswith("turns_per_second") else change
+        if path.endswith("_ms") and now - before <= slack_ms:
+            continue
+        if worse > tolerance:
+            regressions.append(f"{path}: {before:g} -> {now:g} ({change:+.1%})")
+    return regressions
+
+
+def print_report(results: Dict):
+    print(f"\n{'stage':<24}{'turns':>8}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}")
+    for stage, stats in results["stages"].items():
+        print(f"{stage:<24}{stats['count']:>8}{stats['p50_ms']:>8.2f}ms{stats['p90_ms']:>8.2f}ms"
+              f"{stats['p99_ms']:>8.2f}ms{stats['max_ms']:>8.2f}ms")
+
+    print(f"\n{'mode':<24}{'turns':>8}{'turns/s':>12}")
+    for mode, stats in results["throughput"].items():
+        print(f"{mode:<24}{stats['turns']:>8}{stats['turns_per_second']:>12,.1f}")
+
+    sync = results["db"]["sync_log_conversation"]
+    queued = results["db"]["write_behind"]
+    print(f"\nsync log_conversation: p50 {sync['p50_ms']:.2f}ms, p99 {sync['p99_ms']:.2f}ms; "
+          f"write-behind flush avg {queued['avg_flush_ms']:.2f}ms, max {queued['max_flush_ms']:.2f}ms")
+    memory = results["memory"]
+    print(f"session memory: estimated {memory['estimated_session_bytes']:,} B "
+          f"(max {memory['max_estimated_session_bytes']:,} B), traced {memory['traced_session_bytes']:,} B")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=300, help="interviews per throughput run")
+    parser.add_argument("--workers", type=int, default=4, help="threads and processes for the concurrent runs")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--db-samples", type=int, default=500, help="synchronous writes to time")
+    parser.add_argument("--memory-sessions", type=int, default=200, help="sessions held for the heap measurement")
+    parser.add_argument("--json", type=Path, help="write the results here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--slack-ms", type=float, default=0.2, help="latency change always allowed")
+    args = parser.parse_args(argv)
+
+    # Warm up imports, templates, taxonomy and the question bank outside the timings
+    run_interviews(5, args.seed - 1)
+
+    stages, single, sizes = measure_single(args.sessions, args.seed)
+    throughput = {"single_thread": single}
+    with ThreadPoolExecutor(args.workers) as executor:
+        throughput[f"threads_{args.workers}"] = measure_concurrent(executor, args.workers, args.sessions, args.seed)
+    # Spawned, so workers never inherit the writer thread or open SQLite connections
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(args.workers, mp_context=context) as executor:
+        # Start every worker before timing, so process startup is not counted
+        list(executor.map(run_interviews, [1] * args.workers, range(args.workers)))
+        throughput[f"processes_{args.workers}"] = measure_concurrent(
+            executor, args.workers, args.sessions, args.seed, _flushed_interviews)
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "sessions": args.sessions,
+            "seed": args.seed,
+        },
+        "stages": stages,
+        "throughput": throughput,
+        "db": measure_db_writes(args.db_samples),
+        "memory": measure_memory(args.memory_sessions, args.seed, sizes),
+    }
+    get_database_manager().close()
+    shutil.rmtree(SCRATCH_DIR, ignore_errors=True)
+    print_report(results)
+
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")),
+                          args.tolerance, args.slack_ms)
+    print(f"\nAgainst {args.baseline}: {len(regressions)} regression(s) past {args.tolerance:.0%}")
+    for line in regressions:
+        print(f"  {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
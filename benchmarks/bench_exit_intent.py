@@ -0,0 +1,107 @@
+"""
+TalentScout AI Hiring Assistant - Exit Intent Benchmark
+Accuracy and speed of the exit detector against the original substring scan
+
+Run from the repository root:  python benchmarks/bench_exit_intent.py
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from hiring_assistant import STAGE_TABLE  # noqa: E402
+from intent import ExitIntentDetector  # noqa: E402
+
+CORPUS_PATH = Path(__file__).resolve().parent / "exit_intent_corpus.jsonl"
+
+LEGACY_EXIT_KEYWORDS = (
+    'bye', 'goodbye', 'exit', 'quit', 'end', 'stop', 'finish',
+    'terminate', 'close', 'done', 'thanks', 'thank you'
+)
+
+
+def legacy_is_exit(text: str, stage: str) -> bool:
+    """The substring scan HiringAssistant used before the detector"""
+    return any(keyword in text.lower().strip() for keyword in LEGACY_EXIT_KEYWORDS)
+
+
+def load_corpus(path: Path) -> List[Dict]:
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def evaluate(name: str, classify: Callable[[str, str], bool], corpus: List[Dict]) -> Dict:
+    """Confusion counts over the corpus"""
+    false_exits, missed_exits = [], []
+    for row in corpus:
+        predicted = classify(row["text"], row["stage"])
+        if predicted and not row["exit"]:
+            false_exits.append(row)
+        elif row["exit"] and not predicted:
+            missed_exits.append(row)
+
+    continuing = sum(1 for row in corpus if not row["exit"])
+    exiting = len(corpus) - continuing
+    return {
+        "name": name,
+        "accuracy": 1 - (len(false_exits) + len(missed_exits)) / len(corpus),
+        "false_exit_rate": len(false_exits) / continuing,
+        "missed_exit_rate": len(missed_exits) / exiting,
+        "false_exits": false_exits,
+        "missed_exits": missed_exits,
+    }
+
+
+def time_per_call(classifiers: Dict[str, Callable[[str, str], bool]], corpus: List[Dict],
+                  repeat: int, rounds: int = 10) -> Dict[str, float]:
+    """Best mean time per call in microseconds
+
+    The classifiers take turns within each round, so a busy machine slows
+    them alike rather than deciding which one wins.
+    """
+    number = max(1, repeat // rounds)
+    best = {name: float("inf") for name in classifiers}
+    for _ in range(rounds):
+        for name, classify in classifiers.items():
+            elapsed = timeit.timeit(lambda: [classify(row["text"], row["stage"]) for row in corpus], number=number)
+            best[name] = min(best[name], elapsed / (number * len(corpus)) * 1e6)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
+    parser.add_argument("--repeat", type=int, default=2000, help="timing passes over the corpus")
+    parser.add_argument("--verbose", action="store_true", help="list every misclassified reply")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    detector = ExitIntentDetector()
+
+    def detector_is_exit(text: str, stage: str) -> bool:
+        return detector.is_exit(text, free_text=STAGE_TABLE[stage].free_text)
+
+    classifiers = {"substring scan": legacy_is_exit, "intent detector": detector_is_exit}
+    results = [evaluate(name, classify, corpus) for name, classify in classifiers.items()]
+    timings = time_per_call(classifiers, corpus, args.repeat)
+
+    print(f"{len(corpus)} labeled replies ({sum(row['exit'] for row in corpus)} exits)\n")
+    print(f"{'classifier':<18}{'accuracy':>10}{'false exits':>13}{'missed exits':>14}{'us/call':>10}")
+    for result in results:
+        print(f"{result['name']:<18}{result['accuracy']:>10.1%}{result['false_exit_rate']:>13.1%}"
+              f"{result['missed_exit_rate']:>14.1%}{timings[result['name']]:>10.2f}")
+
+    for result in results:
+        if args.verbose or result["name"] == "intent detector":
+            for kind in ("false_exits", "missed_exits"):
+                for row in result[kind]:
+                    print(f"  {result['name']} {kind.replace('_', ' ')[:-1]}: [{row['stage']}] {row['text']!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+TalentScout AI Hiring Assistant - Candidate Search
+Keyset-paginated, index-backed candidate queries for the recruiter dashboard
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from database import ConnectionPool, get_database_manager
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = int(os.getenv("TALENTSCOUT_SEARCH_PAGE_SIZE", "25"))
+COUNT_CACHE_TTL = float(os.getenv("TALENTSCOUT_SEARCH_COUNT_TTL", "60"))
+COUNT_CACHE_SIZE = 256
+
+# Counts stop here; the dashboard shows "10,000+" rather than touching every match
+COUNT_CAP = int(os.getenv("TALENTSCOUT_SEARCH_COUNT_CAP", "10000"))
+
+# Wall-clock budget per page or count. Intersections of several broad
+# filters can't be answered from one index; past the budget a page returns
+# the matches found so far and a count becomes a lower bound.
+SEARCH_BUDGET_MS = float(os.getenv("TALENTSCOUT_SEARCH_BUDGET_MS", "40"))
+
+# SQLite VM steps between deadline checks
+PROGRESS_STEPS = 1000
+
+# First id window of a budgeted count; each next one is twice as large
+COUNT_WINDOW = 16384
+
+# Id ranges the SCAN and TEXT plans try, newest first, before handing over
+# to the INDEX plan
+SCAN_WINDOWS = (4096, 32768)
+
+NEXT_ID_SQL = "SELECT coalesce(max(id), 0) + 1 FROM candidates"
+
+LISTING_COLUMNS = (
+    "id", "session_id", "full_name", "email", "experience_years",
+    "desired_position", "location", "created_at"
+)
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Sorts after every character a location can start with
+_PREFIX_END = "\U0010ffff"
+
+
+class CandidateFilters(NamedTuple):
+    """Recruiter search criteria; empty fields are not applied"""
+    skill: str = ""
+    position: str = ""
+    location: str = ""
+    created_from: str = ""  # ISO date, inclusive
+    created_to: str = ""    # ISO date, inclusive
+    text: str = ""          # full text over positions and technical answers
+
+    def normalized(self) -> "CandidateFilters":
+        return CandidateFilters(*(" ".join(value.split()) for value in self))
+
+
+# id of the last row on the previous page
+Cursor = int
+
+
+class CandidatePage(NamedTuple):
+    """A page of matches; ``next_cursor`` is None once nothing older can match
+
+    A page cut short by the search budget holds fewer rows than asked for
+    but still has a cursor, which resumes the search where it stopped.
+    """
+    rows: List[Dict[str, Any]]
+    next_cursor: Optional[Cursor]
+
+
+class CandidateCount(NamedTuple):
+    """Number of matches, capped at COUNT_CAP; an estimate when not ``exact``"""
+    total: int
+    exact: bool
+
+
+def fts_terms(text: str) -> str:
+    """Quote each word so user input can never be read as FTS5 syntax"""
+    return " ".join(f'"{word}"' for word in _WORD_RE.findall(text.lower()))
+
+
+def match_expression(filters: CandidateFilters) -> str:
+    """FTS5 query for the text and position filters, or "" when neither is set"""
+    parts = []
+    if fts_terms(filters.text):
+        parts.append(f"({fts_terms(filters.text)})")
+    if fts_terms(filters.position):
+        parts.append(f"desired_position : ({fts_terms(filters.position)})")
+    return " AND ".join(parts)
+
+
+# Query plans, see search_sql
+SCAN, TEXT, INDEX = "scan", "text", "index"
+
+
+def _from_where(plan: str, skill: bool, match: bool, location: bool, created_from: bool,
+                created_to: bool) -> Tuple[str, List[str]]:
+    """FROM clause and filter conditions for a plan"""
+    joins, conditions = [], []
+    if plan == TEXT:
+        source = "candidate_fts f CROSS JOIN candidates c ON c.id = f.rowid"
+    else:
+        source = "candidates c"
+    if match:
+        if plan == INDEX:
+            conditions.append("c.id IN (SELECT rowid FROM candidate_fts WHERE candidate_fts MATCH ?)")
+        else:
+            conditions.append("f.candidate_fts MATCH ?")
+    if skill:
+        if plan == INDEX:
+            joins.append("JOIN candidate_skills s ON s.session_id = c.session_id")
+            conditions.append("s.skill_key = ?")
+        else:
+            conditions.append("EXISTS (SELECT 1 FROM candidate_skills s "
+                              "WHERE s.session_id = c.session_id AND s.skill_key = ?)")
+    if location:
+        conditions.append("c.location COLLATE NOCASE >= ? AND c.location COLLATE NOCASE < ?")
+    if created_from:
+        conditions.append("c.created_at >= ?")
+    if created_to:
+        conditions.append("c.created_at < ?")
+    return " ".join([source] + joins), conditions
+
+
+@lru_cache(maxsize=None)
+def search_sql(plan: str, skill: bool, match: bool, location: bool, created_from: bool,
+               created_to: bool, windowed: bool) -> str:
+    """SQL for one plan and combination of active filters
+
+    Built once per shape so each keeps a stable string for the statement
+    cache. Rows come newest first by id and a page starts below the cursor,
+    so deep pages cost the same as the first instead of growing with an
+    OFFSET. Parameters always follow the same order: match, skill, location
+    range, dates, upper id bound, lower id bound (windowed plans only), limit.
+
+    * SCAN walks candidates down the primary key and probes every other
+      filter per row; it stops as soon as the page is full.
+    * TEXT walks the full-text index down its rowids (which are candidate
+      ids) and probes the rest the same way.
+    * INDEX lets SQLite drive from whichever filter index is most selective
+      and sort the ids it finds, which is cheap exactly when matches are few.
+    """
+    source, conditions = _from_where(plan, skill, match, location, created_from, created_to)
+    order = "f.rowid" if plan == TEXT else "c.id"
+    # The unary + keeps SQLite from walking the primary key down from the
+    # cursor, which is the SCAN plan, instead of using a filter index
+    conditions.append(f"+{order} < ?" if plan == INDEX else f"{order} < ?")
+    if windowed:
+        conditions.append(f"{order} >= ?")
+    where = " AND ".join(conditions)
+    if plan == INDEX:
+        # Sort bare ids, which the filter indexes cover, and read only the
+        # rows of the page; sorting whole rows means a table read per match
+        return (f"SELECT {', '.join(LISTING_COLUMNS)} FROM candidates WHERE id IN "
+                f"(SELECT c.id FROM {source} WHERE {where} ORDER BY c.id DESC LIMIT ?) ORDER BY id DESC")
+    return (f"SELECT {', '.join(f'c.{column}' for column in LISTING_COLUMNS)} "
+            f"FROM {source} WHERE {where} ORDER BY {order} DESC LIMIT ?")
+
+
+@lru_cache(maxsize=None)
+def count_sql(skill: bool, match: bool, location: bool, created_from: bool, created_to: bool,
+              windowed: bool = False) -> str:
+    """Capped count; without an ORDER BY both plans stop at the cap
+
+    Full-text counts stream matches off the TEXT join rather than building
+    the whole match list first. Windowed counts take an upper and lower id
+    bound before the cap.
+    """
+    source, conditions = _from_where(TEXT if match else INDEX, skill, match, location,
+                                     created_from, created_to)
+    if windowed:
+        order = "f.rowid" if match else "c.id"
+        conditions += [f"{order} < ?", f"{order} >= ?"]
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    return f"SELECT count(*) FROM (SELECT 1 FROM {source}{where} LIMIT ?)"
+
+
+class _Interrupted(Exception):
+    """A query ran past the search deadline"""
+
+
+@contextmanager
+def _deadline(conn, deadline: Optional[float]):
+    """Abort queries on conn once time.perf_counter() passes deadline
+
+    Raises _Interrupted in place of SQLite's interrupt error.
+    """
+    if deadline is None:
+        yield
+        return
+    conn.set_progress_handler(lambda: time.perf_counter() > deadline, PROGRESS_STEPS)
+    try:
+        yield
+    except sqlite3.OperationalError as e:
+        if "interrupted" not in str(e):
+            raise
+        raise _Interrupted() from e
+    finally:
+        conn.set_progress_handler(None, 0)
+
+
+def _next_day(day: str) -> str:
+    """Exclusive upper bound for an inclusive ISO date filter"""
+    return (date.fromisoformat(day[:10]) + timedelta(days=1)).isoformat()
+
+
+def _filter_params(filters: CandidateFilters, match: str) -> List[Any]:
+    """Parameters for the active filters, in search_sql order"""
+    params: List[Any] = []
+    if match:
+        params.append(match)
+    if filters.skill:
+        params.append(filters.skill.lower())
+    if filters.location:
+        params += [filters.location, filters.location + _PREFIX_END]
+    if filters.created_from:
+        params.append(filters.created_from[:10])
+    if filters.created_to:
+        params.append(_next_day(filters.created_to))
+    return params
+
+
+class CountCache:
+    """TTL + LRU cache of result counts, keyed by normalized filters
+
+    Counting is the one query that has to visit every match (up to the
+    cap), so a recruiter paging through results pays for it once per TTL.
+    """
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL, max_entries: int = COUNT_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CandidateFilters, Tuple[float, CandidateCount]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CandidateFilters) -> Optional[CandidateCount]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: CandidateFilters, value: CandidateCount):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CandidateSearch:
+    """Read-only candidate queries on the shared connection pool"""
+
+    def __init__(self, pool: ConnectionPool, counts: Optional[CountCache] = None,
+                 budget_ms: Optional[float] = SEARCH_BUDGET_MS):
+        self.pool = pool
+        self.counts = counts if counts is not None else CountCache()
+        self.budget = budget_ms / 1000 if budget_ms else None
+
+    def search(self, filters: CandidateFilters, cursor: Optional[Cursor] = None,
+               limit: int = PAGE_SIZE) -> CandidatePage:
+        """One page of matching candidates, newest first
+
+        Filters that only the SCAN or TEXT walk can apply lazily (skill,
+        location, dates) are first tried on windows of recent ids: when they
+        match often, the page fills within the first window. Only when they
+        match rarely does the search fall back to the INDEX plan, whose sort
+        is then small. Everything after the first window runs against the
+        search budget; a page that runs out of it returns what it found,
+        with a cursor at the first id not yet searched.
+        """
+        filters = filters.normalized()
+        match = match_expression(filters)
+        shape = (bool(filters.skill), bool(match), bool(filters.location),
+                 bool(filters.created_from), bool(filters.created_to))
+        params = _filter_params(filters, match)
+        conn = self.pool.get_connection()
+        started = time.perf_counter()
+        deadline = started + self.budget if self.budget else None
+
+        high = cursor if cursor is not None else conn.execute(NEXT_ID_SQL).fetchone()[0]
+        plan = TEXT if match else SCAN
+        rows: List[Tuple] = []
+        stopped = False
+        if not (filters.skill or filters.location or filters.created_from or filters.created_to):
+            rows = conn.execute(search_sql(plan, *shape, False), params + [high, limit]).fetchall()
+        else:
+            try:
+                for i, window in enumerate(SCAN_WINDOWS):
+                    low = max(high - window, 0)
+                    # The first window always completes, so every page makes progress
+                    with _deadline(conn, deadline if i else None):
+                        rows += conn.execute(search_sql(plan, *shape, True),
+                                             params + [high, low, limit - len(rows)]).fetchall()
+                    high = low
+                    if len(rows) == limit or high == 0:
+                        break
+                else:
+                    plan = INDEX
+                    with _deadline(conn, deadline):
+                        rows += conn.execute(search_sql(INDEX, *shape, False),
+                                             params + [high, limit - len(rows)]).fetchall()
+            except _Interrupted:
+                stopped = True
+
+        logger.debug(f"Candidate search {filters} returned {len(rows)} rows with the {plan} plan "
+                     f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+                     f"{', out of budget' if stopped else ''}")
+        page = [dict(zip(LISTING_COLUMNS, row)) for row in rows]
+        if stopped:
+            next_cursor = high if high > 0 else None
+        else:
+            next_cursor = page[-1]["id"] if len(page) == limit else None
+        return CandidatePage(page, next_cursor)
+
+    def count(self, filters: CandidateFilters) -> CandidateCount:
+        """Number of matching candidates, stopping at COUNT_CAP
+
+        The count is tried on its own for half the search budget. If that
+        is not enough, matches are counted over windows of recent ids for
+        the rest of it and scaled up to the whole table as an estimate.
+        Counts are cached for COUNT_CACHE_TTL seconds.
+        """
+        filters = filters.normalized()
+        cached = self.counts.get(filters)
+        if cached is not None:
+            return cached
+        match = match_expression(filters)
+        shape = (bool(filters.skill), bool(match), bool(filters.location),
+                 bool(filters.created_from), bool(filters.created_to))
+        params = _filter_params(filters, match)
+        conn = self.pool.get_connection()
+        started = time.perf_counter()
+
+        try:
+            with _deadline(conn, started + self.budget / 2 if self.budget else None):
+                total = conn.execute(count_sql(*shape), params + [COUNT_CAP + 1]).fetchone()[0]
+            result = CandidateCount(min(total, COUNT_CAP), total <= COUNT_CAP)
+        except _Interrupted:
+            result = self._count_recent(conn, shape, params, started + self.budget)
+
+        logger.debug(f"Candidate count {filters} is {result} "
+                     f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+        self.counts.put(filters, result)
+        return result
+
+    def _count_recent(self, conn, shape: Tuple[bool, ...], params: List[Any],
+                      deadline: float) -> CandidateCount:
+        """Estimated count from the newest ids, counted in doubling windows until the deadline"""
+        end = high = conn.execute(NEXT_ID_SQL).fetchone()[0]
+        total, window = 0, COUNT_WINDOW
+        try:
+            while high > 0 and total <= COUNT_CAP:
+                low = max(high - window, 0)
+                with _deadline(conn, deadline):
+                    total += conn.execute(count_sql(*shape, True),
+                                          params + [high, low, COUNT_CAP + 1 - total]).fetchone()[0]
+                high, window = low, window * 2
+        except _Interrupted:
+            pass
+        if total > COUNT_CAP or high == 0:
+            return CandidateCount(min(total, COUNT_CAP), total <= COUNT_CAP)
+        if high < end:
+            total = total * end // (end - high)
+        return CandidateCount(min(total, COUNT_CAP), False)
+
+
+_candidate_search: Optional[CandidateSearch] = None
+_candidate_search_lock = threading.Lock()
+
+
+def get_candidate_search() -> CandidateSearch:
+    """Get the process-wide CandidateSearch, creating it on first use"""
+    global _candidate_search
+    if _candidate_search is None:
+        with _candidate_search_lock:
+            if _candidate_search is None:
+                _candidate_search = CandidateSearch(get_database_manager().pool)
+    return _candidate_search
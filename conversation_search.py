@@ -0,0 +1,183 @@
+"""
+TalentScout AI Hiring Assistant - Transcript Search
+Ranked full-text search over logged conversations with highlighted snippets
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from candidate_search import fts_terms
+from database import ConnectionPool, get_database_manager
+
+logger = logging.getLogger(__name__)
+
+SESSION_LIMIT = int(os.getenv("TALENTSCOUT_TRANSCRIPT_SEARCH_LIMIT", "20"))
+INDEX_BATCH_SIZE = int(os.getenv("TALENTSCOUT_TRANSCRIPT_INDEX_BATCH", "2000"))
+INDEX_INTERVAL = float(os.getenv("TALENTSCOUT_TRANSCRIPT_INDEX_INTERVAL", "5"))
+SNIPPETS_PER_SESSION = 3
+SNIPPET_TOKENS = 12
+
+# Matching messages scored per search, newest first; rarer queries are ranked exactly
+SEARCH_DEPTH = int(os.getenv("TALENTSCOUT_TRANSCRIPT_SEARCH_DEPTH", "5000"))
+
+# Markdown bold, so snippets render highlighted in the Streamlit apps
+HIGHLIGHT = ("**", "**")
+
+# Messages past the watermark are indexed in id order, a batch per
+# transaction; the watermark moves in the same transaction, so a batch is
+# never indexed twice. The insert takes the write lock, so no message can be
+# logged between the two statements.
+INDEX_PENDING_SQL = """
+    INSERT INTO conversation_fts (rowid, content)
+    SELECT id, coalesce(content, '') FROM conversations
+    WHERE id > (SELECT last_id FROM conversation_index_state) ORDER BY id LIMIT ?
+"""
+ADVANCE_WATERMARK_SQL = """
+    UPDATE conversation_index_state SET last_id = coalesce((
+        SELECT max(id) FROM (SELECT id FROM conversations WHERE id > last_id ORDER BY id LIMIT ?)
+    ), last_id)
+"""
+
+# Sessions ranked by their best matching message, with the ids of their best
+# few messages. rank is the FTS5 bm25 score, lower for better matches. Only
+# the newest SEARCH_DEPTH matches are scored, so a word found in most
+# messages costs the same as a rare one.
+RANK_SESSIONS_SQL = """
+    WITH hits AS (
+        SELECT c.session_id, c.id, conversation_fts.rank AS score
+        FROM conversation_fts JOIN conversations c ON c.id = conversation_fts.rowid
+        WHERE conversation_fts MATCH ? ORDER BY conversation_fts.rowid DESC LIMIT ?
+    ), sessions AS (
+        SELECT session_id, min(score) AS best, count(*) AS hits FROM hits
+        GROUP BY session_id ORDER BY best, session_id LIMIT ?
+    )
+    SELECT session_id, best, hits, id FROM (
+        SELECT s.session_id, s.best, s.hits, h.id,
+               row_number() OVER (PARTITION BY s.session_id ORDER BY h.score, h.id) AS n
+        FROM sessions s JOIN hits h ON h.session_id = s.session_id
+    ) WHERE n <= ? ORDER BY best, session_id, n
+"""
+
+# Snippets are only built for the messages shown, found by rowid
+SNIPPET_SQL = """
+    SELECT c.message_type, c.stage, c.timestamp, snippet(conversation_fts, 0, ?, ?, '…', ?)
+    FROM conversation_fts JOIN conversations c ON c.id = conversation_fts.rowid
+    WHERE conversation_fts MATCH ? AND conversation_fts.rowid = ?
+"""
+
+
+class Snippet(NamedTuple):
+    message_id: int
+    message_type: str
+    stage: str
+    timestamp: str
+    text: str  # matched terms wrapped in HIGHLIGHT
+
+
+class SessionHit(NamedTuple):
+    session_id: str
+    score: float  # bm25 of the best message, lower is better
+    hits: int     # matching messages in the session, among those scored
+    snippets: List[Snippet]
+
+
+class ConversationSearch:
+    """Transcript queries on the shared connection pool
+
+    Searches first index any messages logged since the last pass, so they
+    never miss a message. The index covers the stored text of each message, the first
+    CONVERSATION_CONTENT_LIMIT characters; compressed overflow is returned
+    by DatabaseManager.get_conversation but not searched.
+    """
+
+    def __init__(self, pool: ConnectionPool, batch_size: int = INDEX_BATCH_SIZE):
+        self.pool = pool
+        self.batch_size = batch_size
+
+    def index_pending(self) -> int:
+        """Index every message logged since the last call; returns how many"""
+        indexed = 0
+        while True:
+            with self.pool.transaction() as conn:
+                count = conn.execute(INDEX_PENDING_SQL, (self.batch_size,)).rowcount
+                conn.execute(ADVANCE_WATERMARK_SQL, (self.batch_size,))
+            indexed += count
+            if count < self.batch_size:
+                return indexed
+
+    def search(self, query: str, limit: int = SESSION_LIMIT,
+               snippets: int = SNIPPETS_PER_SESSION) -> List[SessionHit]:
+        """Sessions whose messages contain every word of the query, best first
+
+        Ranking covers the newest SEARCH_DEPTH matching messages.
+        """
+        match = fts_terms(query)
+        if not match:
+            return []
+        started = time.perf_counter()
+        try:
+            self.index_pending()
+        except sqlite3.Error as e:
+            # Still answer from what is indexed; the indexer retries later
+            logger.warning(f"Could not index recent messages before searching: {e}")
+        conn = self.pool.get_connection()
+        hits: Dict[str, SessionHit] = {}
+        ranked = conn.execute(RANK_SESSIONS_SQL, (match, SEARCH_DEPTH, limit, snippets)).fetchall()
+        for session_id, score, count, message_id in ranked:
+            hit = hits.get(session_id)
+            if hit is None:
+                hit = hits[session_id] = SessionHit(session_id, score, count, [])
+            row = conn.execute(SNIPPET_SQL, (*HIGHLIGHT, SNIPPET_TOKENS, match, message_id)).fetchone()
+            if row is not None:
+                hit.snippets.append(Snippet(message_id, *row))
+
+        logger.debug(f"Transcript search {query!r} matched {len(hits)} sessions "
+                     f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+        return list(hits.values())
+
+
+class ConversationIndexer:
+    """Background thread that keeps the transcript index caught up"""
+
+    def __init__(self, search: ConversationSearch, interval: float = INDEX_INTERVAL):
+        self.search = search
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="conversation-indexer", daemon=True)
+
+    def start(self) -> "ConversationIndexer":
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float = 10.0):
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                indexed = self.search.index_pending()
+                if indexed:
+                    logger.debug(f"Indexed {indexed} conversation messages")
+            except Exception as e:
+                logger.error(f"Error indexing conversation messages: {e}")
+
+
+_conversation_search: Optional[ConversationSearch] = None
+_conversation_search_lock = threading.Lock()
+
+
+def get_conversation_search() -> ConversationSearch:
+    """Get the process-wide ConversationSearch, creating it on first use"""
+    global _conversation_search
+    if _conversation_search is None:
+        with _conversation_search_lock:
+            if _conversation_search is None:
+                _conversation_search = ConversationSearch(get_database_manager().pool)
+                if INDEX_INTERVAL > 0:
+                    ConversationIndexer(_conversation_search).start()
+    return _conversation_search
@@ -0,0 +1,372 @@
+"""
+TalentScout AI Hiring Assistant - Database Layer
+Pooled, WAL-mode SQLite connections shared by every HiringAssistant
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from db_writer import WriteBehindWriter, execute_op, register_shutdown
+from migrations import INSERT_SKILL_SQL, UPSERT_ANSWER_SQL, migrate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv("TALENTSCOUT_DB_PATH", "candidates.db")
+BUSY_TIMEOUT_MS = int(os.getenv("TALENTSCOUT_DB_BUSY_TIMEOUT_MS", "5000"))
+WRITE_BEHIND = os.getenv("TALENTSCOUT_WRITE_BEHIND", "1") == "1"
+
+# Characters of each logged message stored (and searchable) as plain text;
+# anything past this is kept zlib-compressed in content_overflow
+CONVERSATION_CONTENT_LIMIT = int(os.getenv("TALENTSCOUT_CONVERSATION_CONTENT_LIMIT", "500"))
+
+# Statement SQL is kept in module constants so every call hands sqlite3 the
+# exact same string and hits the per-connection prepared statement cache.
+CANDIDATE_PROFILE_COLUMNS = (
+    "full_name", "email", "phone", "experience_years", "desired_position", "location"
+)
+
+DELETE_SKILL_SQL = "DELETE FROM candidate_skills WHERE session_id = ? AND skill_key = ?"
+
+SELECT_SESSIONS_BY_SKILL_SQL = """
+    SELECT session_id FROM candidate_skills WHERE skill_key = ? ORDER BY session_id
+"""
+
+SELECT_SKILLS_SQL = "SELECT skill FROM candidate_skills WHERE session_id = ? ORDER BY skill_key"
+
+SELECT_ANSWERS_SQL = """
+    SELECT question_no, question, answer, answered_at
+    FROM candidate_answers WHERE session_id = ? ORDER BY question_no
+"""
+
+LOG_CONVERSATION_SQL = """
+    INSERT INTO conversations
+    (session_id, message_type, content, content_overflow, timestamp, stage)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_CONVERSATION_SQL = """
+    SELECT message_type, content, content_overflow, timestamp, stage
+    FROM conversations WHERE session_id = ? ORDER BY timestamp, id
+"""
+
+
+# Stamped once, when the interview first reaches its conclusion; updated_at
+# moves too, so incremental exports of every candidate pick the change up
+MARK_COMPLETED_SQL = """
+    UPDATE candidates SET completed_at = coalesce(completed_at, ?), updated_at = ? WHERE session_id = ?
+"""
+
+UPSERT_SESSION_SNAPSHOT_SQL = """
+    INSERT OR REPLACE INTO session_snapshots (session_id, state, updated_at) VALUES (?, ?, ?)
+"""
+
+SELECT_SESSION_SNAPSHOT_SQL = "SELECT state FROM session_snapshots WHERE session_id = ?"
+
+DELETE_SESSION_SNAPSHOT_SQL = "DELETE FROM session_snapshots WHERE session_id = ?"
+
+
+# A 4 KB window and small memLevel: chat overflow is short, and setting up
+# the default 32 KB deflate state costs more than compressing it
+OVERFLOW_WBITS = 12
+OVERFLOW_MEM_LEVEL = 4
+
+
+def split_content(content: str, limit: int = CONVERSATION_CONTENT_LIMIT) -> Tuple[str, Optional[bytes]]:
+    """Stored text and compressed overflow for a message"""
+    if len(content) <= limit:
+        return content, None
+    compressor = zlib.compressobj(6, zlib.DEFLATED, OVERFLOW_WBITS, OVERFLOW_MEM_LEVEL)
+    overflow = compressor.compress(content[limit:].encode("utf-8")) + compressor.flush()
+    return content[:limit], overflow
+
+
+def join_content(content: Optional[str], overflow: Optional[bytes]) -> str:
+    """The full message from its stored text and overflow"""
+    if not overflow:
+        return content or ""
+    return (content or "") + zlib.decompress(overflow).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def save_candidate_sql(columns: Tuple[str, ...]) -> str:
+    """Upsert that inserts a full row but only updates the given columns
+
+    Built once per column set, so each variant keeps a stable SQL string for
+    the statement cache; untouched columns (and their indexes) are left alone.
+    """
+    unknown = set(columns) - set(CANDIDATE_PROFILE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown candidate columns: {sorted(unknown)}")
+    updates = "".join(f"{column} = excluded.{column}, " for column in columns)
+    return f"""
+    INSERT INTO candidates
+    (session_id, {", ".join(CANDIDATE_PROFILE_COLUMNS)}, created_at, updated_at)
+    VALUES (?, {"?, " * len(CANDIDATE_PROFILE_COLUMNS)}?, ?)
+    ON CONFLICT (session_id) DO UPDATE SET {updates}updated_at = excluded.updated_at
+"""
+
+
+class ConnectionPool:
+    """Thread-affine SQLite connections with tuned pragmas"""
+
+    PRAGMAS = (
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("busy_timeout", BUSY_TIMEOUT_MS),
+        ("temp_store", "MEMORY"),
+        ("cache_size", -8000),
+    )
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, cached_statements: int = 128):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection and apply the pool pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=self.cached_statements,
+            # Connections stay affine to their owning thread; this only lets
+            # the pool close connections left behind by finished threads.
+            check_same_thread=False,
+        )
+        for name, value in self.PRAGMAS:
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def _prune_dead_threads(self):
+        """Close connections whose owning thread has exited"""
+        for thread in [t for t in self._connections if not t.is_alive()]:
+            try:
+                self._connections.pop(thread).close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing pooled connection: {e}")
+
+    def get_connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            with self._lock:
+                self._prune_dead_threads()
+                self._connections[threading.current_thread()] = conn
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in a single transaction on the thread's connection"""
+        conn = self.get_connection()
+        with conn:
+            yield conn
+
+    def close_all(self):
+        """Close every pooled connection"""
+        with self._lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    logger.warning(f"Error closing pooled connection: {e}")
+            self._connections.clear()
+        self._local = threading.local()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections"""
+        return len(self._connections)
+
+
+class DatabaseManager:
+    """Handles database operations for Streamlit Cloud"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, pool: Optional[ConnectionPool] = None,
+                 write_behind: bool = WRITE_BEHIND):
+        self.db_path = db_path
+        self.pool = pool or ConnectionPool(db_path)
+        self.init_database()
+        self.writer = WriteBehindWriter(self.pool) if write_behind else None
+        self._candidate_saves = {"written": 0, "skipped": 0}
+
+    def init_database(self):
+        """Initialize SQLite database, applying any pending schema migrations"""
+        try:
+            version = migrate(self.pool.get_connection())
+            logger.info(f"Database initialized successfully at schema version {version}")
+        except Exception as e:
+            logger.error(f"Database initialization error: {e}")
+
+    def _write(self, sql, params: tuple, coalesce_key=None):
+        """Hand a write to the write-behind queue, or run it inline
+
+        ``sql`` may be a tuple of statements with ``params`` holding each
+        one's parameters; they are committed in one transaction either way.
+        """
+        if self.writer is not None:
+            self.writer.submit(sql, params, coalesce_key)
+            return
+        with self.pool.transaction() as conn:
+            execute_op(conn, (sql, params, coalesce_key))
+
+    def save_candidate(self, candidate):
+        """Save the candidate's changed profile fields, skipping the write if none changed"""
+        dirty = getattr(candidate, "dirty_fields", None)
+        columns = tuple(c for c in CANDIDATE_PROFILE_COLUMNS if dirty is None or c in dirty)
+        if not columns:
+            self._candidate_saves["skipped"] += 1
+            return
+        try:
+            self._write(save_candidate_sql(columns), (
+                candidate.session_id,
+                *(getattr(candidate, column) for column in CANDIDATE_PROFILE_COLUMNS),
+                candidate.created_at,
+                datetime.now().isoformat()
+            ), coalesce_key=("candidate", candidate.session_id, columns))
+            if dirty is not None:
+                candidate.mark_clean()
+            self._candidate_saves["written"] += 1
+            logger.debug(f"Candidate fields {columns} queued for session: {candidate.session_id}")
+        except Exception as e:
+            logger.error(f"Error saving candidate data: {e}")
+
+    def mark_completed(self, session_id: str):
+        """Record that a candidate's interview reached its conclusion"""
+        try:
+            now = datetime.now().isoformat()
+            self._write(MARK_COMPLETED_SQL, (now, now, session_id))
+        except Exception as e:
+            logger.error(f"Error marking interview completed: {e}")
+
+    def save_skills(self, session_id: str, tech_stack: List[str], previous: Sequence[str] = ()):
+        """Bring a candidate's skill rows from ``previous`` to ``tech_stack``
+
+        Only the skills added or removed are written, all in one transaction.
+        """
+        new = {skill.lower(): skill for skill in tech_stack}
+        old = {skill.lower() for skill in previous}
+        statements = [(DELETE_SKILL_SQL, (session_id, key)) for key in sorted(old - new.keys())]
+        statements += [(INSERT_SKILL_SQL, (session_id, key, skill))
+                       for key, skill in new.items() if key not in old]
+        if not statements:
+            return
+        try:
+            sql, params = zip(*statements)
+            self._write(sql, params)
+        except Exception as e:
+            logger.error(f"Error saving candidate skills: {e}")
+
+    def save_answer(self, session_id: str, question_no: int, question: str, answer: str,
+                    answered_at: str):
+        """Upsert one technical answer"""
+        try:
+            self._write(UPSERT_ANSWER_SQL, (session_id, question_no, question, answer, answered_at),
+                        coalesce_key=("answer", session_id, question_no))
+        except Exception as e:
+            logger.error(f"Error saving technical answer: {e}")
+
+    def find_sessions_with_skill(self, skill: str) -> List[str]:
+        """Session ids of candidates who listed a skill, via the skill index"""
+        rows = self.pool.get_connection().execute(SELECT_SESSIONS_BY_SKILL_SQL, (skill.lower(),))
+        return [row[0] for row in rows]
+
+    def get_skills(self, session_id: str) -> List[str]:
+        """A candidate's skills"""
+        rows = self.pool.get_connection().execute(SELECT_SKILLS_SQL, (session_id,))
+        return [row[0] for row in rows]
+
+    def get_answers(self, session_id: str) -> List[Dict[str, Any]]:
+        """A candidate's technical answers in question order"""
+        rows = self.pool.get_connection().execute(SELECT_ANSWERS_SQL, (session_id,))
+        return [dict(zip(("question_no", "question", "answer", "answered_at"), row)) for row in rows]
+
+    def save_session_snapshot(self, session_id: str, state: Dict[str, Any]):
+        """Queue a serialized session, replacing any earlier snapshot
+
+        Snapshots queued for the same session within one batch coalesce to
+        the latest.
+        """
+        self._write(UPSERT_SESSION_SNAPSHOT_SQL,
+                    (session_id, json.dumps(state, separators=(",", ":")), datetime.now().isoformat()),
+                    coalesce_key=("session_snapshot", session_id))
+
+    def load_session_snapshot(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """A session's last snapshot, or None if it has none
+
+        Queued writes are flushed first, so a snapshot saved by this process
+        is always seen.
+        """
+        self.flush()
+        row = self.pool.get_connection().execute(SELECT_SESSION_SNAPSHOT_SQL, (session_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete_session_snapshot(self, session_id: str):
+        """Forget a session's snapshot"""
+        self._write(DELETE_SESSION_SNAPSHOT_SQL, (session_id,))
+
+    def log_conversation(self, session_id: str, message_type: str, content: str, stage: str = ""):
+        """Log conversation messages"""
+        try:
+            self._write(LOG_CONVERSATION_SQL, (
+                session_id,
+                message_type,
+                *split_content(content),
+                datetime.now().isoformat(),
+                stage
+            ))
+        except Exception as e:
+            logger.error(f"Error logging conversation: {e}")
+
+    def get_conversation(self, session_id: str) -> List[Dict[str, Any]]:
+        """A session's logged messages in order, with their full text"""
+        rows = self.pool.get_connection().execute(SELECT_CONVERSATION_SQL, (session_id,))
+        return [
+            {"message_type": message_type, "content": join_content(content, overflow),
+             "timestamp": timestamp, "stage": stage}
+            for message_type, content, overflow, timestamp, stage in rows
+        ]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes to be committed"""
+        if self.writer is None:
+            return True
+        return self.writer.flush(timeout)
+
+    def close(self):
+        """Drain queued writes and close pooled connections"""
+        if self.writer is not None:
+            self.writer.close()
+        self.pool.close_all()
+
+    def get_write_stats(self) -> Dict[str, float]:
+        """Queue depth and flush latency counters, plus candidate saves written and skipped"""
+        stats = self.writer.get_stats() if self.writer is not None else {}
+        stats.update({f"candidate_saves_{k}": v for k, v in self._candidate_saves.items()})
+        return stats
+
+
+_db_manager: Optional[DatabaseManager] = None
+_db_manager_lock = threading.Lock()
+
+
+def get_database_manager() -> DatabaseManager:
+    """Get the process-wide DatabaseManager, creating it on first use"""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()
+                if _db_manager.writer is not None:
+                    register_shutdown(_db_manager.writer)
+    return _db_manager
@@ -0,0 +1,330 @@
+"""
+TalentScout AI Hiring Assistant - Write-Behind Queue
+Background writer that batches conversation logs and candidate upserts
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BACKPRESSURE_BLOCK = "block"
+BACKPRESSURE_DROP = "drop"
+
+WRITE_QUEUE_SIZE = int(os.getenv("TALENTSCOUT_WRITE_QUEUE_SIZE", "10000"))
+WRITE_BATCH_SIZE = int(os.getenv("TALENTSCOUT_WRITE_BATCH_SIZE", "200"))
+WRITE_FLUSH_INTERVAL = float(os.getenv("TALENTSCOUT_WRITE_FLUSH_INTERVAL", "0.05"))
+WRITE_BACKPRESSURE = os.getenv("TALENTSCOUT_WRITE_BACKPRESSURE", BACKPRESSURE_BLOCK)
+
+# A failed batch is retried this many times, backing off from
+# WRITE_RETRY_BACKOFF seconds, before its ops are written one at a time
+WRITE_RETRIES = int(os.getenv("TALENTSCOUT_WRITE_RETRIES", "3"))
+WRITE_RETRY_BACKOFF = float(os.getenv("TALENTSCOUT_WRITE_RETRY_BACKOFF", "0.1"))
+
+# (sql, params, coalesce_key) - ops sharing a coalesce key within one batch
+# are collapsed to the most recent one, e.g. repeated upserts of a candidate.
+# A compound op has a tuple of statements as its sql and a tuple of their
+# params; its statements always commit together.
+WriteOp = Tuple[Union[str, Tuple[str, ...]], Sequence, Optional[Hashable]]
+
+_STOP = object()
+
+
+def execute_op(conn: sqlite3.Connection, op: WriteOp):
+    """Run one op on a connection inside the caller's transaction"""
+    sql, params, _ = op
+    if isinstance(sql, tuple):
+        for statement, statement_params in zip(sql, params):
+            conn.execute(statement, statement_params)
+    else:
+        conn.execute(sql, params)
+
+
+class WriteBehindWriter:
+    """Bounded queue drained by a background thread in batched transactions
+
+    Backpressure policies when the queue is full:
+    - ``block``: wait for room, logging an error every ``put_timeout``
+      seconds spent waiting. Ops are never written ahead of ones already
+      queued, so writes always commit in submit order.
+    - ``drop``: discard the op and count it in ``dropped``.
+    """
+
+    def __init__(self, pool, max_queue: int = WRITE_QUEUE_SIZE,
+                 batch_size: int = WRITE_BATCH_SIZE,
+                 flush_interval: float = WRITE_FLUSH_INTERVAL,
+                 backpressure: str = WRITE_BACKPRESSURE,
+                 put_timeout: float = 1.0):
+        if backpressure not in (BACKPRESSURE_BLOCK, BACKPRESSURE_DROP):
+            raise ValueError(f"Unknown backpressure policy: {backpressure}")
+        self.pool = pool
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backpressure = backpressure
+        self.put_timeout = put_timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._stats_lock = threading.Lock()
+        # Serializes synchronous writes after the writer thread has stopped
+        self._sync_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "coalesced": 0,
+            "dropped": 0,
+            "sync_writes": 0,
+            "full_waits": 0,
+            "retries": 0,
+            "errors": 0,
+            "flushes": 0,
+            "max_queue_depth": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+        self._behind = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="talentscout-db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: Sequence, coalesce_key: Optional[Hashable] = None) -> bool:
+        """Queue a write; returns False if it was dropped"""
+        op = (sql, tuple(params), coalesce_key)
+        if self._closed or not self._thread.is_alive():
+            self._write_sync(op)
+            return True
+
+        if self.backpressure == BACKPRESSURE_DROP:
+            try:
+                self._queue.put_nowait(op)
+            except queue.Full:
+                self._bump("dropped")
+                logger.warning("Write queue full, dropping write")
+                return False
+        else:
+            while True:
+                try:
+                    self._queue.put(op, timeout=self.put_timeout)
+                    break
+                except queue.Full:
+                    if not self._thread.is_alive():
+                        self._write_sync(op)
+                        return True
+                    self._bump("full_waits")
+                    logger.error(f"Write queue full for {self.put_timeout}s, still waiting to queue write")
+
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._stats["enqueued"] += 1
+            if depth > self._stats["max_queue_depth"]:
+                self._stats["max_queue_depth"] = depth
+        self._check_high_water(depth)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until every op queued before this call is committed
+
+        Returns False on timeout, or if the writer thread has died.
+        """
+        if self._closed:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not done.wait(0.5 if deadline is None else min(0.5, max(0.0, deadline - time.monotonic()))):
+            if not self._thread.is_alive():
+                logger.error("Write-behind writer thread is not running, flush cannot complete")
+                return False
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return True
+
+    def close(self, timeout: float = 10.0):
+        """Drain the queue and stop the writer thread"""
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._closed = True
+        if self._thread.is_alive():
+            logger.error("Write-behind writer did not drain before shutdown")
+        else:
+            logger.info(f"Write-behind writer drained: {self.get_stats()}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """Snapshot of queue depth and flush latency counters"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        stats["avg_flush_ms"] = stats["total_flush_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        return stats
+
+    def _bump(self, counter: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[counter] += amount
+
+    def _check_high_water(self, depth: int):
+        """Log once when the writer falls behind and once when it catches up"""
+        if not self._behind and depth >= self.max_queue * 0.8:
+            self._behind = True
+            logger.warning(f"Write-behind writer falling behind: queue depth {depth}/{self.max_queue}")
+        elif self._behind and depth <= self.max_queue * 0.5:
+            self._behind = False
+            logger.info(f"Write-behind writer caught up: queue depth {depth}/{self.max_queue}")
+
+    def _run(self):
+        """Writer thread: collect ops into batches and commit them"""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            batch: List[WriteOp] = []
+            waiters: List[threading.Event] = []
+            deadline = time.monotonic() + self.flush_interval
+
+            while True:
+                if item is _STOP:
+                    stopping = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+
+                if stopping or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if stopping:
+                # Drain whatever is left so shutdown never loses queued rows
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(item, threading.Event):
+                        waiters.append(item)
+                    elif item is not _STOP:
+                        batch.append(item)
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception as e:
+                # Keep the thread alive; the batch's ops are counted as lost
+                logger.error(f"Unexpected error writing batch of {len(batch)} ops: {e}")
+                self._bump("errors", len(batch))
+            finally:
+                for waiter in waiters:
+                    waiter.set()
+
+    def _commit(self, ops: List[WriteOp]):
+        """Run ops in one transaction, grouping consecutive identical statements"""
+        with self.pool.transaction() as conn:
+            group_sql, group_params = None, []
+            for op in ops:
+                sql, params, _ = op
+                if sql != group_sql and group_params:
+                    conn.executemany(group_sql, group_params)
+                    group_params = []
+                if isinstance(sql, tuple):
+                    group_sql = None
+                    execute_op(conn, op)
+                    continue
+                group_sql = sql
+                group_params.append(params)
+            if group_params:
+                conn.executemany(group_sql, group_params)
+
+    def _write_batch(self, batch: List[WriteOp]):
+        """Commit one batch, retrying with backoff, then op by op
+
+        Dropping a batch would lose writes the callers consider done (saved
+        candidates are already marked clean), so a batch that keeps failing,
+        e.g. on SQLITE_BUSY, is split up and only the ops that fail on their
+        own are lost.
+        """
+        ops = self._coalesce(batch)
+        started = time.perf_counter()
+        for attempt in range(WRITE_RETRIES + 1):
+            try:
+                self._commit(ops)
+                break
+            except sqlite3.Error as e:
+                # Only lock contention is worth waiting out
+                if attempt == WRITE_RETRIES or not isinstance(e, sqlite3.OperationalError):
+                    logger.error(f"Error writing batch of {len(ops)} ops, writing them one at a time: {e}")
+                    self._write_one_by_one(ops)
+                    return
+                logger.warning(f"Error writing batch of {len(ops)} ops, retrying: {e}")
+                self._bump("retries")
+                time.sleep(WRITE_RETRY_BACKOFF * 2 ** attempt)
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._stats_lock:
+            self._stats["written"] += len(ops)
+            self._stats["coalesced"] += len(batch) - len(ops)
+            self._stats["flushes"] += 1
+            self._stats["last_flush_ms"] = elapsed_ms
+            self._stats["total_flush_ms"] += elapsed_ms
+            if elapsed_ms > self._stats["max_flush_ms"]:
+                self._stats["max_flush_ms"] = elapsed_ms
+
+    def _write_one_by_one(self, ops: List[WriteOp]):
+        """Commit each op on its own, so one bad op does not lose the rest"""
+        written = 0
+        for op in ops:
+            try:
+                with self.pool.transaction() as conn:
+                    execute_op(conn, op)
+                written += 1
+            except sqlite3.Error as e:
+                logger.error(f"Error writing op: {e}")
+                self._bump("errors")
+        self._bump("written", written)
+
+    @staticmethod
+    def _coalesce(batch: List[WriteOp]) -> List[WriteOp]:
+        """Keep only the last op for each coalesce key, preserving order"""
+        last_index = {op[2]: i for i, op in enumerate(batch) if op[2] is not None}
+        if not last_index:
+            return batch
+        return [op for i, op in enumerate(batch) if op[2] is None or last_index[op[2]] == i]
+
+    def _write_sync(self, op: WriteOp):
+        """Write an op on the caller's own connection once the writer is gone
+
+        Anything still queued is written first, so the op never lands ahead
+        of earlier writes.
+        """
+        with self._sync_lock:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is not _STOP:
+                    self._write_one_by_one([item])
+            try:
+                with self.pool.transaction() as conn:
+                    execute_op(conn, op)
+                self._bump("sync_writes")
+            except sqlite3.Error as e:
+                logger.error(f"Error writing op synchronously: {e}")
+                self._bump("errors")
+
+
+def register_shutdown(writer: WriteBehindWriter):
+    """Drain the writer when the interpreter exits"""
+    atexit.register(writer.close)
@@ -0,0 +1,338 @@
+"""
+TalentScout AI Hiring Assistant - Bulk Export
+Streaming, chunked exports of candidates and conversations to JSONL, CSV and Parquet
+
+Run nightly with a state file so each run picks up where the last one stopped:
+
+    python export.py candidates exports/candidates.jsonl.gz --gzip --completed --state exports/state.json
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from database import CANDIDATE_PROFILE_COLUMNS, DEFAULT_DB_PATH, ConnectionPool, join_content
+from migrations import migrate
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # Parquet output is optional
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = int(os.getenv("TALENTSCOUT_EXPORT_CHUNK_SIZE", "1000"))
+
+# Timestamp watermarks stop this far behind the clock: rows are stamped
+# when their write is queued, so a newer stamp can be committed before an
+# older one still in a write-behind queue
+SETTLE_SECONDS = float(os.getenv("TALENTSCOUT_EXPORT_SETTLE_SECONDS", "60"))
+FORMATS = ("jsonl", "csv", "parquet")
+
+CANDIDATE_COLUMNS = (
+    ("id", "session_id") + CANDIDATE_PROFILE_COLUMNS + ("created_at", "updated_at", "completed_at")
+)
+CANDIDATE_FIELDS = CANDIDATE_COLUMNS + ("skills", "answers")
+ANSWER_FIELDS = ("question_no", "question", "answer", "answered_at")
+CONVERSATION_FIELDS = ("id", "session_id", "message_type", "content", "timestamp", "stage")
+
+# Candidates change in place, so incremental exports follow updated_at, or
+# completed_at for finished interviews only: a candidate who finishes after
+# a run is picked up by the next one even if no profile field changed
+SELECT_CANDIDATES_SQL = f"""
+    SELECT {", ".join(f"c.{column}" for column in CANDIDATE_COLUMNS)}
+    FROM candidates c WHERE c.{{watermark}} > ? AND c.{{watermark}} <= ?
+    ORDER BY c.{{watermark}}, c.id
+"""
+
+MESSAGE_COLUMNS = "m.id, m.session_id, m.message_type, m.content, m.content_overflow, m.timestamp, m.stage"
+
+# Messages are only ever appended, so incremental exports follow the id
+SELECT_CONVERSATIONS_SQL = f"""
+    SELECT {MESSAGE_COLUMNS}, m.id FROM conversations m WHERE m.id > ? ORDER BY m.id
+"""
+
+# Finished interviews whole, in the order they finished
+SELECT_COMPLETED_CONVERSATIONS_SQL = f"""
+    SELECT {MESSAGE_COLUMNS}, c.completed_at
+    FROM candidates c JOIN conversations m ON m.session_id = c.session_id
+    WHERE c.completed_at > ? AND c.completed_at <= ?
+    ORDER BY c.completed_at, c.id, m.id
+"""
+
+# Skills and answers for one chunk of candidates, fetched in one query each
+SELECT_CHUNK_SKILLS_SQL = """
+    SELECT session_id, skill FROM candidate_skills
+    WHERE session_id IN (SELECT value FROM json_each(?)) ORDER BY session_id, skill_key
+"""
+SELECT_CHUNK_ANSWERS_SQL = f"""
+    SELECT session_id, {", ".join(ANSWER_FIELDS)} FROM candidate_answers
+    WHERE session_id IN (SELECT value FROM json_each(?)) ORDER BY session_id, question_no
+"""
+
+
+class ExportResult(NamedTuple):
+    rows: int
+    # updated_at or completed_at (candidates), id or completed_at
+    # (conversations) of the last row written; pass it back as ``since`` to
+    # export only what changed after this run
+    watermark: Any
+    path: Path
+    seconds: float
+
+
+def _chunks(cursor: sqlite3.Cursor, size: int) -> Iterator[List[tuple]]:
+    """Rows from one statement, ``size`` at a time
+
+    The statement stays open on a single read snapshot while rows are
+    pulled, so memory holds one chunk no matter how large the table is.
+    """
+    while True:
+        rows = cursor.fetchmany(size)
+        if not rows:
+            return
+        yield rows
+
+
+# A chunk of records and the watermark of its last row
+Chunk = Tuple[List[Dict[str, Any]], Any]
+
+
+def settled_until(settle_seconds: float = SETTLE_SECONDS) -> str:
+    """Newest timestamp an export can safely move its watermark to"""
+    return (datetime.now() - timedelta(seconds=settle_seconds)).isoformat()
+
+
+def candidate_records(conn: sqlite3.Connection, since: str = "", completed: bool = False,
+                      chunk_size: int = CHUNK_SIZE, until: Optional[str] = None) -> Iterator[Chunk]:
+    """Chunks of candidate records with their skills and answers
+
+    Candidates changed after ``since`` (updated_at, or completed_at when
+    ``completed``) and no later than ``until``.
+    """
+    watermark = "completed_at" if completed else "updated_at"
+    sql = SELECT_CANDIDATES_SQL.format(watermark=watermark)
+    until = settled_until() if until is None else until
+    for rows in _chunks(conn.execute(sql, (since or "", until)), chunk_size):
+        records = [dict(zip(CANDIDATE_COLUMNS, row), skills=[], answers=[]) for row in rows]
+        by_session = {record["session_id"]: record for record in records}
+        session_ids = json.dumps(list(by_session))
+        for session_id, skill in conn.execute(SELECT_CHUNK_SKILLS_SQL, (session_ids,)):
+            by_session[session_id]["skills"].append(skill)
+        for session_id, *answer in conn.execute(SELECT_CHUNK_ANSWERS_SQL, (session_ids,)):
+            by_session[session_id]["answers"].append(dict(zip(ANSWER_FIELDS, answer)))
+        yield records, records[-1][watermark]
+
+
+def conversation_records(conn: sqlite3.Connection, since: Any = 0, completed: bool = False,
+                         chunk_size: int = CHUNK_SIZE, until: Optional[str] = None) -> Iterator[Chunk]:
+    """Chunks of logged messages with their full, decompressed text
+
+    Messages after id ``since``, or with ``completed`` every message of the
+    interviews finished after ``since`` (a completed_at) and no later than
+    ``until``. Messages logged after an interview finished, such as the
+    candidate's closing reply, are only in the plain export.
+    """
+    if completed:
+        until = settled_until() if until is None else until
+        cursor = conn.execute(SELECT_COMPLETED_CONVERSATIONS_SQL, (since or "", until))
+    else:
+        cursor = conn.execute(SELECT_CONVERSATIONS_SQL, (since or 0,))
+    for rows in _chunks(cursor, chunk_size):
+        yield [
+            {"id": id_, "session_id": session_id, "message_type": message_type,
+             "content": join_content(content, overflow), "timestamp": timestamp, "stage": stage}
+            for id_, session_id, message_type, content, overflow, timestamp, stage, _ in rows
+        ], rows[-1][-1]
+
+
+class _TextWriter:
+    """Line-oriented output, optionally gzip-compressed"""
+
+    def __init__(self, path: Path, fields: Sequence[str], compress: bool):
+        self.fields = fields
+        if compress:
+            self.file = gzip.open(path, "wt", encoding="utf-8", newline="")
+        else:
+            self.file = open(path, "w", encoding="utf-8", newline="")
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlWriter(_TextWriter):
+    def write(self, records: List[Dict[str, Any]]):
+        self.file.writelines(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                             for record in records)
+
+
+class CsvWriter(_TextWriter):
+    """One row per record; list and dict fields are written as JSON"""
+
+    def __init__(self, path: Path, fields: Sequence[str], compress: bool):
+        super().__init__(path, fields, compress)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(fields)
+
+    def write(self, records: List[Dict[str, Any]]):
+        self.writer.writerows(
+            [json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+             for value in (record[field] for field in self.fields)]
+            for record in records
+        )
+
+
+_PARQUET_TYPES: Dict[str, Any] = {}
+if pyarrow is not None:
+    _PARQUET_TYPES = {
+        "id": pyarrow.int64(),
+        "skills": pyarrow.list_(pyarrow.string()),
+        "answers": pyarrow.list_(pyarrow.struct([
+            ("question_no", pyarrow.int64()), ("question", pyarrow.string()),
+            ("answer", pyarrow.string()), ("answered_at", pyarrow.string()),
+        ])),
+    }
+
+
+class ParquetWriter:
+    """One row group per chunk; gzip selects the Parquet gzip codec"""
+
+    def __init__(self, path: Path, fields: Sequence[str], compress: bool):
+        if pyarrow is None:
+            raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+        self.fields = fields
+        self.schema = pyarrow.schema([(field, _PARQUET_TYPES.get(field, pyarrow.string())) for field in fields])
+        self.writer = pyarrow.parquet.ParquetWriter(str(path), self.schema,
+                                                    compression="gzip" if compress else "snappy")
+
+    def write(self, records: List[Dict[str, Any]]):
+        columns = {field: [record[field] for record in records] for field in self.fields}
+        self.writer.write_table(pyarrow.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS: Dict[str, Callable] = {"jsonl": JsonlWriter, "csv": CsvWriter, "parquet": ParquetWriter}
+
+
+def _export(chunks: Iterator[Chunk], path: Path, fmt: str, fields: Sequence[str],
+            compress: bool, since: Any) -> ExportResult:
+    """Write chunks to a temporary file and move it into place when complete
+
+    A failed or interrupted export never leaves a partial file at ``path``.
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {', '.join(FORMATS)}")
+    started = time.perf_counter()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".part")
+    writer = WRITERS[fmt](partial, fields, compress)
+    rows, watermark = 0, since
+    try:
+        for records, watermark in chunks:
+            writer.write(records)
+            rows += len(records)
+    except BaseException:
+        writer.close()
+        partial.unlink()
+        raise
+    writer.close()
+    os.replace(partial, path)
+    return ExportResult(rows, watermark, path, time.perf_counter() - started)
+
+
+def export_candidates(conn: sqlite3.Connection, path: Path, fmt: str = "jsonl", since: str = "",
+                      completed: bool = False, compress: bool = False,
+                      chunk_size: int = CHUNK_SIZE, until: Optional[str] = None) -> ExportResult:
+    """Export candidates updated (or finished, when ``completed``) after ``since``, an ISO timestamp"""
+    chunks = candidate_records(conn, since, completed, chunk_size, until)
+    return _export(chunks, path, fmt, CANDIDATE_FIELDS, compress, since)
+
+
+def export_conversations(conn: sqlite3.Connection, path: Path, fmt: str = "jsonl", since: Any = 0,
+                         completed: bool = False, compress: bool = False,
+                         chunk_size: int = CHUNK_SIZE, until: Optional[str] = None) -> ExportResult:
+    """Export messages logged after message id ``since``, or whole interviews finished after it"""
+    chunks = conversation_records(conn, since, completed, chunk_size, until)
+    return _export(chunks, path, fmt, CONVERSATION_FIELDS, compress, since)
+
+
+def state_key(table: str, completed: bool) -> str:
+    """Completed-only exports keep their own watermark, a completed_at"""
+    return f"{table}_completed" if completed else table
+
+
+EXPORTS = {"candidates": export_candidates, "conversations": export_conversations}
+
+
+def load_state(path: Optional[Path]) -> Dict[str, Any]:
+    """Watermarks from the last run, per table"""
+    if path is None or not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(path: Path, state: Dict[str, Any]):
+    partial = path.with_name(path.name + ".part")
+    with open(partial, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(partial, path)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("table", choices=sorted(EXPORTS))
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the output file extension")
+    parser.add_argument("--gzip", action="store_true",
+                        help="compress JSONL/CSV with gzip (implied by a .gz output), Parquet with its gzip codec")
+    parser.add_argument("--completed", action="store_true", help="only sessions that reached the conclusion")
+    parser.add_argument("--since", help="updated_at (candidates), message id (conversations) "
+                                         "or with --completed completed_at to export after")
+    parser.add_argument("--state", type=Path, help="JSON file holding each table's watermark between runs")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    fmt = args.format or next((f for f in FORMATS if f".{f}" in args.output.suffixes), "jsonl")
+    state = load_state(args.state)
+    key = state_key(args.table, args.completed)
+    since = args.since if args.since is not None else state.get(key)
+    since = int(since or 0) if args.table == "conversations" and not args.completed else since or ""
+    compress = args.gzip or args.output.suffix == ".gz"
+
+    pool = ConnectionPool(args.db)
+    try:
+        migrate(pool.get_connection())
+        result = EXPORTS[args.table](pool.get_connection(), args.output, fmt, since,
+                                     args.completed, compress, args.chunk_size)
+    except (sqlite3.Error, OSError, RuntimeError) as e:
+        logger.error(f"Export of {args.table} failed: {e}")
+        return 1
+    finally:
+        pool.close_all()
+
+    if args.state is not None:
+        state[key] = result.watermark
+        save_state(args.state, state)
+    logger.info(f"Exported {result.rows} {args.table} rows to {result.path} in {result.seconds:.1f} s "
+                f"(watermark {result.watermark!r})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+TalentScout AI Hiring Assistant - Interview Flows
+Per-requisition stage sequences compiled from data/flows.json
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Collection, Dict, Mapping, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLOWS_PATH = Path(os.getenv(
+    "TALENTSCOUT_FLOWS_PATH",
+    Path(__file__).resolve().parent / "data" / "flows.json"
+))
+
+FIRST_STAGE = "greeting"
+LAST_STAGE = "conclusion"
+
+
+class FlowError(ValueError):
+    """A flow definition that cannot be compiled"""
+
+
+class Flow(NamedTuple):
+    """A compiled flow: its ordered stages and their transition table"""
+    name: str
+    title: str
+    stages: Tuple[str, ...]
+    # stage -> the stage that follows it, None after the last one
+    next_stage: Mapping[str, Optional[str]]
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+
+def compile_flow(name: str, spec: dict, known_stages: Collection[str],
+                 requires: Mapping[str, Tuple[str, ...]]) -> Flow:
+    """Validate a flow definition and build its transition table
+
+    ``requires`` maps a stage to the stages that must come before it, e.g.
+    the technical questions need the tech stack to have been collected.
+    """
+    stages = tuple(spec.get("stages", ()))
+    if not stages or stages[0] != FIRST_STAGE or stages[-1] != LAST_STAGE:
+        raise FlowError(f"Flow '{name}' must start with '{FIRST_STAGE}' and end with '{LAST_STAGE}'")
+    unknown = [stage for stage in stages if stage not in known_stages]
+    if unknown:
+        raise FlowError(f"Flow '{name}' uses unknown stages: {', '.join(unknown)}")
+    if len(set(stages)) != len(stages):
+        raise FlowError(f"Flow '{name}' repeats a stage")
+    for position, stage in enumerate(stages):
+        missing = [needed for needed in requires.get(stage, ()) if needed not in stages[:position]]
+        if missing:
+            raise FlowError(f"Flow '{name}': stage '{stage}' needs {', '.join(missing)} before it")
+
+    return Flow(
+        name=name,
+        title=spec.get("title", name.replace("_", " ").title()),
+        stages=stages,
+        next_stage=MappingProxyType(dict(zip(stages, stages[1:] + (None,)))),
+    )
+
+
+class FlowCatalog:
+    """Every compiled flow, shared by all sessions in the process"""
+
+    def __init__(self, flows: Dict[str, Flow], default: str):
+        if default not in flows:
+            raise FlowError(f"Default flow '{default}' is not defined")
+        self.flows: Mapping[str, Flow] = MappingProxyType(flows)
+        self.default = flows[default]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.flows
+
+    def get(self, name: Optional[str] = None) -> Flow:
+        """The named flow, or the default one when the name is empty or unknown"""
+        if not name:
+            return self.default
+        flow = self.flows.get(name)
+        if flow is None:
+            logger.warning(f"Unknown interview flow '{name}', using '{self.default.name}'")
+            return self.default
+        return flow
+
+
+def load_flows(known_stages: Collection[str], requires: Mapping[str, Tuple[str, ...]],
+               path: Path = DEFAULT_FLOWS_PATH) -> FlowCatalog:
+    """Parse and compile every flow in a flows file"""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    flows = {
+        name: compile_flow(name, spec, known_stages, requires)
+        for name, spec in data["flows"].items()
+    }
+    catalog = FlowCatalog(flows, data.get("default", "standard"))
+    logger.info(f"Compiled {len(flows)} interview flows from {path}")
+    return catalog
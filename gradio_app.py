@@ -1,121 +1,82 @@
 import gradio as gr
-import json
-import re
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import os
 import time
-import random
+from types import MappingProxyType
 
-class CandidateInfo:
-    def __init__(self):
-        self.full_name = ""
-        self.email = ""
-        self.phone = ""
-        self.experience_years = ""
-        self.desired_position = ""
-        self.location = ""
-        self.tech_stack = []
+from hiring_assistant import PROMPTS, HiringAssistant, get_flows
+from intent import ExitIntentDetector
+from sessions import SessionRegistry
 
-class HiringAssistant:
-    def __init__(self):
-        self.conversation_stages = [
-            "greeting", "name_collection", "email_collection", "phone_collection",
-            "experience_collection", "position_collection", "location_collection",
-            "tech_stack_collection", "technical_questions", "conclusion"
-        ]
-        self.stage_names = {
-            "greeting": "Welcome",
-            "name_collection": "Personal Info",
-            "email_collection": "Contact Details", 
-            "phone_collection": "Phone Verification",
-            "experience_collection": "Experience",
-            "position_collection": "Position Interest",
-            "location_collection": "Location",
-            "tech_stack_collection": "Technical Skills",
-            "technical_questions": "Technical Assessment",
-            "conclusion": "Completion"
-        }
-        self.current_stage_index = 0
-        self.candidate_info = CandidateInfo()
-        self.technical_questions = []
-        self.current_question_index = 0
-        self.conversation_ended = False
-        
-        # Tech keywords for extraction
-        self.tech_keywords = [
-            "python", "java", "javascript", "typescript", "react", "angular", "vue",
-            "node.js", "django", "flask", "spring", "express", "mysql", "postgresql",
-            "mongodb", "redis", "aws", "azure", "gcp", "docker", "kubernetes", "git"
-        ]
-        
-        # Technical questions database
-        self.question_templates = {
-            "python": [
-                "What is the difference between list and tuple in Python?",
-                "Explain Python's GIL (Global Interpreter Lock) and its implications.",
-                "How do you handle exceptions in Python? Provide an example."
-            ],
-            "javascript": [
-                "What is the difference between == and === in JavaScript?",
-                "Explain closures in JavaScript with an example.",
-                "What is the event loop in JavaScript and how does it work?"
-            ],
-            "react": [
-                "What is the difference between state and props in React?",
-                "Explain the React component lifecycle methods.",
-                "What are React Hooks and why are they useful?"
-            ],
-            "general": [
-                "Describe a challenging technical problem you've solved recently.",
-                "How do you stay updated with new technologies in your field?",
-                "What's your approach to debugging complex issues in your code?"
-            ]
-        }
-    
-    def get_current_stage(self):
-        if self.current_stage_index < len(self.conversation_stages):
-            return self.conversation_stages[self.current_stage_index]
-        return "conclusion"
-    
-    def get_stage_name(self, stage):
-        return self.stage_names.get(stage, stage.replace('_', ' ').title())
+class GradioAssistant(HiringAssistant):
+    """Shared interview engine with the Gradio app's shorter copy"""
     
-    def get_progress(self):
-        return (self.current_stage_index / len(self.conversation_stages)) * 100
+    __slots__ = ()
     
-    def advance_stage(self):
-        self.current_stage_index += 1
+    stage_names = MappingProxyType({
+        "greeting": "Welcome",
+        "name_collection": "Personal Info",
+        "email_collection": "Contact Details", 
+        "phone_collection": "Phone Verification",
+        "experience_collection": "Experience",
+        "position_collection": "Position Interest",
+        "location_collection": "Location",
+        "tech_stack_collection": "Technical Skills",
+        "technical_questions": "Technical Assessment",
+        "system_design": "System Design",
+        "conclusion": "Completion"
+    })
     
-    def validate_email(self, email):
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
-    
-    def validate_phone(self, phone):
-        digits_only = re.sub(r'\D', '', phone)
-        return 10 <= len(digits_only) <= 15
-    
-    def extract_tech_stack(self, user_input):
-        found_tech = []
-        user_lower = user_input.lower()
-        
-        for tech in self.tech_keywords:
-            if tech in user_lower:
-                found_tech.append(tech.title())
-        
-        return found_tech
+    prompts = MappingProxyType({**PROMPTS, **{
+        "greeting.ack": """Hello! 👋 Welcome to TalentScout's AI Hiring Assistant!
+
+I'm here to help with your initial screening for technology positions. I'll gather some basic information about you and ask a few technical questions based on your expertise.
+
+This should take about 5-10 minutes. You can end our conversation anytime by typing 'exit'.
+
+Let's get started! """,
+        "name_collection.ask": "What's your full name?",
+        "name_collection.ack": "Nice to meet you, {full_name}! 😊\n\n",
+        "email_collection.ask": "Could you please provide your email address?",
+        "email_collection.ack": "Great! ",
+        "phone_collection.ask": "Now, what's your phone number?",
+        "phone_collection.ack": "Perfect! ",
+        "experience_collection.ask": "How many years of professional experience do you have in technology?",
+        "experience_collection.ack": "Thanks! ",
+        "position_collection.ask": "What position(s) are you interested in? (e.g., Software Developer, Data Scientist, DevOps Engineer)",
+        "position_collection.ack": "Excellent! ",
+        "location_collection.ask": "What's your current location (city, state/country)?",
+        "location_collection.ack": "",
+        "tech_stack_collection.ask": """Now for the technical part! 💻
+
+Please tell me about your tech stack. List the programming languages, frameworks, databases, and tools you're proficient in.
+
+For example: "Python, Django, React, PostgreSQL, AWS, Docker" """,
+        "tech_stack_collection.ack": "Perfect! I've identified your expertise in: {tech_list}\n\n",
+        "tech_stack_collection.unrecognized": "I couldn't identify specific technologies. Please mention specific programming languages, frameworks, or tools you know (e.g., Python, React, MySQL, etc.).",
+        "tech_stack_collection.retry": "Please tell me about your technical skills and tools you use.",
+        "technical_questions.ask": """Now I'll ask you {question_count} technical questions to assess your proficiency.
+
+**Question 1:** {question}""",
+        "technical_questions.next": "Thank you for your answer! 👍\n\n**Question {number}:** {question}",
+        "technical_questions.ack": "Excellent! You've completed all the technical questions. 🎉\n\n",
+        "technical_questions.retry": "Please provide an answer to continue with the next question.",
+        "system_design.ask": "One last question on architecture. 🏗️\n\n**System Design:** {design_question}",
+        "system_design.ack": "Thanks for walking me through your design! ",
+        "conclusion.ask": """Thank you for taking the time to complete this screening! Our recruitment team will review your responses and contact you within 2-3 business days if your profile matches our current openings.
+
+Is there anything else you'd like to know about TalentScout or our process?""",
+        "conclusion.ack": """Thank you for your interest in TalentScout! 🌟
+
+Your information has been recorded and our team will be in touch soon.
+
+Have a wonderful day, and good luck with your job search!""",
+        "exit": "Thank you for your time! Have a great day! 👋",
+    }})
     
-    def generate_technical_questions(self, tech_stack):
-        questions = []
-        
-        for tech in tech_stack[:3]:
-            tech_lower = tech.lower()
-            if tech_lower in self.question_templates:
-                questions.extend(self.question_templates[tech_lower][:2])
-        
-        if not questions:
-            questions = self.question_templates["general"][:3]
-        
-        return questions[:5]
+    # Only a whole-message exit word ends the chat here
+    exit_intent = ExitIntentDetector(strong=(), weak=('exit', 'quit', 'bye', 'goodbye'),
+                                     filler=(), max_words=1)
     
     def get_candidate_summary(self):
         summary = []
@@ -135,157 +96,55 @@ class HiringAssistant:
             summary.append(f"**Tech Stack:** {', '.join(self.candidate_info.tech_stack)}")
         
         return "\n".join(summary) if summary else "No information collected yet."
-    
-    def get_response(self, user_input):
-        current_stage = self.get_current_stage()
-        
-        if current_stage == "greeting":
-            self.advance_stage()
-            return """Hello! 👋 Welcome to TalentScout's AI Hiring Assistant!
-
-I'm here to help with your initial screening for technology positions. I'll gather some basic information about you and ask a few technical questions based on your expertise.
-
-This should take about 5-10 minutes. You can end our conversation anytime by typing 'exit'.
-
-Let's get started! What's your full name?"""
 
-        elif current_stage == "name_collection":
-            if user_input.strip():
-                self.candidate_info.full_name = user_input.strip()
-                self.advance_stage()
-                return f"Nice to meet you, {self.candidate_info.full_name}! 😊\n\nCould you please provide your email address?"
-            else:
-                return "Please provide your full name to continue."
+# Minimum time the typing indicator stays up before a reply is shown. It is
+# awaited with asyncio.sleep, so it does not hold a Gradio worker thread.
+TYPING_MIN_DISPLAY_MS = int(os.getenv("TYPING_MIN_DISPLAY_MS", "1000"))
 
-        elif current_stage == "email_collection":
-            if self.validate_email(user_input.strip()):
-                self.candidate_info.email = user_input.strip()
-                self.advance_stage()
-                return "Great! Now, what's your phone number?"
-            else:
-                return "Please provide a valid email address (e.g., john@example.com)."
+TYPING_INDICATOR_HTML = '<span class="typing-dots"><span></span><span></span><span></span></span>'
 
-        elif current_stage == "phone_collection":
-            if self.validate_phone(user_input.strip()):
-                self.candidate_info.phone = user_input.strip()
-                self.advance_stage()
-                return "Perfect! How many years of professional experience do you have in technology?"
-            else:
-                return "Please provide a valid phone number."
+# Per-candidate assistants, keyed on the session id held in each browser's gr.State
+sessions = SessionRegistry(GradioAssistant)
 
-        elif current_stage == "experience_collection":
-            if user_input.strip():
-                self.candidate_info.experience_years = user_input.strip()
-                self.advance_stage()
-                return "Thanks! What position(s) are you interested in? (e.g., Software Developer, Data Scientist, DevOps Engineer)"
-            else:
-                return "Please specify your years of experience."
-
-        elif current_stage == "position_collection":
-            if user_input.strip():
-                self.candidate_info.desired_position = user_input.strip()
-                self.advance_stage()
-                return "Excellent! What's your current location (city, state/country)?"
-            else:
-                return "Please specify the position you're interested in."
-
-        elif current_stage == "location_collection":
-            if user_input.strip():
-                self.candidate_info.location = user_input.strip()
-                self.advance_stage()
-                return """Now for the technical part! 💻
-
-Please tell me about your tech stack. List the programming languages, frameworks, databases, and tools you're proficient in.
-
-For example: "Python, Django, React, PostgreSQL, AWS, Docker" """
-            else:
-                return "Please provide your current location."
-
-        elif current_stage == "tech_stack_collection":
-            if user_input.strip():
-                tech_stack = self.extract_tech_stack(user_input)
-                if tech_stack:
-                    self.candidate_info.tech_stack = tech_stack
-                    self.technical_questions = self.generate_technical_questions(tech_stack)
-                    self.advance_stage()
-                    return f"""Perfect! I've identified your expertise in: {', '.join(tech_stack)}
-
-Now I'll ask you {len(self.technical_questions)} technical questions to assess your proficiency.
-
-**Question 1:** {self.technical_questions[0] if self.technical_questions else "Tell me about a recent project you've worked on."}"""
-                else:
-                    return "I couldn't identify specific technologies. Please mention specific programming languages, frameworks, or tools you know (e.g., Python, React, MySQL, etc.)."
-            else:
-                return "Please tell me about your technical skills and tools you use."
-
-        elif current_stage == "technical_questions":
-            if user_input.strip():
-                self.current_question_index += 1
-                
-                if self.current_question_index < len(self.technical_questions):
-                    return f"Thank you for your answer! 👍\n\n**Question {self.current_question_index + 1}:** {self.technical_questions[self.current_question_index]}"
-                else:
-                    self.advance_stage()
-                    return """Excellent! You've completed all the technical questions. 🎉
-
-Thank you for taking the time to complete this screening! Our recruitment team will review your responses and contact you within 2-3 business days if your profile matches our current openings.
-
-Is there anything else you'd like to know about TalentScout or our process?"""
-            else:
-                return "Please provide an answer to continue with the next question."
-
-        else:
-            self.conversation_ended = True
-            return """Thank you for your interest in TalentScout! 🌟
-
-Your information has been recorded and our team will be in touch soon.
-
-Have a wonderful day, and good luck with your job search!"""
-
-# Global assistant instance
-assistant = HiringAssistant()
-
-def chat_interface(message, history):
+def chat_interface(message, history, session_id=None):
     """Main chat interface function"""
-    global assistant
-    
-    if message.lower().strip() in ['exit', 'quit', 'bye', 'goodbye']:
-        assistant.conversation_ended = True
-        return "Thank you for your time! Have a great day! 👋"
-    
-    # Get response from assistant
-    response = assistant.get_response(message)
+    with sessions.session(session_id) as (session_id, assistant):
+        response = assistant.get_response(message)
     
-    # Add some delay to simulate thinking
-    time.sleep(1)
-    
-    return response
+    return response, session_id
+
+def chat_stream(message, session_id, emit):
+    """Run one turn on a worker thread, handing each reply chunk to ``emit``"""
+    with sessions.session(session_id) as (session_id, assistant):
+        for chunk in assistant.get_response_stream(message):
+            emit(chunk)
+    return session_id
 
-def get_progress_info():
+def get_progress_info(session_id=None):
     """Get current progress information"""
-    global assistant
-    current_stage = assistant.get_current_stage()
-    progress = assistant.get_progress()
-    stage_name = assistant.get_stage_name(current_stage)
+    with sessions.session(session_id) as (session_id, assistant):
+        current_stage = assistant.get_current_stage()
+        progress = assistant.get_progress()
+        stage_name = assistant.get_stage_name(current_stage)
     
     return f"**Current Stage:** {stage_name}\n**Progress:** {progress:.0f}% Complete"
 
-def get_candidate_info():
+def get_candidate_info(session_id=None):
     """Get candidate information summary"""
-    global assistant
-    return assistant.get_candidate_summary()
+    with sessions.session(session_id) as (session_id, assistant):
+        return assistant.get_candidate_summary()
 
-def reset_conversation():
+def reset_conversation(session_id=None):
     """Reset the conversation"""
-    global assistant
-    assistant = HiringAssistant()
-    return "Conversation reset! Click 'Start Conversation' to begin again.", "", ""
+    session_id = sessions.reset(session_id)
+    return "Conversation reset! Click 'Start Conversation' to begin again.", "", "", session_id
 
-def start_conversation():
+def start_conversation(session_id=None, flow=None):
     """Start the conversation"""
-    global assistant
-    welcome_message = assistant.get_response("")
-    return [(None, welcome_message)]
+    with sessions.session(session_id) as (session_id, assistant):
+        assistant.select_flow(flow)
+        welcome_message = assistant.get_response("")
+    return [(None, welcome_message)], session_id
 
 # Custom CSS for better styling
 custom_css = """
@@ -322,11 +181,32 @@ custom_css = """
     border-radius: 10px;
     border-left: 4px solid #9c27b0;
 }
+
+.typing-dots span {
+    display: inline-block;
+    width: 8px;
+    height: 8px;
+    margin: 0 2px;
+    border-radius: 50%;
+    background: #667eea;
+    animation: typingBounce 1.4s infinite ease-in-out;
+}
+
+.typing-dots span:nth-child(1) { animation-delay: -0.32s; }
+.typing-dots span:nth-child(2) { animation-delay: -0.16s; }
+
+@keyframes typingBounce {
+    0%, 80%, 100% { transform: scale(0.6); opacity: 0.4; }
+    40% { transform: scale(1); opacity: 1; }
+}
 """
 
 # Create the Gradio interface
 with gr.Blocks(css=custom_css, title="TalentScout AI Hiring Assistant", theme=gr.themes.Soft()) as demo:
     # Header
+    # Session id for this browser tab; the assistant itself lives in `sessions`
+    session_state = gr.State(None)
+    
     gr.HTML("""
     <div class="header-text">
         <h1 style="font-size: 2.5rem; margin-bottom: 0.5rem;">🤖 TalentScout AI Hiring Assistant</h1>
@@ -355,6 +235,11 @@ with gr.Blocks(css=custom_css, title="TalentScout AI Hiring Assistant", theme=gr
                 send_btn = gr.Button("Send", variant="primary", scale=1)
             
             with gr.Row():
+                flow_choice = gr.Dropdown(
+                    choices=[(flow.title, name) for name, flow in get_flows().flows.items()],
+                    value=get_flows().default.name,
+                    label="Interview Flow"
+                )
                 start_btn = gr.Button("🚀 Start Conversation", variant="secondary")
                 reset_btn = gr.Button("🔄 Reset Conversation", variant="stop")
         
@@ -389,56 +274,86 @@ with gr.Blocks(css=custom_css, title="TalentScout AI Hiring Assistant", theme=gr
             )
     
     # Event handlers
-    def respond(message, chat_history):
+    async def respond(message, chat_history, session_id):
         if not message.strip():
-            return chat_history, ""
+            yield chat_history, "", session_id
+            return
+        
+        # Show the user message with a typing indicator right away
+        chat_history.append((message, TYPING_INDICATOR_HTML))
+        yield chat_history, "", session_id
+        started = time.monotonic()
+        
+        # The turn takes the session lock, writes to SQLite and may call a
+        # model, so it runs on a worker thread and never blocks the event loop
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+        turn = loop.run_in_executor(None, chat_stream, message, session_id,
+                                    lambda chunk: loop.call_soon_threadsafe(chunks.put_nowait, chunk))
+        turn.add_done_callback(lambda _: chunks.put_nowait(None))
         
-        # Add user message to history
-        chat_history.append((message, None))
+        # Stream the reply once the indicator has been up for its minimum time
+        bot_response = ""
+        while True:
+            chunk = await chunks.get()
+            if chunk is None:
+                break
+            bot_response += chunk
+            if time.monotonic() - started >= TYPING_MIN_DISPLAY_MS / 1000:
+                chat_history[-1] = (message, bot_response)
+                yield chat_history, "", session_id
+        session_id = await turn
         
-        # Get bot response
-        bot_response = chat_interface(message, chat_history)
+        # Keep the indicator up for the minimum display time without blocking a worker
+        remaining = TYPING_MIN_DISPLAY_MS / 1000 - (time.monotonic() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
         
         # Add bot response to history
         chat_history[-1] = (message, bot_response)
         
-        return chat_history, ""
+        yield chat_history, "", session_id
     
-    def update_info():
-        progress_info = get_progress_info()
-        candidate_info = get_candidate_info()
+    def update_info(session_id):
+        progress_info = get_progress_info(session_id)
+        candidate_info = get_candidate_info(session_id)
         return progress_info, candidate_info
     
     # Button events
     send_btn.click(
         respond,
-        inputs=[msg, chatbot],
-        outputs=[chatbot, msg]
+        inputs=[msg, chatbot, session_state],
+        outputs=[chatbot, msg, session_state]
     ).then(
         update_info,
+        inputs=[session_state],
         outputs=[progress_display, candidate_display]
     )
     
     msg.submit(
         respond,
-        inputs=[msg, chatbot],
-        outputs=[chatbot, msg]
+        inputs=[msg, chatbot, session_state],
+        outputs=[chatbot, msg, session_state]
     ).then(
         update_info,
+        inputs=[session_state],
         outputs=[progress_display, candidate_display]
     )
     
     start_btn.click(
         start_conversation,
-        outputs=[chatbot]
+        inputs=[session_state, flow_choice],
+        outputs=[chatbot, session_state]
     ).then(
         update_info,
+        inputs=[session_state],
         outputs=[progress_display, candidate_display]
     )
     
     reset_btn.click(
         reset_conversation,
-        outputs=[chatbot, progress_display, candidate_display]
+        inputs=[session_state],
+        outputs=[chatbot, progress_display, candidate_display, session_state]
     )
     
     # Footer
@@ -0,0 +1,661 @@
+"""
+TalentScout AI Hiring Assistant - Conversation Engine
+Table-driven interview stages shared by the Streamlit and Gradio front ends
+"""
+
+import logging
+import re
+import threading
+import time
+import uuid
+from datetime import datetime
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from database import CANDIDATE_PROFILE_COLUMNS, get_database_manager
+from flows import Flow, FlowCatalog, compile_flow, load_flows
+from intent import ExitIntentDetector
+from question_bank import candidate_key, seniority_from_experience
+from question_generator import QuestionRequest, get_question_generator
+from taxonomy import get_taxonomy
+from templates import TEMPLATE_LOCALE, TemplateRegistry, get_template_registry
+
+logger = logging.getLogger(__name__)
+
+# Asked when question generation comes back empty
+FALLBACK_QUESTION = "Tell me about a recent project you've worked on."
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NON_DIGITS = re.compile(r'\D')
+
+
+class CandidateInfo:
+    """Candidate information, slotted to keep per-session memory small"""
+
+    # Profile columns saved by DatabaseManager.save_candidate
+    PROFILE_FIELDS = CANDIDATE_PROFILE_COLUMNS
+
+    __slots__ = PROFILE_FIELDS + ("session_id", "tech_stack", "technical_answers", "created_at", "dirty_fields")
+
+    def __init__(self, session_id: str = "", full_name: str = "", email: str = "", phone: str = "",
+                 experience_years: str = "", desired_position: str = "", location: str = "",
+                 tech_stack: Optional[List[str]] = None,
+                 technical_answers: Optional[Dict[str, Dict[str, str]]] = None,
+                 created_at: str = "", dirty_fields: Optional[Set[str]] = None):
+        self.session_id = session_id or str(uuid.uuid4())
+        self.full_name = full_name
+        self.email = email
+        self.phone = phone
+        self.experience_years = experience_years
+        self.desired_position = desired_position
+        self.location = location
+        self.tech_stack = tech_stack if tech_stack is not None else []
+        self.technical_answers = technical_answers if technical_answers is not None else {}
+        self.created_at = created_at or datetime.now().isoformat()
+        # A new candidate has never been saved, so every profile field is dirty
+        self.dirty_fields = set(self.PROFILE_FIELDS if dirty_fields is None else dirty_fields)
+
+    def __setattr__(self, name, value):
+        if name in self.PROFILE_FIELDS and hasattr(self, "dirty_fields") and getattr(self, name) != value:
+            self.dirty_fields.add(name)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return f"CandidateInfo(session_id={self.session_id!r}, full_name={self.full_name!r})"
+
+    def mark_clean(self):
+        """Forget pending changes once they have been handed to the database"""
+        self.dirty_fields.clear()
+
+    def to_state(self) -> Dict:
+        """JSON-serializable snapshot"""
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["dirty_fields"] = sorted(self.dirty_fields)
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "CandidateInfo":
+        return cls(**state)
+
+
+def stream_text(text: str) -> Iterator[str]:
+    """Split a reply into line-sized chunks for incremental rendering"""
+    yield from text.splitlines(keepends=True)
+
+
+# Reply templates. A stage that completes sends "<stage>.ack" followed by
+# "<next>.ask" for whichever stage the session's flow puts next, so stages
+# can be reordered or skipped per flow; "<stage>.<case>" keys hold the other
+# replies a stage can give. Placeholders are filled from
+# HiringAssistant.template_context(). They are compiled once per process
+# (templates.TemplateRegistry), with data/locales/<locale>.json overlaid for
+# other languages.
+PROMPTS: Mapping[str, str] = MappingProxyType({
+    "greeting.ack": """Hello and welcome! 👋
+
+I'm the **TalentScout AI Hiring Assistant**, your intelligent partner for technical candidate screening.
+
+**What I'll do:**
+• 📝 Collect basic information about your background
+• 🛠️ Learn about your technical skills and experience
+• 🧠 Ask relevant technical questions based on your expertise
+• ✨ Provide a smooth, conversational interview experience
+
+**Privacy & Security:**
+Your information is handled securely and used only for recruitment purposes.
+
+This process takes about 5-10 minutes. You can end our conversation anytime by typing 'exit'.
+
+Let's get started! """,
+
+    "name_collection.ask": "**What's your full name?**",
+    "name_collection.ack": "Nice to meet you, **{full_name}**! 😊\n\n",
+    "name_collection.retry": "Please provide your full name to continue.",
+
+    "email_collection.ask": """Now I'll need some contact information.
+
+**What's your email address?**""",
+    "email_collection.ack": "Perfect! ✅\n\n",
+    "email_collection.retry": "Please provide a valid email address (e.g., john@example.com).",
+
+    "phone_collection.ask": "**What's your phone number?** (Include area code)",
+    "phone_collection.ack": "Great! 📱\n\n",
+    "phone_collection.retry": "Please provide a valid phone number.",
+
+    "experience_collection.ask": """**How many years of professional experience do you have in technology?**
+
+You can say something like "3 years", "5+ years", "Fresh graduate", etc.""",
+    "experience_collection.ack": "Excellent! 💼\n\n",
+    "experience_collection.retry": "Please specify your years of experience.",
+
+    "position_collection.ask": """**What position(s) are you most interested in?**
+
+Examples:
+• Software Developer/Engineer
+• Data Scientist/Analyst
+• DevOps Engineer
+• Full Stack Developer
+• Frontend/Backend Developer
+• Mobile App Developer""",
+    "position_collection.ack": "Perfect! 🎯\n\n",
+    "position_collection.retry": "Please specify the position you're interested in.",
+
+    "location_collection.ask": """**What's your current location?** (City, State/Country)
+
+This helps us match you with relevant opportunities.""",
+    "location_collection.ack": "Great! 📍\n\n",
+    "location_collection.retry": "Please provide your current location.",
+
+    "tech_stack_collection.ask": """Now for the exciting part - let's talk about your **technical skills**! 💻
+
+**Please tell me about your tech stack.** List the programming languages, frameworks, databases, and tools you're proficient in.
+
+**Examples:**
+• "Python, Django, React, PostgreSQL, AWS"
+• "Java, Spring Boot, Angular, MySQL"
+• "JavaScript, Node.js, Vue.js, MongoDB"
+
+Just mention the main technologies you're comfortable with.""",
+    "tech_stack_collection.ack": """Excellent! I've identified your expertise in: **{tech_list}** 🛠️
+
+""",
+    "tech_stack_collection.unrecognized": """I couldn't identify specific technologies. Please mention specific programming languages, frameworks, or tools:
+
+• Programming languages: Python, Java, JavaScript, etc.
+• Frameworks: React, Django, Spring, etc.
+• Databases: MySQL, PostgreSQL, MongoDB, etc.
+• Tools: Git, Docker, AWS, etc.
+
+**What technologies are you proficient in?**""",
+    "tech_stack_collection.retry": "Please tell me about your technical skills.",
+
+    "technical_questions.ask": """Now I'll ask you **{question_count}** technical questions tailored to your skills.
+
+Please answer to the best of your ability. I'm interested in your thought process and understanding.
+
+---
+
+**Technical Question 1:**
+
+**{question}**""",
+    "technical_questions.next": """Thank you for your answer! 👍
+
+---
+
+**Technical Question {number}:**
+
+**{question}**""",
+    "technical_questions.ack": "Excellent work! You've completed all {question_count} technical questions! 🎉\n\n",
+    "technical_questions.retry": "Please provide an answer to continue.",
+
+    "system_design.ask": """One more for this role - let's talk architecture. 🏗️
+
+---
+
+**System Design Question:**
+
+**{design_question}**
+
+Walk me through the main components, how you'd store the data, and how it would scale.""",
+    "system_design.ack": "Thanks for walking me through your design! 🏗️\n\n",
+    "system_design.retry": "Please share your approach to continue.",
+
+    "conclusion.ask": """**Interview Summary:**
+• **Name:** {full_name}
+• **Position:** {desired_position}
+• **Experience:** {experience_years}
+• **Location:** {location}
+• **Tech Stack:** {tech_list}
+• **Questions Completed:** {question_count}
+
+**What's Next?**
+1. Our team will review your responses within 2-3 business days
+2. If your profile matches our openings, we'll contact you
+3. You may be invited for a detailed technical interview
+
+**Is there anything else you'd like to know about TalentScout or our process?**
+
+Type 'goodbye' to end our conversation.""",
+    "conclusion.ack": """Thank you for your interest in TalentScout! 🌟
+
+Your screening has been completed successfully and your information has been securely recorded.
+
+**Next Steps:**
+• Our recruitment team will review your profile
+• You'll hear back within 2-3 business days if there's a match
+• Keep an eye on your email (including spam folder)
+
+**Tips:**
+• Continue building your skills
+• Connect with us on LinkedIn
+• The tech industry is always evolving!
+
+Have a wonderful day and best of luck with your career journey! 🚀
+
+*Thank you for choosing TalentScout - where talent meets opportunity.*""",
+
+    "exit": """Thank you for your time! 👋
+
+I hope you found this screening process helpful. Our recruitment team will review your information and get back to you within 2-3 business days if your profile matches our current openings.
+
+Best of luck with your job search! 🌟""",
+    "error": "I apologize for the technical issue. Please try rephrasing your response or type 'exit' to end our conversation.",
+})
+
+
+def any_input(text: str) -> bool:
+    return True
+
+
+def non_empty(text: str) -> bool:
+    return bool(text)
+
+
+def valid_name(text: str) -> bool:
+    return len(text) >= 2
+
+
+def valid_email(text: str) -> bool:
+    return EMAIL_PATTERN.match(text.strip()) is not None
+
+
+def valid_phone(text: str) -> bool:
+    return 10 <= len(NON_DIGITS.sub('', text)) <= 15
+
+
+# Custom turn logic: (assistant, stripped input) -> reply chunks
+StageHandler = Callable[["HiringAssistant", str], Iterator[str]]
+
+
+class Stage(NamedTuple):
+    """One interview stage
+
+    When ``validate`` accepts the stripped answer it is stored in the
+    CandidateInfo attribute ``field`` (if any) and the stage completes: the
+    assistant moves to the next stage of its flow and sends this stage's
+    ``.ack`` template followed by the next stage's ``.ask``; otherwise the
+    ``<name>.retry`` template is sent and the stage repeats. Stages that need
+    more than that supply a ``handler`` that produces the reply itself.
+    ``requires`` names stages a flow must run before this one, and
+    ``free_text`` marks stages whose long answers may mention exit words
+    without meaning them.
+    """
+    name: str
+    title: str
+    field: Optional[str] = None
+    validate: Callable[[str], bool] = non_empty
+    handler: Optional[StageHandler] = None
+    requires: Tuple[str, ...] = ()
+    free_text: bool = False
+
+
+def _collect_tech_stack(assistant: "HiringAssistant", text: str) -> Iterator[str]:
+    if not text:
+        yield from assistant.reply("tech_stack_collection.retry")
+        return
+    tech_stack = assistant.extract_tech_stack(text)
+    if not tech_stack:
+        yield from assistant.reply("tech_stack_collection.unrecognized")
+        return
+
+    candidate = assistant.candidate_info
+    assistant.db_manager.save_skills(candidate.session_id, tech_stack, previous=candidate.tech_stack)
+    candidate.tech_stack = tech_stack
+    # Acknowledge the stack before question generation, which may call a model
+    yield assistant.render("tech_stack_collection.ack")
+    assistant.technical_questions = assistant.generate_technical_questions(tech_stack) or [FALLBACK_QUESTION]
+    yield from assistant.complete_stage(acknowledge=False)
+
+
+def _record_answer(assistant: "HiringAssistant", question_no: int, question: str, text: str):
+    """Keep an answer on the candidate and persist it"""
+    candidate = assistant.candidate_info
+    answer = {
+        "question": question,
+        "answer": text,
+        "timestamp": datetime.now().isoformat()
+    }
+    candidate.technical_answers[f"Q{question_no}"] = answer
+    assistant.db_manager.save_answer(
+        candidate.session_id, question_no, answer["question"], answer["answer"], answer["timestamp"]
+    )
+
+
+def _answer_question(assistant: "HiringAssistant", text: str) -> Iterator[str]:
+    if not text:
+        yield from assistant.reply("technical_questions.retry")
+        return
+
+    _record_answer(assistant, assistant.current_question_index + 1,
+                   assistant.technical_questions[assistant.current_question_index], text)
+    assistant.current_question_index += 1
+    if assistant.current_question_index < len(assistant.technical_questions):
+        yield from assistant.reply("technical_questions.next")
+    else:
+        yield from assistant.complete_stage()
+
+
+def _answer_system_design(assistant: "HiringAssistant", text: str) -> Iterator[str]:
+    if not text:
+        yield from assistant.reply("system_design.retry")
+        return
+
+    # Numbered after the technical questions so it lands in the same answer list
+    _record_answer(assistant, len(assistant.technical_questions) + 1, SYSTEM_DESIGN_QUESTION, text)
+    yield from assistant.complete_stage()
+
+
+def _conclude(assistant: "HiringAssistant", text: str) -> Iterator[str]:
+    assistant.conversation_ended = True
+    yield from assistant.reply("conclusion.ack")
+
+
+SYSTEM_DESIGN_QUESTION = "How would you design a URL-shortening service that handles millions of redirects a day?"
+
+STAGES: Tuple[Stage, ...] = (
+    Stage("greeting", "Welcome & Introduction", validate=any_input),
+    Stage("name_collection", "Personal Information", "full_name", valid_name),
+    Stage("email_collection", "Contact Details", "email", valid_email),
+    Stage("phone_collection", "Phone Verification", "phone", valid_phone),
+    Stage("experience_collection", "Experience Assessment", "experience_years"),
+    Stage("position_collection", "Position Interest", "desired_position"),
+    Stage("location_collection", "Location Information", "location"),
+    Stage("tech_stack_collection", "Technical Skills Assessment", handler=_collect_tech_stack,
+          free_text=True),
+    Stage("technical_questions", "Technical Interview", handler=_answer_question,
+          requires=("tech_stack_collection",), free_text=True),
+    Stage("system_design", "System Design", handler=_answer_system_design, free_text=True),
+    Stage("conclusion", "Interview Completion", handler=_conclude),
+)
+
+# Built once at import: a turn is one dict lookup instead of a walk down an if/elif chain
+STAGE_TABLE: Mapping[str, Stage] = MappingProxyType({stage.name: stage for stage in STAGES})
+
+# Used when the flows file is missing or invalid
+BUILTIN_FLOW = tuple(stage.name for stage in STAGES if stage.name != "system_design")
+
+_flows: Optional[FlowCatalog] = None
+_flows_lock = threading.Lock()
+
+
+def get_flows() -> FlowCatalog:
+    """Get the process-wide compiled flows, loading them on first use"""
+    global _flows
+    if _flows is None:
+        with _flows_lock:
+            if _flows is None:
+                requires = {stage.name: stage.requires for stage in STAGES}
+                try:
+                    _flows = load_flows(STAGE_TABLE, requires)
+                except (OSError, ValueError, KeyError) as e:
+                    logger.error(f"Error loading interview flows, using the built-in flow: {e}")
+                    builtin = compile_flow("standard", {"stages": BUILTIN_FLOW}, STAGE_TABLE, requires)
+                    _flows = FlowCatalog({"standard": builtin}, "standard")
+    return _flows
+
+
+def get_flow(name: Optional[str] = None) -> Flow:
+    """A compiled flow by name; empty or unknown names get the default flow"""
+    return get_flows().get(name)
+
+
+class StageTimings:
+    """Per-stage turn latency: count, total, mean and max milliseconds"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[float]] = {}
+
+    def record(self, stage: str, elapsed_ms: float):
+        with self._lock:
+            stats = self._stats.setdefault(stage, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed_ms
+            stats[2] = max(stats[2], elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {"count": count, "total_ms": total, "avg_ms": total / count, "max_ms": peak}
+                for stage, (count, total, peak) in self._stats.items()
+            }
+
+
+stage_timings = StageTimings()
+
+# Called as hook(stage_name, elapsed_ms) after every turn
+_stage_hooks: List[Callable[[str, float], None]] = [stage_timings.record]
+
+
+def add_stage_hook(hook: Callable[[str, float], None]):
+    """Register a callback that receives each turn's stage and handler time"""
+    _stage_hooks.append(hook)
+
+
+def get_stage_timings() -> Dict[str, Dict[str, float]]:
+    """Latency per stage across every assistant in the process"""
+    return stage_timings.snapshot()
+
+
+class HiringAssistant:
+    """Interview state machine driven by the STAGES table
+
+    Stage titles, prompts and the exit detector are immutable class-level config
+    shared by every session, and the stage order comes from a compiled Flow
+    shared by every session that uses it; an instance only holds its own
+    progress and a reference to its flow. Front ends customise copy by
+    subclassing and overriding ``prompts`` (and ``locale`` for a language).
+    """
+
+    stage_names = MappingProxyType({stage.name: stage.title for stage in STAGES})
+
+    prompts = PROMPTS
+
+    locale = TEMPLATE_LOCALE
+
+    exit_intent = ExitIntentDetector()
+
+    __slots__ = ("flow", "current_stage_index", "candidate_info", "technical_questions",
+                 "current_question_index", "conversation_ended")
+
+    def __init__(self, flow: Optional[str] = None):
+        self.flow = get_flow(flow)
+        self.current_stage_index = 0
+        self.candidate_info = CandidateInfo()
+        self.technical_questions = []
+        self.current_question_index = 0
+        self.conversation_ended = False
+
+    @property
+    def db_manager(self):
+        return get_database_manager()
+
+    @property
+    def question_generator(self):
+        return get_question_generator()
+
+    @property
+    def templates(self) -> TemplateRegistry:
+        """Compiled prompts for this class's copy and locale, shared process-wide"""
+        return get_template_registry(self.prompts, self.locale)
+
+    @property
+    def conversation_stages(self) -> Tuple[str, ...]:
+        return self.flow.stages
+
+    def select_flow(self, name: Optional[str]) -> bool:
+        """Switch to another flow; only allowed before the first turn"""
+        if self.current_stage_index != 0:
+            logger.warning(f"Ignoring flow '{name}' for an interview already in progress")
+            return False
+        self.flow = get_flow(name)
+        return True
+
+    def to_state(self) -> Dict:
+        """JSON-serializable snapshot of the interview's progress"""
+        return {
+            "flow": self.flow.name,
+            "current_stage_index": self.current_stage_index,
+            "candidate_info": self.candidate_info.to_state(),
+            "technical_questions": list(self.technical_questions),
+            "current_question_index": self.current_question_index,
+            "conversation_ended": self.conversation_ended,
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "HiringAssistant":
+        # Snapshots from before flows existed ran the default flow
+        assistant = cls(state.get("flow"))
+        assistant.current_stage_index = state["current_stage_index"]
+        assistant.candidate_info = CandidateInfo.from_state(state["candidate_info"])
+        assistant.technical_questions = state["technical_questions"]
+        assistant.current_question_index = state["current_question_index"]
+        assistant.conversation_ended = state["conversation_ended"]
+        return assistant
+
+    def is_exit_keyword(self, user_input: str) -> bool:
+        """Check if user wants to exit, leniently during free-text answers"""
+        stage = STAGE_TABLE.get(self.get_current_stage())
+        return self.exit_intent.is_exit(user_input, free_text=stage is not None and stage.free_text)
+
+    def get_current_stage(self) -> str:
+        """Get current conversation stage"""
+        if self.current_stage_index < len(self.conversation_stages):
+            return self.conversation_stages[self.current_stage_index]
+        return "conclusion"
+
+    def get_stage_name(self, stage: str) -> str:
+        """Get human-readable stage name"""
+        return self.stage_names.get(stage, stage.replace('_', ' ').title())
+
+    def get_progress(self) -> float:
+        """Calculate progress percentage"""
+        return (self.current_stage_index / len(self.conversation_stages)) * 100
+
+    def advance_stage(self):
+        """Move to next stage"""
+        self.current_stage_index += 1
+        logger.info(f"Advanced to stage: {self.get_current_stage()}")
+
+    validate_email = staticmethod(valid_email)
+    validate_phone = staticmethod(valid_phone)
+
+    def extract_tech_stack(self, user_input: str) -> List[str]:
+        """Extract technologies from user input"""
+        return get_taxonomy().matcher.extract(user_input)
+
+    def generate_technical_questions(self, tech_stack: List[str]) -> List[str]:
+        """Generate technical questions based on tech stack"""
+        taxonomy = get_taxonomy()
+        candidate = self.candidate_info
+        request = QuestionRequest(
+            tech_stack=tuple(taxonomy.key_for(tech) for tech in tech_stack),
+            seniority=seniority_from_experience(candidate.experience_years),
+            position=candidate.desired_position
+        )
+        return self.question_generator.generate(request, self.question_history_key())
+
+    def question_history_key(self) -> str:
+        """Key the questions asked are remembered under, so a retake gets fresh ones"""
+        return candidate_key(self.candidate_info.email, self.candidate_info.session_id)
+
+    def template_context(self) -> Dict[str, object]:
+        """Values available to reply templates"""
+        candidate = self.candidate_info
+        context = {field: getattr(candidate, field) for field in CandidateInfo.PROFILE_FIELDS}
+        context["tech_list"] = ", ".join(candidate.tech_stack)
+        context["question_count"] = len(self.technical_questions)
+        if self.current_question_index < len(self.technical_questions):
+            context["question"] = self.technical_questions[self.current_question_index]
+        context["number"] = self.current_question_index + 1
+        context["design_question"] = SYSTEM_DESIGN_QUESTION
+        return context
+
+    def render(self, key: str, **values) -> str:
+        """Fill in a reply template; static ones come back as the shared interned string"""
+        template = self.templates[key]
+        if template.static:
+            return template.text
+        return template.render({**self.template_context(), **values})
+
+    def reply(self, key: str, **values) -> Iterator[str]:
+        """Stream a filled-in reply template"""
+        template = self.templates[key]
+        if template.static:
+            return template.stream(values)
+        return template.stream({**self.template_context(), **values})
+
+    def complete_stage(self, acknowledge: bool = True) -> Iterator[str]:
+        """Advance along the flow and stream this stage's ack plus the next stage's question"""
+        stage = self.get_current_stage()
+        next_stage = self.flow.next_stage.get(stage)
+        self.advance_stage()
+        keys = (f"{stage}.ack" if acknowledge else None, next_stage and f"{next_stage}.ask")
+        templates = self.templates
+        return stream_text(templates.join(tuple(key for key in keys if key in templates),
+                                          self.template_context))
+
+    def _run_stage(self, stage: Stage, text: str) -> Iterator[str]:
+        """Dispatch one turn to a stage"""
+        if stage.handler is not None:
+            yield from stage.handler(self, text)
+        elif stage.validate(text):
+            if stage.field:
+                setattr(self.candidate_info, stage.field, text)
+            yield from self.complete_stage()
+        else:
+            yield from self.reply(f"{stage.name}.retry")
+
+    def _timed(self, stage: Stage, chunks: Iterator[str]) -> Iterator[str]:
+        """Pass chunks through, timing only the stage's own work, then call the hooks"""
+        elapsed = 0.0
+        while True:
+            started = time.perf_counter()
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                elapsed += time.perf_counter() - started
+                break
+            elapsed += time.perf_counter() - started
+            yield chunk
+
+        elapsed_ms = elapsed * 1000
+        for hook in _stage_hooks:
+            try:
+                hook(stage.name, elapsed_ms)
+            except Exception as e:
+                logger.error(f"Stage timing hook failed: {e}")
+
+    def get_response(self, user_input: str) -> str:
+        """Main conversation handler"""
+        return "".join(self.get_response_stream(user_input))
+
+    def get_response_stream(self, user_input: str) -> Iterator[str]:
+        """Main conversation handler, yielding the reply as it is produced"""
+        candidate = self.candidate_info
+        self.db_manager.log_conversation(candidate.session_id, "user", user_input, self.get_current_stage())
+
+        if self.is_exit_keyword(user_input):
+            self.conversation_ended = True
+            self.db_manager.save_candidate(candidate)
+            yield from self.reply("exit")
+            return
+
+        stage = STAGE_TABLE.get(self.get_current_stage(), STAGE_TABLE["conclusion"])
+        chunks = []
+        try:
+            for chunk in self._timed(stage, self._run_stage(stage, user_input.strip())):
+                chunks.append(chunk)
+                yield chunk
+
+            # Log response once, as a whole
+            self.db_manager.log_conversation(
+                candidate.session_id, "assistant", "".join(chunks), self.get_current_stage()
+            )
+            if candidate.full_name:
+                self.db_manager.save_candidate(candidate)
+            if stage.name != "conclusion" and self.get_current_stage() == "conclusion":
+                self.db_manager.mark_completed(candidate.session_id)
+        except Exception as e:
+            logger.error(f"Error in conversation: {e}")
+            yield self.render("error")
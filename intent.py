@@ -0,0 +1,142 @@
+"""
+TalentScout AI Hiring Assistant - Exit Intent
+Precompiled, stage-aware detection of a candidate asking to end the interview
+"""
+
+import re
+from itertools import groupby
+from typing import FrozenSet, Iterable, List, Tuple
+
+# Words, keeping contractions ("i'm", "that's") whole
+WORD_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# Unambiguous: a whole word anywhere in a short-answer reply means "stop"
+STRONG_EXIT_WORDS = ("exit", "quit", "bye", "goodbye", "terminate")
+
+# Common in real answers ("the end of the list", "stop the container"), so
+# they only count when the whole reply is a short exit utterance
+WEAK_EXIT_WORDS = ("end", "stop", "finish", "close", "done", "thanks", "thank you")
+
+# Words that may surround an exit word in a standalone utterance such as
+# "ok I'm done now" or "please end the interview"
+FILLER_WORDS = (
+    "i", "i'm", "im", "am", "i'd", "want", "would", "like", "to", "let's", "lets", "please",
+    "ok", "okay", "now", "here", "that's", "thats", "it", "it's", "all", "for", "today", "the", "this",
+    "interview", "conversation", "chat", "screening", "we", "can", "you", "so", "much",
+    "very", "a", "lot", "good", "and", "just", "then", "is", "be", "will", "no", "everyone",
+)
+
+STANDALONE_MAX_WORDS = 8
+
+
+def words(text: str) -> List[str]:
+    """Lowercased words of a reply"""
+    return WORD_PATTERN.findall(text.lower().replace("\u2019", "'"))
+
+
+def _alternation(terms: Iterable[str]) -> str:
+    """Regex alternation matching any of the words, grouped by first letter
+
+    Each branch starts with a literal, which lets the regex engine skip
+    ahead to candidate letters instead of trying every word at every offset.
+    """
+    branches = []
+    for first, group in groupby(sorted(terms), key=lambda term: term[0]):
+        rests = sorted((term[1:] for term in group), key=len, reverse=True)
+        branches.append(f"{re.escape(first)}(?:{'|'.join(map(re.escape, rests))})")
+    return "|".join(branches)
+
+
+# A word ends where the next character is not a letter or an in-word apostrophe
+WORD_END = r"(?![a-z]|'[a-z])"
+
+
+class ExitIntentDetector:
+    """Decides whether a reply asks to end the interview
+
+    The word lists are compiled once into regexes, so a check is one or
+    two searches and never tokenizes the reply; every match is on
+    whole-word boundaries ("end" does not match "backend", nor "stop" match
+    "stopwatch"). A reply is an exit when
+
+    * it is a standalone exit utterance: at most ``max_words`` words, all of
+      them exit or filler words, at least one an exit word ("bye",
+      "I'm done", "please end the interview"); or
+    * outside free-text stages, it contains a strong exit word anywhere,
+      other than as the first word of a Title Case name ("Goodbye Creek").
+
+    Free-text stages (technical answers and the like) only accept the
+    first form, so an answer that mentions "exit codes" or "close the
+    connection" keeps the interview going. The standalone pattern is
+    anchored, so a long answer is rejected at its first ordinary word, and
+    the strong-word search only runs once a substring test finds one.
+    """
+
+    def __init__(self, strong: Iterable[str] = STRONG_EXIT_WORDS,
+                 weak: Iterable[str] = WEAK_EXIT_WORDS,
+                 filler: Iterable[str] = FILLER_WORDS,
+                 max_words: int = STANDALONE_MAX_WORDS):
+        filler_words = frozenset(filler)
+        self.strong: FrozenSet[str] = frozenset(word for term in strong for word in words(term))
+        weak_words = frozenset(word for term in weak for word in words(term))
+        # Words of multi-word phrases ("thank you") that are filler on their own
+        # make an utterance standalone but do not make it an exit
+        self.exit_words: FrozenSet[str] = (self.strong | weak_words) - filler_words
+        self.vocabulary: FrozenSet[str] = self.strong | weak_words | filler_words
+        self.max_words = max_words
+
+        # Up to max_words vocabulary words, checked by the lookahead; since
+        # every vocabulary word is an exit or a filler word, the utterance
+        # is an exit when an exit word follows the leading fillers
+        fillers = (f"(?:(?:{_alternation(self.vocabulary - self.exit_words)}){WORD_END}[^a-z]*)*"
+                   if self.vocabulary - self.exit_words else "")
+        self._standalone = re.compile(
+            f"[^a-z]*(?=(?:(?:{_alternation(self.vocabulary)}){WORD_END}[^a-z]*){{1,{max_words}}}\\Z)"
+            f"{fillers}(?:{_alternation(self.exit_words)}){WORD_END}"
+        ) if self.exit_words else None
+
+        # "goodbye" contains "bye", so testing for "bye" covers both
+        self._strong_substrings: Tuple[str, ...] = tuple(
+            word for word in self.strong if not any(other != word and other in word for other in self.strong)
+        )
+        if self.strong:
+            self._strong_word = re.compile(f"(?:{_alternation(self.strong)}){WORD_END}")
+            self._strong_name = re.compile(
+                f"(?<![A-Za-z])(?:{_alternation(word.capitalize() for word in self.strong)})(?=[ \\t]+[A-Z])"
+            )
+
+    def is_exit(self, text: str, free_text: bool = False) -> bool:
+        lowered = text.lower()
+        if "\u2019" in lowered:
+            lowered = lowered.replace("\u2019", "'")
+        if self._standalone is not None and self._standalone.match(lowered) is not None:
+            return True
+        if free_text:
+            return False
+        for word in self._strong_substrings:
+            if word in lowered:
+                break
+        else:
+            return False
+        if not _find_word(self._strong_word, lowered):
+            return False
+        # Found, but possibly only as a place or person name
+        unnamed = self._strong_name.sub(" ", text.replace("\u2019", "'"))
+        return _find_word(self._strong_word, unnamed.lower())
+
+
+def _find_word(pattern: "re.Pattern", text: str) -> bool:
+    """Search for a match that also starts on a word boundary
+
+    The start is checked here rather than with a lookbehind in the pattern,
+    which would stop the engine from skipping ahead by first letter; it only
+    runs for the rare replies where the pattern matches at all.
+    """
+    match = pattern.search(text)
+    while match is not None:
+        start = match.start()
+        if start == 0 or not (text[start - 1].isalpha()
+                              or (text[start - 1] == "'" and start > 1 and text[start - 2].isalpha())):
+            return True
+        match = pattern.search(text, start + 1)
+    return False
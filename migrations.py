@@ -0,0 +1,396 @@
+"""
+TalentScout AI Hiring Assistant - Schema Migrations
+Versioned, run-once migrations for candidates.db with resumable online backfills
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from typing import Callable, NamedTuple, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_BATCH_SIZE = 5000
+
+CREATE_SCHEMA_VERSION_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        name TEXT NOT NULL,
+        applied_at TEXT NOT NULL
+    )
+"""
+CREATE_MIGRATION_PROGRESS_SQL = """
+    CREATE TABLE IF NOT EXISTS migration_progress (
+        version INTEGER PRIMARY KEY,
+        last_id INTEGER NOT NULL
+    )
+"""
+SELECT_VERSION_SQL = "SELECT COALESCE(MAX(version), 0) FROM schema_version"
+INSERT_VERSION_SQL = "INSERT OR IGNORE INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)"
+SELECT_PROGRESS_SQL = "SELECT last_id FROM migration_progress WHERE version = ?"
+UPSERT_PROGRESS_SQL = "INSERT OR REPLACE INTO migration_progress (version, last_id) VALUES (?, ?)"
+DELETE_PROGRESS_SQL = "DELETE FROM migration_progress WHERE version = ?"
+
+
+class Backfill(NamedTuple):
+    """Data migration run over a table in rowid batches
+
+    ``run`` gets the connection and an inclusive (first_id, last_id) rowid
+    range and must be safe to repeat for a range, since a batch interrupted
+    by a crash is redone on the next start.
+    """
+    table: str
+    run: Callable[[sqlite3.Connection, int, int], None]
+    batch_size: int = BACKFILL_BATCH_SIZE
+
+
+class AddColumn(NamedTuple):
+    """ALTER TABLE ... ADD COLUMN, skipped when the column already exists
+
+    SQLite has no ADD COLUMN IF NOT EXISTS, and a plain ALTER fails when
+    a migration's DDL is re-run, e.g. after a crash before its backfill
+    finished.
+    """
+    table: str
+    column: str
+    definition: str
+
+    def apply(self, conn: sqlite3.Connection):
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({self.table})")}
+        if self.column not in columns:
+            conn.execute(f"ALTER TABLE {self.table} ADD COLUMN {self.column} {self.definition}")
+
+
+class Migration(NamedTuple):
+    """One schema version: DDL applied atomically, then an optional backfill
+
+    Statements are SQL strings or AddColumn steps; all of them must be safe
+    to repeat, since a migration with a backfill re-runs its DDL when it is
+    resumed.
+    """
+    version: int
+    name: str
+    statements: Tuple[Union[str, AddColumn], ...] = ()
+    backfill: Optional[Backfill] = None
+
+
+INSERT_SKILL_SQL = """
+    INSERT OR IGNORE INTO candidate_skills (session_id, skill_key, skill) VALUES (?, ?, ?)
+"""
+UPSERT_ANSWER_SQL = """
+    INSERT INTO candidate_answers (session_id, question_no, question, answer, answered_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (session_id, question_no) DO UPDATE SET
+        question = excluded.question, answer = excluded.answer, answered_at = excluded.answered_at
+"""
+SELECT_JSON_COLUMNS_SQL = """
+    SELECT session_id, tech_stack, technical_answers, updated_at
+    FROM candidates WHERE id BETWEEN ? AND ?
+"""
+
+
+def _split_json_columns(conn: sqlite3.Connection, first: int, last: int):
+    """Copy the legacy tech_stack / technical_answers JSON into the normalized tables"""
+    skills, answers = [], []
+    for session_id, tech_stack, technical_answers, updated_at in \
+            conn.execute(SELECT_JSON_COLUMNS_SQL, (first, last)).fetchall():
+        try:
+            stack = json.loads(tech_stack or "[]")
+            answered = json.loads(technical_answers or "{}")
+        except ValueError:
+            logger.warning(f"Skipping unparseable JSON columns for session {session_id}")
+            continue
+        skills += [(session_id, str(name).lower(), str(name)) for name in stack]
+        for position, (label, entry) in enumerate(answered.items(), 1):
+            digits = "".join(ch for ch in label if ch.isdigit())
+            number = int(digits) if digits else position
+            if isinstance(entry, dict):
+                answers.append((session_id, number, entry.get("question"), entry.get("answer"),
+                                entry.get("timestamp", updated_at)))
+            else:
+                answers.append((session_id, number, None, str(entry), updated_at))
+    conn.executemany(INSERT_SKILL_SQL, skills)
+    conn.executemany(UPSERT_ANSWER_SQL, answers)
+
+
+# One search document per candidate, keyed by candidates.id: the desired
+# position plus every technical answer. Triggers keep it current.
+def _answer_text(session_id: str) -> str:
+    """SQL expression for all of a candidate's answers as one string"""
+    return (f"coalesce((SELECT group_concat(answer, ' ') FROM candidate_answers "
+            f"WHERE session_id = {session_id}), '')")
+
+
+def _reindex_answers(session_id: str) -> str:
+    return (f"UPDATE candidate_fts SET answers = {_answer_text(session_id)} "
+            f"WHERE rowid = (SELECT id FROM candidates WHERE session_id = {session_id})")
+
+
+INDEX_CANDIDATES_SQL = f"""
+    INSERT OR REPLACE INTO candidate_fts (rowid, desired_position, answers)
+    SELECT id, coalesce(desired_position, ''), {_answer_text("candidates.session_id")}
+    FROM candidates WHERE id BETWEEN ? AND ?
+"""
+
+
+def _index_candidates(conn: sqlite3.Connection, first: int, last: int):
+    """Build search documents for candidates saved before the index existed"""
+    conn.execute(INDEX_CANDIDATES_SQL, (first, last))
+
+
+# Interviews finished before completed_at existed completed when the
+# assistant first replied in the conclusion stage
+STAMP_COMPLETED_SQL = """
+    UPDATE candidates SET completed_at = (
+        SELECT min(v.timestamp) FROM conversations v
+        WHERE v.session_id = candidates.session_id AND v.stage = 'conclusion' AND v.message_type = 'assistant'
+    ) WHERE id BETWEEN ? AND ? AND completed_at IS NULL
+"""
+
+
+def _stamp_completed(conn: sqlite3.Connection, first: int, last: int):
+    conn.execute(STAMP_COMPLETED_SQL, (first, last))
+
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(1, "initial schema", (
+        """
+        CREATE TABLE IF NOT EXISTS candidates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT UNIQUE NOT NULL,
+            full_name TEXT,
+            email TEXT,
+            phone TEXT,
+            experience_years TEXT,
+            desired_position TEXT,
+            location TEXT,
+            tech_stack TEXT,
+            technical_answers TEXT,
+            created_at TEXT,
+            updated_at TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS conversations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            message_type TEXT,
+            content TEXT,
+            timestamp TEXT,
+            stage TEXT,
+            FOREIGN KEY (session_id) REFERENCES candidates (session_id)
+        )
+        """,
+    )),
+    # Transcript fetches filter on session_id and order by timestamp; recruiter
+    # lookups go by email, by recency, and by position within recency.
+    Migration(2, "lookup indexes", (
+        "CREATE INDEX IF NOT EXISTS idx_conversations_session_time "
+        "ON conversations (session_id, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_candidates_email ON candidates (email)",
+        "CREATE INDEX IF NOT EXISTS idx_candidates_created ON candidates (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_candidates_position_created "
+        "ON candidates (desired_position, created_at)",
+    )),
+    Migration(3, "normalized skills and answers", (
+        """
+        CREATE TABLE IF NOT EXISTS candidate_skills (
+            session_id TEXT NOT NULL,
+            skill_key TEXT NOT NULL,
+            skill TEXT NOT NULL,
+            PRIMARY KEY (session_id, skill_key)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_candidate_skills_skill "
+        "ON candidate_skills (skill_key, session_id)",
+        """
+        CREATE TABLE IF NOT EXISTS candidate_answers (
+            session_id TEXT NOT NULL,
+            question_no INTEGER NOT NULL,
+            question TEXT,
+            answer TEXT,
+            answered_at TEXT,
+            PRIMARY KEY (session_id, question_no)
+        ) WITHOUT ROWID
+        """,
+    ), Backfill("candidates", _split_json_columns)),
+    Migration(4, "session snapshots", (
+        """
+        CREATE TABLE IF NOT EXISTS session_snapshots (
+            session_id TEXT PRIMARY KEY,
+            state TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """,
+    )),
+    Migration(5, "candidate search index", (
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS candidate_fts USING fts5(
+            desired_position, answers, tokenize = 'porter unicode61'
+        )
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_insert AFTER INSERT ON candidates BEGIN
+            INSERT INTO candidate_fts (rowid, desired_position, answers) VALUES (
+                new.id, coalesce(new.desired_position, ''), {_answer_text("new.session_id")}
+            );
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_update AFTER UPDATE OF desired_position ON candidates BEGIN
+            UPDATE candidate_fts SET desired_position = coalesce(new.desired_position, '') WHERE rowid = new.id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS candidates_fts_delete AFTER DELETE ON candidates BEGIN
+            DELETE FROM candidate_fts WHERE rowid = old.id;
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS candidate_answers_fts_insert AFTER INSERT ON candidate_answers BEGIN
+            {_reindex_answers("new.session_id")};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS candidate_answers_fts_update AFTER UPDATE OF answer ON candidate_answers BEGIN
+            {_reindex_answers("new.session_id")};
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS candidate_answers_fts_delete AFTER DELETE ON candidate_answers BEGIN
+            {_reindex_answers("old.session_id")};
+        END
+        """,
+        # Location filters are case-insensitive prefix ranges
+        "CREATE INDEX IF NOT EXISTS idx_candidates_location_created "
+        "ON candidates (location COLLATE NOCASE, created_at)",
+    ), Backfill("candidates", _index_candidates)),
+    # Transcript search indexes the stored text in place (an external content
+    # table), so messages are not kept twice. New messages are indexed in
+    # batches behind a watermark rather than by an insert trigger, keeping
+    # tokenizing off the logging path; edits and deletes of rows already
+    # indexed are mirrored by the triggers.
+    Migration(6, "conversation search index", (
+        # Message text past the stored length, zlib-compressed
+        AddColumn("conversations", "content_overflow", "BLOB"),
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS conversation_fts USING fts5(
+            content, content = 'conversations', content_rowid = 'id', tokenize = 'porter unicode61'
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS conversation_index_state (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            last_id INTEGER NOT NULL
+        )
+        """,
+        "INSERT OR IGNORE INTO conversation_index_state (id, last_id) VALUES (0, 0)",
+        """
+        CREATE TRIGGER IF NOT EXISTS conversations_fts_update AFTER UPDATE OF content ON conversations
+        WHEN old.id <= (SELECT last_id FROM conversation_index_state) BEGIN
+            INSERT INTO conversation_fts (conversation_fts, rowid, content)
+            VALUES ('delete', old.id, coalesce(old.content, ''));
+            INSERT INTO conversation_fts (rowid, content) VALUES (new.id, coalesce(new.content, ''));
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS conversations_fts_delete AFTER DELETE ON conversations
+        WHEN old.id <= (SELECT last_id FROM conversation_index_state) BEGIN
+            INSERT INTO conversation_fts (conversation_fts, rowid, content)
+            VALUES ('delete', old.id, coalesce(old.content, ''));
+        END
+        """,
+    )),
+    # Incremental exports read candidates changed since a watermark, in order
+    Migration(7, "export watermark index", (
+        "CREATE INDEX IF NOT EXISTS idx_candidates_updated ON candidates (updated_at, id)",
+    )),
+    # Incremental exports of finished interviews follow when they finished,
+    # which a profile save does not record
+    Migration(8, "interview completion time", (
+        AddColumn("candidates", "completed_at", "TEXT"),
+        "CREATE INDEX IF NOT EXISTS idx_candidates_completed ON candidates (completed_at, id)",
+    ), Backfill("candidates", _stamp_completed)),
+)
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """Highest applied schema version, 0 for a fresh database"""
+    conn.execute(CREATE_SCHEMA_VERSION_SQL)
+    return conn.execute(SELECT_VERSION_SQL).fetchone()[0]
+
+
+def _run_backfill(conn: sqlite3.Connection, migration: Migration):
+    """Run a backfill in short transactions, checkpointing after each batch
+
+    Each batch commits on its own so the write lock is only held briefly and
+    the app keeps serving while a large table is migrated; the last finished
+    rowid is stored so an interrupted backfill resumes where it stopped.
+    """
+    backfill = migration.backfill
+    row = conn.execute(SELECT_PROGRESS_SQL, (migration.version,)).fetchone()
+    last_id = row[0] if row else 0
+    max_id = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {backfill.table}").fetchone()[0]
+    started = time.perf_counter()
+    batches = 0
+
+    while last_id < max_id:
+        upper = min(last_id + backfill.batch_size, max_id)
+        with conn:
+            backfill.run(conn, last_id + 1, upper)
+            conn.execute(UPSERT_PROGRESS_SQL, (migration.version, upper))
+        last_id = upper
+        batches += 1
+
+    with conn:
+        conn.execute(DELETE_PROGRESS_SQL, (migration.version,))
+    logger.info(f"Backfill for migration {migration.version} finished: {batches} batches "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def _record_version(conn: sqlite3.Connection, migration: Migration):
+    conn.execute(INSERT_VERSION_SQL, (migration.version, migration.name, datetime.now().isoformat()))
+
+
+def migrate(conn: sqlite3.Connection, migrations: Sequence[Migration] = MIGRATIONS) -> int:
+    """Bring the database up to the latest version; returns the version reached
+
+    DDL for each migration runs under BEGIN IMMEDIATE, so when several
+    workers start at once one applies it and the rest see the new version.
+    A migration without a backfill records its version in that same
+    transaction, so it is applied exactly once. Backfills run after their
+    DDL commits and before the version is recorded, so a crash mid-backfill
+    re-runs the (repeatable) DDL and resumes the backfill on the next start.
+    """
+    conn.execute(CREATE_MIGRATION_PROGRESS_SQL)
+    version = current_version(conn)
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version <= version:
+            continue
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if current_version(conn) >= migration.version:
+                conn.rollback()  # another worker got here first
+                continue
+            for statement in migration.statements:
+                if isinstance(statement, AddColumn):
+                    statement.apply(conn)
+                else:
+                    conn.execute(statement)
+            if migration.backfill is None:
+                _record_version(conn, migration)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        if migration.backfill is not None:
+            _run_backfill(conn, migration)
+            with conn:
+                _record_version(conn, migration)
+        version = migration.version
+        logger.info(f"Applied migration {migration.version}: {migration.name}")
+    return version
@@ -0,0 +1,330 @@
+"""
+TalentScout AI Hiring Assistant - Question Bank
+Indexed on-disk question store with weighted, deduplicated sampling
+"""
+
+import hashlib
+import heapq
+import json
+import logging
+import os
+import random
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from database import ConnectionPool
+from taxonomy import DEFAULT_TAXONOMY_PATH, get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BANK_PATH = os.getenv("TALENTSCOUT_QUESTION_BANK_PATH", "question_bank.db")
+DEFAULT_SEED_PATH = Path(__file__).resolve().parent / "data" / "question_bank.json"
+
+SENIORITY_LEVELS = ("junior", "mid", "senior")
+GENERAL_TAG = "general"
+
+# How likely each difficulty is to be drawn for a seniority level; multiplied
+# into each question's own weight when the index is built.
+DIFFICULTY_WEIGHTS = {
+    "junior": {"easy": 3.0, "medium": 1.0, "hard": 0.2},
+    "mid": {"easy": 1.0, "medium": 3.0, "hard": 1.0},
+    "senior": {"easy": 0.2, "medium": 1.5, "hard": 3.0},
+}
+
+QUESTIONS_PER_TECH = 2
+MAX_QUESTIONS = 5
+MIN_QUESTIONS = 3
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS questions (
+        id INTEGER PRIMARY KEY,
+        text TEXT UNIQUE NOT NULL,
+        difficulty TEXT NOT NULL DEFAULT 'medium',
+        levels TEXT NOT NULL DEFAULT '',
+        weight REAL NOT NULL DEFAULT 1.0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS question_tags (
+        tag TEXT NOT NULL,
+        question_id INTEGER NOT NULL REFERENCES questions (id),
+        PRIMARY KEY (tag, question_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS question_history (
+        candidate_key TEXT NOT NULL,
+        question_id INTEGER NOT NULL,
+        asked_at TEXT,
+        PRIMARY KEY (candidate_key, question_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS generated_history (
+        candidate_key TEXT NOT NULL,
+        text_hash TEXT NOT NULL,
+        asked_at TEXT,
+        PRIMARY KEY (candidate_key, text_hash)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bank_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    )
+    """,
+)
+
+INSERT_QUESTION_SQL = """
+    INSERT INTO questions (text, difficulty, levels, weight) VALUES (?, ?, ?, ?)
+    ON CONFLICT (text) DO UPDATE SET
+        difficulty = excluded.difficulty, levels = excluded.levels, weight = excluded.weight
+"""
+SELECT_QUESTION_ID_SQL = "SELECT id FROM questions WHERE text = ?"
+INSERT_TAG_SQL = "INSERT OR IGNORE INTO question_tags (tag, question_id) VALUES (?, ?)"
+SELECT_INDEX_SQL = """
+    SELECT t.tag, q.id, q.text, q.difficulty, q.levels, q.weight
+    FROM question_tags t JOIN questions q ON q.id = t.question_id
+"""
+SELECT_HISTORY_SQL = "SELECT question_id FROM question_history WHERE candidate_key = ?"
+INSERT_HISTORY_SQL = """
+    INSERT OR REPLACE INTO question_history (candidate_key, question_id, asked_at) VALUES (?, ?, ?)
+"""
+SELECT_GENERATED_HISTORY_SQL = "SELECT text_hash FROM generated_history WHERE candidate_key = ?"
+INSERT_GENERATED_HISTORY_SQL = """
+    INSERT OR REPLACE INTO generated_history (candidate_key, text_hash, asked_at) VALUES (?, ?, ?)
+"""
+SELECT_META_SQL = "SELECT value FROM bank_meta WHERE key = ?"
+UPSERT_META_SQL = "INSERT OR REPLACE INTO bank_meta (key, value) VALUES (?, ?)"
+
+# Answers that mean entry level whatever numbers they contain ("fresher", "intern")
+JUNIOR_PATTERN = re.compile(r"\b(?:fresh(?:er)?|graduated?|intern(?:ship)?|entry|student|no experience|none)\b")
+
+# A number in the experience answer, and the month unit that follows it, if any
+DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(mo(?:nth)?s?\b)?")
+
+# Weighted pool of (question id, weight) per (tag, seniority level)
+Pool = Tuple[Tuple[int, float], ...]
+
+
+def seniority_from_experience(experience_years: str) -> str:
+    """Map the free-text experience answer onto junior / mid / senior"""
+    text = (experience_years or "").lower()
+    if JUNIOR_PATTERN.search(text):
+        return "junior"
+    years, months = [], []
+    for number, month_unit in DURATION_PATTERN.findall(text):
+        (months if month_unit else years).append(float(number))
+    if not years and not months:
+        return "mid"
+    # "5 years 6 months" adds up; "3-5 years" takes the top of the range
+    years = max(years, default=0) + max(months, default=0) / 12
+    if years < 2:
+        return "junior"
+    if years < 5:
+        return "mid"
+    return "senior"
+
+
+def candidate_key(email: str = "", session_id: str = "") -> str:
+    """Stable key for retake dedup; hashes the email so it is not stored twice"""
+    if email:
+        return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+    return session_id
+
+
+class QuestionBank:
+    """On-disk question store with an in-memory (tag, level) index
+
+    Questions and tags live in SQLite so the bank can hold tens of thousands
+    of entries; on load they are indexed once into immutable pools keyed by
+    (tag, seniority level), so looking up a tag is one dict access and
+    sampling only touches that tag's pool.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_BANK_PATH,
+                 seed_paths: Sequence[Path] = (DEFAULT_SEED_PATH,)):
+        self.pool = ConnectionPool(db_path)
+        self.seed_paths = tuple(Path(p) for p in seed_paths)
+        self._rng = random.Random()
+        self._pools: Mapping[Tuple[str, str], Pool] = MappingProxyType({})
+        self._text: Mapping[int, str] = MappingProxyType({})
+
+        with self.pool.transaction() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+        self._import_seeds_if_changed()
+        self.reload_index()
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    def _seed_fingerprint(self) -> str:
+        paths = self.seed_paths + (Path(DEFAULT_TAXONOMY_PATH),)
+        return ";".join(f"{p.name}:{p.stat().st_mtime_ns}" for p in paths if p.exists())
+
+    def _import_seeds_if_changed(self):
+        """Import seed files into the store when they changed since last import"""
+        fingerprint = self._seed_fingerprint()
+        row = self.pool.get_connection().execute(SELECT_META_SQL, ("seed_fingerprint",)).fetchone()
+        if row and row[0] == fingerprint:
+            return
+
+        count = 0
+        for path in self.seed_paths:
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    count += self.import_questions(json.load(f)["questions"], reload=False)
+
+        # The taxonomy's related questions are part of the bank too
+        taxonomy = get_taxonomy()
+        related = [
+            {"text": text, "tags": [tech.key], "difficulty": "medium"}
+            for tech in taxonomy.technologies.values() for text in tech.questions
+        ]
+        related += [{"text": text, "tags": [GENERAL_TAG], "difficulty": "easy"}
+                    for text in taxonomy.general_questions]
+        count += self.import_questions(related, reload=False, overwrite=False)
+
+        with self.pool.transaction() as conn:
+            conn.execute(UPSERT_META_SQL, ("seed_fingerprint", fingerprint))
+        logger.info(f"Imported {count} seed questions into question bank")
+
+    def import_questions(self, questions: Iterable[dict], reload: bool = True,
+                         overwrite: bool = True) -> int:
+        """Bulk upsert questions in one transaction
+
+        Each question is a dict with ``text``, ``tags`` and optionally
+        ``difficulty``, ``levels`` (seniority levels it applies to, default
+        all) and ``weight``. Existing questions with the same text are
+        updated unless ``overwrite`` is False.
+        """
+        count = 0
+        with self.pool.transaction() as conn:
+            for question in questions:
+                text = question["text"].strip()
+                existing = conn.execute(SELECT_QUESTION_ID_SQL, (text,)).fetchone()
+                if existing is None or overwrite:
+                    conn.execute(INSERT_QUESTION_SQL, (
+                        text,
+                        question.get("difficulty", "medium"),
+                        ",".join(question.get("levels", ())),
+                        float(question.get("weight", 1.0)),
+                    ))
+                    existing = conn.execute(SELECT_QUESTION_ID_SQL, (text,)).fetchone()
+                conn.executemany(INSERT_TAG_SQL, [(tag.lower(), existing[0]) for tag in question["tags"]])
+                count += 1
+        if reload:
+            self.reload_index()
+        return count
+
+    def reload_index(self):
+        """Rebuild the in-memory pools from the store and swap them in"""
+        pools: Dict[Tuple[str, str], List[Tuple[int, float]]] = {}
+        texts: Dict[int, str] = {}
+        for tag, question_id, text, difficulty, levels, weight in \
+                self.pool.get_connection().execute(SELECT_INDEX_SQL):
+            texts[question_id] = text
+            applies_to = levels.split(",") if levels else SENIORITY_LEVELS
+            for level in applies_to:
+                level_weight = weight * DIFFICULTY_WEIGHTS.get(level, {}).get(difficulty, 1.0)
+                if level_weight > 0:
+                    pools.setdefault((tag, level), []).append((question_id, level_weight))
+
+        self._pools = MappingProxyType({key: tuple(pool) for key, pool in pools.items()})
+        self._text = MappingProxyType(texts)
+        logger.info(f"Question bank indexed: {len(texts)} questions, {len(pools)} pools")
+
+    def seed(self, value):
+        """Reseed sampling, so the same draws can be repeated"""
+        self._rng.seed(value)
+
+    def tags(self) -> Set[str]:
+        """Every tag with at least one question"""
+        return {tag for tag, _ in self._pools}
+
+    def _sample(self, pool: Pool, k: int, exclude: Set[int], avoid: Set[int]) -> List[int]:
+        """Weighted sampling without replacement (Efraimidis-Spirakis)
+
+        Questions in ``exclude`` are never returned; questions in ``avoid``
+        (already asked in an earlier attempt) are used only once the rest
+        of the pool is exhausted.
+        """
+        fresh = [(qid, w) for qid, w in pool if qid not in exclude and qid not in avoid]
+        picked = heapq.nlargest(k, fresh, key=lambda item: self._rng.random() ** (1.0 / item[1]))
+        if len(picked) < k:
+            seen = [(qid, w) for qid, w in pool if qid not in exclude and qid in avoid]
+            picked += heapq.nlargest(k - len(picked), seen,
+                                     key=lambda item: self._rng.random() ** (1.0 / item[1]))
+        return [qid for qid, _ in picked]
+
+    def asked_questions(self, key: str) -> Set[int]:
+        """Question ids already put to a candidate"""
+        if not key:
+            return set()
+        rows = self.pool.get_connection().execute(SELECT_HISTORY_SQL, (key,))
+        return {row[0] for row in rows}
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha256(" ".join(text.lower().split()).encode("utf-8")).hexdigest()
+
+    def unasked_generated(self, key: str, questions: Sequence[str]) -> List[str]:
+        """Generated questions not yet put to a candidate, recording them as asked
+
+        Questions from outside the bank, e.g. an LLM's, are remembered by a
+        hash of their normalized text so a retake is not served them again.
+        """
+        if not key:
+            return list(questions)
+        rows = self.pool.get_connection().execute(SELECT_GENERATED_HISTORY_SQL, (key,))
+        asked = {row[0] for row in rows}
+        fresh = [q for q in questions if self._text_hash(q) not in asked]
+        if fresh:
+            now = datetime.now().isoformat()
+            with self.pool.transaction() as conn:
+                conn.executemany(INSERT_GENERATED_HISTORY_SQL,
+                                 [(key, self._text_hash(q), now) for q in fresh])
+        return fresh
+
+    def select(self, tags: Sequence[str], seniority: str = "mid", key: str = "",
+               per_tag: int = QUESTIONS_PER_TECH, limit: int = MAX_QUESTIONS,
+               minimum: int = MIN_QUESTIONS) -> List[str]:
+        """Pick questions for a candidate and record them against ``key``"""
+        asked = self.asked_questions(key)
+        chosen: List[int] = []
+
+        for tag in tags:
+            if len(chosen) >= limit:
+                break
+            pool = self._pools.get((tag.lower(), seniority), ())
+            chosen += self._sample(pool, min(per_tag, limit - len(chosen)), set(chosen), asked)
+
+        if len(chosen) < minimum:
+            pool = self._pools.get((GENERAL_TAG, seniority), ())
+            chosen += self._sample(pool, minimum - len(chosen), set(chosen), asked)
+
+        if key and chosen:
+            now = datetime.now().isoformat()
+            with self.pool.transaction() as conn:
+                conn.executemany(INSERT_HISTORY_SQL, [(key, qid, now) for qid in chosen])
+        return [self._text[qid] for qid in chosen]
+
+
+_question_bank: Optional[QuestionBank] = None
+_question_bank_lock = threading.Lock()
+
+
+def get_question_bank() -> QuestionBank:
+    """Get the process-wide QuestionBank, creating it on first use"""
+    global _question_bank
+    if _question_bank is None:
+        with _question_bank_lock:
+            if _question_bank is None:
+                _question_bank = QuestionBank()
+    return _question_bank
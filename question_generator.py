@@ -0,0 +1,340 @@
+"""
+TalentScout AI Hiring Assistant - Question Generation
+Pluggable question generators with an LLM response cache and offline stub backend
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from question_bank import MAX_QUESTIONS, get_question_bank
+
+logger = logging.getLogger(__name__)
+
+# "bank" (default) or "llm"; candidate data only goes to a model when "llm" is chosen
+QUESTION_BACKEND = os.getenv("TALENTSCOUT_QUESTION_BACKEND") or os.getenv("TALENTSCOUT_QUESTION_GENERATOR", "bank")
+LLM_BACKEND = os.getenv("TALENTSCOUT_LLM_BACKEND", "")
+LLM_MODEL = os.getenv("TALENTSCOUT_LLM_MODEL", "gpt-4o-mini")
+LLM_TIMEOUT = float(os.getenv("TALENTSCOUT_LLM_TIMEOUT", "20"))
+CACHE_PATH = os.getenv("TALENTSCOUT_LLM_CACHE_PATH", "question_cache.jsonl")
+CACHE_MAX_ENTRIES = int(os.getenv("TALENTSCOUT_LLM_CACHE_SIZE", "5000"))
+CACHE_TTL_SECONDS = float(os.getenv("TALENTSCOUT_LLM_CACHE_TTL", str(7 * 24 * 3600)))
+
+PROMPT_TEMPLATE = """You are screening a candidate for a {position} role.
+Seniority: {seniority}.
+Tech stack: {tech_stack}.
+
+Write {count} concise technical interview questions that test practical
+understanding of this stack at this seniority. Return one question per line,
+numbered "1." to "{count}.", with no other text."""
+
+
+class QuestionRequest(NamedTuple):
+    """What a generator needs to know about the candidate"""
+    tech_stack: Tuple[str, ...]
+    seniority: str = "mid"
+    position: str = ""
+    count: int = MAX_QUESTIONS
+
+    def cache_key(self) -> str:
+        """Content address: normalized stack + seniority + position + count"""
+        normalized = {
+            "tech_stack": sorted({tech.strip().lower() for tech in self.tech_stack}),
+            "seniority": self.seniority.strip().lower(),
+            "position": " ".join(self.position.lower().split()),
+            "count": self.count,
+        }
+        payload = json.dumps(normalized, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def prompt(self) -> str:
+        return PROMPT_TEMPLATE.format(
+            position=self.position or "software engineering",
+            seniority=self.seniority,
+            tech_stack=", ".join(self.tech_stack) or "general software engineering",
+            count=self.count,
+        )
+
+
+def parse_questions(text: str, limit: int) -> List[str]:
+    """Pull numbered or bulleted questions out of a model completion"""
+    questions = []
+    for line in text.splitlines():
+        line = re.sub(r"^\s*(?:\d+[.)]|[-*•])\s*", "", line).strip()
+        if line:
+            questions.append(line)
+    return questions[:limit]
+
+
+class ResponseCache:
+    """LRU + TTL cache of generated questions, persisted as an append-only JSONL log
+
+    Each put appends one line; on load the log is replayed, expired entries
+    are dropped and the file is compacted.
+    """
+
+    def __init__(self, path: Optional[str] = CACHE_PATH, max_entries: int = CACHE_MAX_ENTRIES,
+                 ttl: float = CACHE_TTL_SECONDS):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+        now = time.time()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a torn last line from a crash
+                    if now - entry["created"] < self.ttl:
+                        self._entries[entry["key"]] = (entry["created"], entry["questions"])
+                        self._entries.move_to_end(entry["key"])
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._compact()
+        except OSError as e:
+            logger.error(f"Error loading question cache: {e}")
+
+    def _compact(self):
+        """Rewrite the log with only the live entries"""
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, (created, questions) in self._entries.items():
+                f.write(json.dumps({"key": key, "created": created, "questions": questions}) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str, count: bool = True) -> Optional[List[str]]:
+        """Cached questions for a key; ``count=False`` leaves hit and miss counts alone"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] >= self.ttl:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += count
+                return None
+            self._entries.move_to_end(key)
+            self.hits += count
+            return list(entry[1])
+
+    def put(self, key: str, questions: List[str]):
+        created = time.time()
+        with self._lock:
+            self._entries[key] = (created, list(questions))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.path is not None:
+                try:
+                    with open(self.path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps({"key": key, "created": created, "questions": questions}) + "\n")
+                except OSError as e:
+                    logger.error(f"Error persisting question cache: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class StubLLMBackend:
+    """Deterministic offline backend: same prompt, same questions, no network"""
+
+    name = "stub"
+
+    TEMPLATES = (
+        "How have you used {tech} in a production {position} project?",
+        "What is a common performance pitfall in {tech}, and how do you avoid it?",
+        "How do you test code that depends on {tech}?",
+        "Describe how you would debug a failure involving {tech}.",
+        "What trade-offs would you weigh when choosing {tech} for a new service?",
+        "How would you explain the core concepts of {tech} to a {seniority} colleague?",
+    )
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def complete(self, request: QuestionRequest) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        digest = int(request.cache_key(), 16)
+        techs = sorted(request.tech_stack) or ["software engineering"]
+        lines = []
+        for i in range(request.count):
+            template = self.TEMPLATES[(digest + i) % len(self.TEMPLATES)]
+            lines.append(f"{i + 1}. " + template.format(
+                tech=techs[i % len(techs)],
+                position=request.position or "engineering",
+                seniority=request.seniority,
+            ))
+        return "\n".join(lines)
+
+
+class OpenAIBackend:
+    """Chat-completion backend; needs the optional ``openai`` package"""
+
+    name = "openai"
+
+    def __init__(self, model: str = LLM_MODEL, timeout: float = LLM_TIMEOUT):
+        try:
+            from openai import OpenAI
+        except ImportError as e:
+            raise RuntimeError("The openai package is required for the OpenAI backend") from e
+        self.model = model
+        self.client = OpenAI(timeout=timeout)
+
+    def complete(self, request: QuestionRequest) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": request.prompt()}],
+            temperature=0.7,
+        )
+        return response.choices[0].message.content or ""
+
+
+class BankQuestionGenerator:
+    """Draws questions from the indexed question bank"""
+
+    name = "bank"
+
+    def generate(self, request: QuestionRequest, candidate_key: str = "") -> List[str]:
+        return get_question_bank().select(
+            request.tech_stack, seniority=request.seniority, key=candidate_key, limit=request.count
+        )
+
+
+class LLMQuestionGenerator:
+    """Generates questions with an LLM backend behind a shared response cache
+
+    Identical requests (same normalized stack, seniority and position) are
+    served from the cache; concurrent identical misses are coalesced so only
+    one of them calls the model and the rest wait on its result. Questions a
+    candidate was already asked are left out and topped up from the question
+    bank, so a retake gets fresh ones. Any backend failure falls back to the
+    question bank.
+    """
+
+    def __init__(self, backend, cache: Optional[ResponseCache] = None,
+                 fallback: Optional[BankQuestionGenerator] = None):
+        self.backend = backend
+        self.cache = cache if cache is not None else ResponseCache()
+        self.fallback = fallback or BankQuestionGenerator()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    @property
+    def name(self) -> str:
+        return f"llm:{self.backend.name}"
+
+    def generate(self, request: QuestionRequest, candidate_key: str = "") -> List[str]:
+        questions = self._shared_questions(request)
+        if questions is None:
+            return self.fallback.generate(request, candidate_key)
+        fresh = get_question_bank().unasked_generated(candidate_key, questions)
+        missing = len(questions) - len(fresh)
+        if missing:
+            fresh += self.fallback.generate(request._replace(count=missing), candidate_key)[:missing]
+        return fresh
+
+    def _shared_questions(self, request: QuestionRequest) -> Optional[List[str]]:
+        """Questions for a request from the cache or the model; None if the model failed"""
+        key = request.cache_key()
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            # The leader caches its result before leaving _inflight, so a
+            # request missing both has really not been generated yet
+            cached = self.cache.get(key, count=False)
+            if cached is not None:
+                return cached
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            try:
+                return list(future.result(timeout=LLM_TIMEOUT))
+            except Exception as e:
+                logger.error(f"Coalesced question generation failed: {e}")
+                return None
+
+        try:
+            started = time.perf_counter()
+            questions = parse_questions(self.backend.complete(request), request.count)
+            if not questions:
+                raise ValueError("backend returned no questions")
+            logger.info(f"Generated {len(questions)} questions with {self.name} "
+                        f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+            self.cache.put(key, questions)
+            future.set_result(questions)
+            return list(questions)
+        except Exception as e:
+            future.set_exception(e)
+            logger.error(f"Question generation with {self.name} failed, using question bank: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+def create_question_generator(kind: str = QUESTION_BACKEND, backend: str = LLM_BACKEND):
+    """Build a generator from configuration
+
+    ``kind`` is "bank" or "llm". An LLM is never used unless asked for, as it
+    sends the candidate's stack and position to the model provider.
+    ``backend`` is "openai" or "stub"; left empty it is "openai" when an
+    OpenAI key is configured.
+    """
+    kind = kind or "bank"
+    if kind == "bank":
+        return BankQuestionGenerator()
+    if kind != "llm":
+        raise ValueError(f"Unknown question generator: {kind}")
+
+    backend = backend or ("openai" if os.getenv("OPENAI_API_KEY") else "stub")
+    if backend == "stub":
+        return LLMQuestionGenerator(StubLLMBackend())
+    if backend == "openai":
+        try:
+            return LLMQuestionGenerator(OpenAIBackend())
+        except RuntimeError as e:
+            logger.error(f"{e}; falling back to the question bank")
+            return BankQuestionGenerator()
+    raise ValueError(f"Unknown LLM backend: {backend}")
+
+
+_question_generator = None
+_question_generator_lock = threading.Lock()
+
+
+def get_question_generator():
+    """Get the process-wide question generator, creating it on first use"""
+    global _question_generator
+    if _question_generator is None:
+        with _question_generator_lock:
+            if _question_generator is None:
+                _question_generator = create_question_generator()
+                logger.info(f"Using question generator: {_question_generator.name}")
+    return _question_generator
@@ -0,0 +1,199 @@
+"""
+TalentScout AI Hiring Assistant - Recruiter Dashboard
+Paginated, filterable candidate search over the interview database
+"""
+
+import streamlit as st
+import hmac
+import logging
+import os
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from candidate_search import COUNT_CAP, PAGE_SIZE, CandidateCount, CandidateFilters, get_candidate_search
+from conversation_search import get_conversation_search
+from database import get_database_manager
+
+st.set_page_config(
+    page_title="TalentScout AI - Recruiter Dashboard",
+    page_icon="🔎",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# When set, the dashboard asks for this password before showing any candidate data
+RECRUITER_PASSWORD = os.getenv("TALENTSCOUT_RECRUITER_PASSWORD", "")
+
+# Without a password candidate data is only served on these server addresses
+LOCAL_ADDRESSES = ("127.0.0.1", "localhost", "::1")
+
+TABLE_COLUMNS = {
+    "full_name": "Name",
+    "email": "Email",
+    "experience_years": "Experience",
+    "desired_position": "Position",
+    "location": "Location",
+    "created_at": "Applied",
+}
+
+
+def require_password():
+    """Stop the script run until this browser session has entered the dashboard password
+
+    Without a configured password the dashboard only runs when the server
+    is bound to the local machine, however it was launched.
+    """
+    if not RECRUITER_PASSWORD:
+        address = st.get_option("server.address") or ""
+        if address not in LOCAL_ADDRESSES:
+            logger.error(f"Refusing to serve candidate data on {address or 'all interfaces'} without a password")
+            st.error("Start the dashboard with --server.address 127.0.0.1, "
+                     "or set TALENTSCOUT_RECRUITER_PASSWORD to serve it on other addresses.")
+            st.stop()
+        return
+    if st.session_state.get("recruiter_authenticated"):
+        return
+    password = st.text_input("Dashboard password", type="password")
+    if password:
+        if hmac.compare_digest(password.encode(), RECRUITER_PASSWORD.encode()):
+            st.session_state.recruiter_authenticated = True
+            st.rerun()
+        logger.warning("Rejected recruiter dashboard password")
+        st.error("Incorrect password.")
+    st.stop()
+
+
+def read_filters() -> CandidateFilters:
+    """Search criteria from the sidebar"""
+    st.sidebar.header("🔎 Filters")
+    text = st.sidebar.text_input("Search answers and positions")
+    skill = st.sidebar.text_input("Skill", placeholder="e.g. Python")
+    position = st.sidebar.text_input("Position")
+    location = st.sidebar.text_input("Location starts with")
+    use_dates = st.sidebar.checkbox("Filter by application date")
+    created_from = created_to = ""
+    if use_dates:
+        today = date.today()
+        # Holds one date while the second end of the range is being picked
+        picked = st.sidebar.date_input("Applied between", value=(today.replace(day=1), today))
+        if picked:
+            created_from, created_to = picked[0].isoformat(), picked[-1].isoformat()
+    return CandidateFilters(skill, position, location, created_from, created_to, text).normalized()
+
+
+def page_cursors(filters: CandidateFilters) -> List[Tuple[Optional[int], int]]:
+    """Cursor and first row number of the pages visited so far, reset whenever the filters change
+
+    Keyset pages can only be reached from the one before, so going back
+    pops the stack instead of re-querying with an offset. Pages cut short
+    by the search budget hold fewer rows, hence the row numbers.
+    """
+    if st.session_state.get("search_filters") != filters:
+        st.session_state.search_filters = filters
+        st.session_state.search_cursors = [(None, 0)]
+    return st.session_state.search_cursors
+
+
+def format_count(count: CandidateCount) -> str:
+    if count.exact:
+        return f"{count.total:,}"
+    return f"{COUNT_CAP:,}+" if count.total >= COUNT_CAP else f"~{count.total:,}"
+
+
+def render_candidate(row: Dict):
+    """Profile, skills and technical answers of one candidate"""
+    db = get_database_manager()
+    st.subheader(f"👤 {row['full_name'] or 'Unnamed candidate'}")
+    left, right = st.columns(2)
+    left.markdown(f"📧 {row['email'] or '—'}  \n⏱️ {row['experience_years'] or '—'}")
+    right.markdown(f"💼 {row['desired_position'] or '—'}  \n📍 {row['location'] or '—'}")
+    skills = db.get_skills(row["session_id"])
+    if skills:
+        st.markdown(" ".join(f"`{skill}`" for skill in skills))
+    for answer in db.get_answers(row["session_id"]):
+        with st.expander(f"Q{answer['question_no']}: {answer['question']}"):
+            st.write(answer["answer"])
+
+
+def render_transcript_search():
+    """Sessions whose interview messages match a query, with highlighted snippets"""
+    query = st.text_input("Search interview transcripts", placeholder="e.g. deadlock postgres")
+    if not query.strip():
+        return
+    try:
+        hits = get_conversation_search().search(query)
+    except Exception as e:
+        logger.error(f"Error searching transcripts: {e}")
+        st.error("Transcript search failed, please try again.")
+        return
+    if not hits:
+        st.info("No messages match this search.")
+        return
+    for hit in hits:
+        plural = "s" if hit.hits > 1 else ""
+        with st.expander(f"Session {hit.session_id[:8]} · {hit.hits} matching message{plural}"):
+            for snippet in hit.snippets:
+                st.markdown(f"*{snippet.message_type} · {snippet.stage}* — {snippet.text}")
+
+
+def render_candidate_search(filters: CandidateFilters):
+    search = get_candidate_search()
+    cursors = page_cursors(filters)
+
+    try:
+        cursor, first = cursors[-1]
+        page = search.search(filters, cursor, PAGE_SIZE)
+        total = search.count(filters)
+    except Exception as e:
+        logger.error(f"Error searching candidates: {e}")
+        st.error("Search failed, please adjust the filters and try again.")
+        return
+
+    shown = f" · showing {first + 1}–{first + len(page.rows)}" if page.rows else ""
+    st.caption(f"{format_count(total)} candidates{shown}")
+
+    prev_col, next_col, _ = st.columns([1, 1, 6])
+    if prev_col.button("◀ Previous", disabled=len(cursors) == 1):
+        cursors.pop()
+        st.rerun()
+    if next_col.button("Next ▶", disabled=page.next_cursor is None):
+        cursors.append((page.next_cursor, first + len(page.rows)))
+        st.rerun()
+
+    if not page.rows:
+        if page.next_cursor is None:
+            st.info("No candidates match these filters.")
+        else:
+            st.info("No matches among the candidates searched so far, press Next to search older ones.")
+        return
+
+    st.dataframe(
+        [{label: row[column] for column, label in TABLE_COLUMNS.items()} for row in page.rows],
+        hide_index=True,
+    )
+
+    labels = [f"{row['full_name'] or 'Unnamed'} · {row['desired_position'] or '—'} · #{row['id']}"
+              for row in page.rows]
+    selected = st.selectbox("Candidate details", range(len(page.rows)), format_func=labels.__getitem__)
+    render_candidate(page.rows[selected])
+
+
+def main():
+    st.title("🔎 TalentScout Recruiter Dashboard")
+    require_password()
+    filters = read_filters()
+    candidates_tab, transcripts_tab = st.tabs(["👥 Candidates", "💬 Transcripts"])
+    with candidates_tab:
+        render_candidate_search(filters)
+    with transcripts_tab:
+        render_transcript_search()
+
+
+if __name__ == "__main__":
+    main()
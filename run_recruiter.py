@@ -0,0 +1,35 @@
+"""
+Launch script for the recruiter dashboard
+"""
+import os
+import subprocess
+import sys
+
+# Candidate data stays on this machine unless an address is chosen explicitly
+ADDRESS = os.getenv("TALENTSCOUT_RECRUITER_ADDRESS", "127.0.0.1")
+
+def main():
+    """Launch the recruiter dashboard"""
+    try:
+        print("🚀 Starting TalentScout AI Recruiter Dashboard")
+        print("📱 Open your browser and go to: http://localhost:8502")
+        print("⏹️  Press Ctrl+C to stop the server")
+        if ADDRESS not in ("127.0.0.1", "localhost") and not os.getenv("TALENTSCOUT_RECRUITER_PASSWORD"):
+            print(f"⚠️  Listening on {ADDRESS} without TALENTSCOUT_RECRUITER_PASSWORD set")
+        print("-" * 50)
+        
+        subprocess.run([
+            sys.executable, "-m", "streamlit", "run", "recruiter_app.py",
+            "--server.port", "8502",
+            "--server.address", ADDRESS,
+            "--theme.primaryColor", "#667eea",
+            "--theme.backgroundColor", "#ffffff",
+            "--theme.secondaryBackgroundColor", "#f8f9fa"
+        ])
+    except KeyboardInterrupt:
+        print("\n👋 Thanks for using TalentScout AI Hiring Assistant!")
+    except Exception as e:
+        print(f"❌ Error starting the app: {e}")
+
+if __name__ == "__main__":
+    main()
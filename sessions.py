@@ -0,0 +1,330 @@
+"""
+TalentScout AI Hiring Assistant - Session Registry
+Lock-protected per-candidate sessions with idle eviction, memory accounting and spilling
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL_SECONDS = float(os.getenv("TALENTSCOUT_SESSION_TTL", "1800"))
+MAX_SESSIONS = int(os.getenv("TALENTSCOUT_MAX_SESSIONS", "1000"))
+SESSION_MEMORY_BUDGET = int(float(os.getenv("TALENTSCOUT_SESSION_MEMORY_BUDGET_MB", "256")) * 1024 * 1024)
+
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """Approximate deep size of an object graph in bytes"""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        size += estimate_size(vars(obj), _seen)
+    for slot in getattr(type(obj), "__slots__", ()):
+        if hasattr(obj, slot):
+            size += estimate_size(getattr(obj, slot), _seen)
+    return size
+
+
+class DatabaseSessionStore:
+    """Spills sessions to the database as JSON snapshots
+
+    ``to_state`` turns a session object into a JSON-serializable dict and
+    ``from_state`` rebuilds it.
+    """
+
+    def __init__(self, db_manager, to_state: Callable[[Any], dict],
+                 from_state: Callable[[dict], Any]):
+        self.db_manager = db_manager
+        self.to_state = to_state
+        self.from_state = from_state
+
+    def save(self, session_id: str, value: Any):
+        self.db_manager.save_session_snapshot(session_id, self.to_state(value))
+
+    def load(self, session_id: str) -> Optional[Any]:
+        state = self.db_manager.load_session_snapshot(session_id)
+        return None if state is None else self.from_state(state)
+
+    def delete(self, session_id: str):
+        self.db_manager.delete_session_snapshot(session_id)
+
+
+class _Session:
+    """Registry entry: the session object plus its lock, access time and size"""
+
+    __slots__ = ("value", "lock", "created_at", "last_access", "size")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.lock = threading.Lock()
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+        self.size = 0
+
+
+class SessionRegistry:
+    """Concurrent map of session id -> session object
+
+    Sessions idle for longer than ``ttl`` seconds are evicted, and once the
+    registry holds ``max_sessions`` or its sessions together exceed
+    ``memory_budget`` bytes the least recently used idle ones are evicted.
+    Each session is measured with ``sizeof`` whenever it is released, so
+    sessions that grow should pass a ``sizeof`` that tracks their size as
+    they change rather than walking the whole object each time.
+    With a ``store``, evicted sessions are spilled to it instead of being
+    dropped and are loaded back transparently on their next access.
+    Access to a single session is serialized through its own lock so two
+    requests from the same browser cannot interleave, while different
+    sessions proceed in parallel.
+    """
+
+    def __init__(self, factory: Callable[[], Any], ttl: float = SESSION_TTL_SECONDS,
+                 max_sessions: int = MAX_SESSIONS, store: Optional[DatabaseSessionStore] = None,
+                 memory_budget: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = estimate_size):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.factory = factory
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.store = store
+        self.memory_budget = memory_budget
+        self.sizeof = sizeof
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        # Sessions on their way to the store; still served from memory until written
+        self._spilling: Dict[str, _Session] = {}
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._evicted = 0
+        self._spilled = 0
+        self._restored = 0
+
+    def _over_limits(self, now: float, entry: _Session) -> bool:
+        return (now - entry.last_access >= self.ttl
+                or len(self._sessions) > self.max_sessions
+                or (self.memory_budget is not None and self._total_bytes > self.memory_budget))
+
+    def _evict_locked(self, now: float, keep: Optional[_Session] = None) -> List[Tuple[str, _Session]]:
+        """Detach idle sessions past the TTL, size cap or memory budget; caller holds the lock
+
+        Returns the detached sessions so the caller can spill them after
+        releasing the lock. ``keep`` and sessions currently held by a
+        request are never evicted.
+        """
+        victims = []
+        # OrderedDict is kept in access order, so the least recently used come first
+        for session_id, entry in list(self._sessions.items()):
+            if not self._over_limits(now, entry):
+                break
+            if entry is keep or entry.lock.locked():
+                continue
+            del self._sessions[session_id]
+            self._total_bytes -= entry.size
+            self._evicted += 1
+            if self.store is not None:
+                self._spilling[session_id] = entry
+                victims.append((session_id, entry))
+            else:
+                logger.info(f"Evicted idle session: {session_id}")
+        return victims
+
+    def _spill(self, victims: List[Tuple[str, _Session]]):
+        """Write detached sessions to the store"""
+        for session_id, entry in victims:
+            try:
+                with entry.lock:
+                    self.store.save(session_id, entry.value)
+                self._spilled += 1
+                logger.debug(f"Spilled idle session to store: {session_id}")
+            except Exception as e:
+                logger.error(f"Error spilling session {session_id}, dropping it: {e}")
+            finally:
+                with self._lock:
+                    if self._spilling.get(session_id) is entry:
+                        del self._spilling[session_id]
+
+    def _load_or_create(self, session_id: str) -> _Session:
+        """Entry for a session id missing from memory; caller holds the lock"""
+        entry = self._spilling.pop(session_id, None)
+        if entry is not None:
+            return entry
+        value = None
+        if self.store is not None:
+            try:
+                value = self.store.load(session_id)
+            except Exception as e:
+                logger.error(f"Error loading spilled session {session_id}: {e}")
+            if value is not None:
+                self._restored += 1
+        return _Session(value if value is not None else self.factory())
+
+    def _touch(self, session_id: Optional[str]) -> Tuple[str, _Session]:
+        """Look up, reload or create a session entry and mark it most recently used"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id) if session_id else None
+            if entry is None:
+                session_id = session_id or str(uuid.uuid4())
+                entry = self._load_or_create(session_id)
+                self._sessions[session_id] = entry
+                self._total_bytes += entry.size
+            else:
+                self._sessions.move_to_end(session_id)
+            entry.last_access = now
+            victims = self._evict_locked(now, keep=entry)
+        if victims:
+            self._spill(victims)
+        return session_id, entry
+
+    def _resize(self, session_id: str, entry: _Session):
+        """Re-measure a session after use and enforce the memory budget
+
+        Without a budget nothing reads the sizes, so sessions are not measured.
+        """
+        size = self.sizeof(entry.value) if self.memory_budget is not None else 0
+        with self._lock:
+            if self._sessions.get(session_id) is entry:
+                self._total_bytes += size - entry.size
+            entry.size = size
+            victims = self._evict_locked(time.monotonic(), keep=entry)
+        if victims:
+            self._spill(victims)
+
+    @contextmanager
+    def session(self, session_id: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        """Hold a session exclusively; creates one if the id is unknown"""
+        session_id, entry = self._touch(session_id)
+        try:
+            with entry.lock:
+                yield session_id, entry.value
+        finally:
+            self._resize(session_id, entry)
+
+    def reset(self, session_id: Optional[str] = None) -> str:
+        """Replace a session's object with a fresh one, keeping its id"""
+        session_id, entry = self._touch(session_id)
+        with entry.lock:
+            entry.value = self.factory()
+        self._resize(session_id, entry)
+        return session_id
+
+    def checkpoint(self, session_id: str, value: Any) -> bool:
+        """Write a session to the store now, so any worker can resume it"""
+        if self.store is None:
+            return False
+        try:
+            self.store.save(session_id, value)
+            return True
+        except Exception as e:
+            logger.error(f"Error checkpointing session {session_id}: {e}")
+            return False
+
+    def restore(self, session_id: str) -> bool:
+        """Make a session live again when it is resumed on a new connection
+
+        A copy still held in memory is the newest one, since every reply
+        is checkpointed from it, so it is kept as is; the store is only
+        read on a miss. Returns False if neither has the session.
+        """
+        with self._lock:
+            if self._resume_locked(session_id):
+                return True
+        if self.store is None:
+            return False
+        try:
+            value = self.store.load(session_id)
+        except Exception as e:
+            logger.error(f"Error restoring session {session_id}: {e}")
+            return False
+        if value is None:
+            return False
+        with self._lock:
+            # Another request may have brought it back while the store was read
+            if not self._resume_locked(session_id):
+                self._sessions[session_id] = _Session(value)
+                self._restored += 1
+        return True
+
+    def _resume_locked(self, session_id: str) -> bool:
+        """Mark a session held in memory most recently used; caller holds the lock"""
+        entry = self._sessions.get(session_id)
+        if entry is not None:
+            self._sessions.move_to_end(session_id)
+        else:
+            entry = self._spilling.pop(session_id, None)
+            if entry is None:
+                return False
+            self._sessions[session_id] = entry
+            self._total_bytes += entry.size
+        entry.last_access = time.monotonic()
+        return True
+
+    def remove(self, session_id: str):
+        """Forget a session, including any copy spilled to the store"""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+            self._spilling.pop(session_id, None)
+        if self.store is not None:
+            self.store.delete(session_id)
+
+    def evict_expired(self) -> int:
+        """Evict idle sessions now; returns how many were removed"""
+        with self._lock:
+            before = self._evicted
+            victims = self._evict_locked(time.monotonic())
+            removed = self._evicted - before
+        if victims:
+            self._spill(victims)
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Estimated bytes held by each live session, measured now"""
+        with self._lock:
+            entries = list(self._sessions.items())
+        return {session_id: self.sizeof(entry.value) for session_id, entry in entries}
+
+    def get_stats(self) -> Dict[str, float]:
+        """Session counts and memory accounting for monitoring
+
+        Sizes are the ones recorded when each session was last released, so
+        this is cheap enough to call on every request.
+        """
+        with self._lock:
+            sizes = [entry.size for entry in self._sessions.values()]
+            stats = {
+                "sessions": len(sizes),
+                "evicted": self._evicted,
+                "spilled": self._spilled,
+                "restored": self._restored,
+                "total_bytes": self._total_bytes,
+                "memory_budget": self.memory_budget or 0,
+            }
+        stats["avg_bytes"] = stats["total_bytes"] / len(sizes) if sizes else 0
+        stats["max_bytes"] = max(sizes) if sizes else 0
+        return stats
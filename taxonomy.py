@@ -0,0 +1,146 @@
+"""
+TalentScout AI Hiring Assistant - Technology Taxonomy
+Shared, immutable technology index loaded from data/tech_taxonomy.json
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from tech_matcher import TechMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TAXONOMY_PATH = Path(os.getenv(
+    "TALENTSCOUT_TAXONOMY_PATH",
+    Path(__file__).resolve().parent / "data" / "tech_taxonomy.json"
+))
+RELOAD_CHECK_INTERVAL = float(os.getenv("TALENTSCOUT_TAXONOMY_RELOAD_INTERVAL", "2.0"))
+
+
+@dataclass(frozen=True)
+class Technology:
+    """One technology: canonical name, category, aliases and related questions"""
+    key: str
+    name: str
+    category: str
+    aliases: Tuple[str, ...] = ()
+    questions: Tuple[str, ...] = ()
+
+
+class Taxonomy:
+    """Immutable technology index shared by every assistant in the process"""
+
+    def __init__(self, technologies: Tuple[Technology, ...],
+                 general_questions: Tuple[str, ...], version: int = 1):
+        self.version = version
+        self.general_questions = general_questions
+        self.technologies: Mapping[str, Technology] = MappingProxyType(
+            {tech.key: tech for tech in technologies}
+        )
+        # Lookups arrive both as keys ("node.js") and display names ("Node.js")
+        self._by_lower_name: Mapping[str, Technology] = MappingProxyType(
+            {**{tech.name.lower(): tech for tech in technologies},
+             **{tech.key: tech for tech in technologies}}
+        )
+
+        categories = {}
+        for tech in technologies:
+            categories.setdefault(tech.category, []).append(tech.key)
+        self.categories: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+            {category: tuple(keys) for category, keys in categories.items()}
+        )
+        self.matcher = TechMatcher(
+            categories,
+            {alias: tech.key for tech in technologies for alias in tech.aliases},
+            {tech.key: tech.name for tech in technologies},
+        )
+
+    def __len__(self) -> int:
+        return len(self.technologies)
+
+    def get(self, name: str) -> Optional[Technology]:
+        """Look up a technology by key or display name, case-insensitively"""
+        return self._by_lower_name.get(name.lower())
+
+    def key_for(self, name: str) -> str:
+        """Canonical key for a technology name, or the lowercased name if unknown"""
+        tech = self.get(name)
+        return tech.key if tech else name.lower()
+
+    def questions_for(self, name: str) -> Tuple[str, ...]:
+        """Related questions for a technology, empty if none are known"""
+        tech = self.get(name)
+        return tech.questions if tech else ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Taxonomy":
+        """Build a taxonomy from its parsed JSON document"""
+        technologies = tuple(
+            Technology(
+                key=entry["key"],
+                name=entry.get("name", entry["key"].title()),
+                category=entry["category"],
+                aliases=tuple(entry.get("aliases", ())),
+                questions=tuple(entry.get("questions", ())),
+            )
+            for entry in data["technologies"]
+        )
+        return cls(technologies, tuple(data.get("general_questions", ())), data.get("version", 1))
+
+
+def load_taxonomy(path: Path = DEFAULT_TAXONOMY_PATH) -> Taxonomy:
+    """Parse and index a taxonomy file"""
+    with open(path, encoding="utf-8") as f:
+        return Taxonomy.from_dict(json.load(f))
+
+
+class _TaxonomyHolder:
+    """Holds the current taxonomy and swaps it when the file changes"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._taxonomy: Optional[Taxonomy] = None
+        self._mtime = 0.0
+        self._next_check = 0.0
+
+    def get(self) -> Taxonomy:
+        now = time.monotonic()
+        if self._taxonomy is None or now >= self._next_check:
+            with self._lock:
+                if self._taxonomy is None or now >= self._next_check:
+                    self._reload_if_changed()
+                    self._next_check = now + RELOAD_CHECK_INTERVAL
+        return self._taxonomy
+
+    def _reload_if_changed(self):
+        """Re-read the file if its mtime moved; keep the old index on errors"""
+        try:
+            mtime = self.path.stat().st_mtime
+            if self._taxonomy is not None and mtime == self._mtime:
+                return
+            taxonomy = load_taxonomy(self.path)
+        except (OSError, ValueError, KeyError) as e:
+            if self._taxonomy is None:
+                raise
+            logger.error(f"Error reloading taxonomy, keeping previous version: {e}")
+            return
+        # A single reference assignment, so readers see the old or new index, never a mix
+        self._taxonomy = taxonomy
+        self._mtime = mtime
+        logger.info(f"Loaded taxonomy with {len(taxonomy)} technologies from {self.path}")
+
+
+_holder = _TaxonomyHolder(DEFAULT_TAXONOMY_PATH)
+
+
+def get_taxonomy() -> Taxonomy:
+    """Current process-wide taxonomy, hot-reloaded when the data file changes"""
+    return _holder.get()
@@ -0,0 +1,74 @@
+"""
+TalentScout AI Hiring Assistant - Tech Stack Matcher
+Precompiled single-pass matcher for technologies mentioned in free text
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Tokens keep the punctuation that is part of technology names
+# ("c++", "c#", "node.js", "material-ui") but not trailing punctuation.
+TOKEN_PATTERN = re.compile(r"[a-z0-9#+]+(?:[.\-][a-z0-9#+]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercased text into technology-aware tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class TechMatcher:
+    """Maps technology mentions to canonical names and categories
+
+    Every term is tokenized once at build time and stored in a dict keyed by
+    its token sequence. Matching tokenizes the input once and does a greedy
+    longest-match scan over token n-grams, so a call costs
+    O(tokens x longest term) dictionary lookups no matter how large the
+    vocabulary grows, and terms only match on whole-token boundaries
+    ("r" no longer matches inside "react", nor "go" inside "mongodb").
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]],
+                 aliases: Optional[Dict[str, str]] = None,
+                 display_names: Optional[Dict[str, str]] = None):
+        display_names = display_names or {}
+        self._index: Dict[str, Tuple[str, str]] = {}
+
+        for category, terms in categories.items():
+            for term in terms:
+                name = display_names.get(term, term.title())
+                self._index[" ".join(tokenize(term))] = (name, category)
+
+        for alias, term in (aliases or {}).items():
+            key = " ".join(tokenize(term))
+            if key not in self._index:
+                raise ValueError(f"Alias '{alias}' points to unknown technology '{term}'")
+            self._index[" ".join(tokenize(alias))] = self._index[key]
+
+        self.max_words = max((key.count(" ") + 1 for key in self._index), default=1)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """(name, category) for each distinct technology, in order of appearance"""
+        tokens = tokenize(text)
+        hits: Dict[str, str] = {}
+        i = 0
+        while i < len(tokens):
+            for n in range(min(self.max_words, len(tokens) - i), 0, -1):
+                hit = self._index.get(" ".join(tokens[i:i + n]))
+                if hit is not None:
+                    hits.setdefault(*hit)
+                    i += n
+                    break
+            else:
+                i += 1
+        return list(hits.items())
+
+    def extract(self, text: str) -> List[str]:
+        """Canonical names of the technologies found in text, in order of first mention
+
+        Candidates tend to lead with their primary stack, and question
+        selection covers technologies in this order up to its limit.
+        """
+        return [name for name, _ in self.find(text)]
@@ -0,0 +1,186 @@
+"""
+TalentScout AI Hiring Assistant - Reply Templates
+Precompiled, localizable reply templates with cached markdown rendering
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LOCALES_DIR = Path(__file__).resolve().parent / "data" / "locales"
+
+# Language for reply templates; "en" is the built-in copy, anything else
+# overlays data/locales/<locale>.json on top of it
+TEMPLATE_LOCALE = os.getenv("TALENTSCOUT_LOCALE", "en")
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:  # installed with streamlit; without it the browser renders markdown
+    MarkdownIt = None
+
+_formatter = Formatter()
+
+
+def _compile(key: str, parsed) -> Optional[Callable[[Mapping[str, object]], str]]:
+    """Turn a parsed template into a function that concatenates its pieces
+
+    Only plain ``{name}`` placeholders are compiled; templates with format
+    specs, conversions or attribute lookups are left to str.format.
+    """
+    pieces = []
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            pieces.append(repr(literal))
+        if field is None:
+            continue
+        if not field.isidentifier() or spec or conversion:
+            return None
+        pieces.append(f"str(context[{field!r}])")
+    code = compile(f"lambda context: {' + '.join(pieces) or repr('')}", f"<template {key}>", "eval")
+    return eval(code)
+
+
+class Template:
+    """A reply template parsed once into literal text and placeholders
+
+    Static templates (no placeholders) are interned and returned as the same
+    string object every time, along with their pre-split stream chunks.
+    """
+
+    __slots__ = ("key", "text", "fields", "lines", "_render")
+
+    def __init__(self, key: str, text: str):
+        parsed = list(_formatter.parse(text))
+        self.key = key
+        self.fields = frozenset(field for _, field, _, _ in parsed if field is not None)
+        if self.fields:
+            self.text = text
+        else:
+            self.text = sys.intern("".join(literal for literal, _, _, _ in parsed))
+        self._render = _compile(key, parsed)
+        self.lines = tuple(self.text.splitlines(keepends=True)) if self.static else None
+
+    @property
+    def static(self) -> bool:
+        return not self.fields
+
+    def render(self, context: Mapping[str, object]) -> str:
+        if self.static:
+            return self.text
+        if self._render is None:
+            return self.text.format_map(context)
+        return self._render(context)
+
+    def stream(self, context: Mapping[str, object]) -> Iterator[str]:
+        """Line-sized chunks of the rendered reply"""
+        if self.lines is not None:
+            return iter(self.lines)
+        return iter(self.render(context).splitlines(keepends=True))
+
+
+def load_locale(locale: str) -> Dict[str, str]:
+    """Translated templates for a locale; empty for English or a missing file"""
+    if locale == "en":
+        return {}
+    path = LOCALES_DIR / f"{locale}.json"
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error loading locale '{locale}' from {path}, using English: {e}")
+        return {}
+
+
+class TemplateRegistry:
+    """Every reply template for one copy deck and locale, compiled once"""
+
+    def __init__(self, prompts: Mapping[str, str], locale: str = "en"):
+        self.locale = locale
+        templates = {key: Template(key, text) for key, text in prompts.items()}
+        for key, text in load_locale(locale).items():
+            translated = Template(key, text)
+            base = templates.get(key)
+            # A translation may drop placeholders but not invent new ones
+            if base is not None and not translated.fields <= base.fields:
+                logger.warning(f"Locale '{locale}' template '{key}' uses unknown placeholders, "
+                               f"keeping the original")
+                continue
+            templates[key] = translated
+        self._templates = templates
+        self._static_texts = {t.text for t in templates.values() if t.static}
+        self._joined: Dict[Tuple[str, ...], str] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._templates
+
+    def __getitem__(self, key: str) -> Template:
+        return self._templates[key]
+
+    def render(self, key: str, context: Mapping[str, object]) -> str:
+        return self._templates[key].render(context)
+
+    def join(self, keys: Tuple[str, ...], context: Callable[[], Mapping[str, object]]) -> str:
+        """Render several templates back to back as one reply
+
+        When they are all static the joined text is interned and remembered,
+        so replies such as the greeting are built once per process;
+        ``context`` is only called when a template has placeholders.
+        """
+        joined = self._joined.get(keys)
+        if joined is not None:
+            return joined
+        templates = [self._templates[key] for key in keys]
+        if any(not template.static for template in templates):
+            values = context()
+            return "".join(template.render(values) for template in templates)
+        joined = self._joined[keys] = sys.intern("".join(template.text for template in templates))
+        self._static_texts.add(joined)
+        return joined
+
+    def to_html(self, text: str) -> str:
+        """HTML for a reply; static replies are converted once per process"""
+        if text in self._static_texts:
+            return static_markdown_html(text)
+        return markdown_to_html(text)
+
+
+_registries: Dict[Tuple[int, str], Tuple[Mapping[str, str], TemplateRegistry]] = {}
+_registries_lock = threading.Lock()
+
+
+def get_template_registry(prompts: Mapping[str, str], locale: str = TEMPLATE_LOCALE) -> TemplateRegistry:
+    """Get the shared registry for a copy deck and locale, compiling it on first use"""
+    cache_key = (id(prompts), locale)
+    entry = _registries.get(cache_key)
+    if entry is None:
+        with _registries_lock:
+            entry = _registries.get(cache_key)
+            if entry is None:
+                # Holding the prompts keeps their id from being reused
+                entry = _registries[cache_key] = (prompts, TemplateRegistry(prompts, locale))
+                logger.info(f"Compiled {len(prompts)} reply templates for locale '{locale}'")
+    return entry[1]
+
+
+_markdown = MarkdownIt("commonmark", {"breaks": True, "html": False}) if MarkdownIt else None
+
+
+def markdown_to_html(text: str) -> str:
+    """Render reply markdown to HTML, or return it unchanged without markdown-it"""
+    if _markdown is None:
+        return text
+    return _markdown.render(text)
+
+
+@lru_cache(maxsize=256)
+def static_markdown_html(text: str) -> str:
+    """Cached markdown_to_html for the static replies every candidate receives"""
+    return markdown_to_html(text)
@@ -0,0 +1,82 @@
+"""
+TalentScout AI Hiring Assistant - Candidate Search Tests
+Keyset pagination, its search budget and capped counts
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import candidate_search  # noqa: E402
+from benchmarks.bench_candidate_search import generate  # noqa: E402
+from candidate_search import CandidateFilters, CandidateSearch, CountCache  # noqa: E402
+from database import ConnectionPool  # noqa: E402
+
+CANDIDATES = 3000
+
+
+@pytest.fixture(scope="module")
+def pool(tmp_path_factory):
+    path = tmp_path_factory.mktemp("search") / "candidates.db"
+    generate(path, CANDIDATES, batch=1000)
+    pool = ConnectionPool(str(path))
+    yield pool
+    pool.close_all()
+
+
+def matching_ids(pool, filters):
+    """Every matching id, newest first, straight from the tables"""
+    sql = ("SELECT c.id FROM candidates c WHERE desired_position LIKE ? AND location LIKE ? "
+           "AND EXISTS (SELECT 1 FROM candidate_skills s WHERE s.session_id = c.session_id AND s.skill_key = ?) "
+           "ORDER BY c.id DESC")
+    params = (f"%{filters.position}%", f"{filters.location}%", filters.skill)
+    return [row[0] for row in pool.get_connection().execute(sql, params)]
+
+
+def walk(search, filters, limit):
+    ids, cursor, pages = [], None, 0
+    while True:
+        page = search.search(filters, cursor, limit)
+        ids += [row["id"] for row in page.rows]
+        pages += 1
+        if page.next_cursor is None:
+            return ids, pages
+        assert cursor is None or page.next_cursor < cursor, "every page moves the cursor down"
+        cursor = page.next_cursor
+
+
+FILTERS = CandidateFilters(skill="python", position="engineer", location="pune")
+
+
+def test_keyset_pages_cover_every_match_once(pool, monkeypatch):
+    monkeypatch.setattr(candidate_search, "SCAN_WINDOWS", (256, 1024))
+    search = CandidateSearch(pool, CountCache(), budget_ms=None)
+
+    ids, pages = walk(search, FILTERS, 7)
+    assert ids == matching_ids(pool, FILTERS)
+    assert pages >= len(ids) // 7
+
+
+def test_pages_out_of_budget_resume_where_they_stopped(pool, monkeypatch):
+    monkeypatch.setattr(candidate_search, "SCAN_WINDOWS", (256, 1024))
+    # A deadline already past stops every page after its first window
+    search = CandidateSearch(pool, CountCache(), budget_ms=1e-9)
+
+    ids, pages = walk(search, FILTERS, 7)
+    assert ids == matching_ids(pool, FILTERS)
+    assert pages >= CANDIDATES // 256
+
+
+def test_counts_are_capped_and_estimated_out_of_budget(pool, monkeypatch):
+    monkeypatch.setattr(candidate_search, "COUNT_CAP", 100)
+    exact = len(matching_ids(pool, FILTERS))
+
+    count = CandidateSearch(pool, CountCache(), budget_ms=None).count(FILTERS)
+    assert count == (exact, True)
+    assert CandidateSearch(pool, CountCache(), budget_ms=None).count(CandidateFilters()) == (100, False)
+
+    estimate = CandidateSearch(pool, CountCache(), budget_ms=1e-9).count(FILTERS)
+    assert not estimate.exact
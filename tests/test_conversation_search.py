@@ -0,0 +1,61 @@
+"""
+TalentScout AI Hiring Assistant - Transcript Search Tests
+Watermark-driven indexing of logged messages
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from conversation_search import ConversationSearch  # noqa: E402
+from database import DatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"), write_behind=False)
+    yield db
+    db.close()
+
+
+def watermark(db) -> int:
+    return db.pool.get_connection().execute("SELECT last_id FROM conversation_index_state").fetchone()[0]
+
+
+def check_index(db):
+    """FTS5 raises if the index and the messages it covers disagree"""
+    with db.pool.transaction() as conn:
+        conn.execute("INSERT INTO conversation_fts (conversation_fts, rank) VALUES ('integrity-check', 1)")
+
+
+def test_messages_are_indexed_once_in_batches(db):
+    for n in range(5):
+        db.log_conversation(f"session-{n}", "user", f"Postgres answer number {n}", "technical_questions")
+    search = ConversationSearch(db.pool, batch_size=2)
+
+    assert search.index_pending() == 5
+    assert watermark(db) == 5
+    assert search.index_pending() == 0
+    check_index(db)
+
+    # Searching indexes whatever was logged since the last pass
+    db.log_conversation("session-late", "user", "Postgres came up late", "technical_questions")
+    hits = search.search("postgres")
+    assert len(hits) == 6
+    assert watermark(db) == 6
+
+
+def test_deletes_only_touch_indexed_messages(db):
+    db.log_conversation("session-a", "user", "Kafka consumer groups", "technical_questions")
+    search = ConversationSearch(db.pool)
+    search.index_pending()
+    db.log_conversation("session-b", "user", "Kafka partitions", "technical_questions")
+
+    with db.pool.transaction() as conn:
+        conn.execute("DELETE FROM conversations")
+    check_index(db)
+    assert search.search("kafka") == []
+    assert watermark(db) == 1
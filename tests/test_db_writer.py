@@ -0,0 +1,88 @@
+"""
+TalentScout AI Hiring Assistant - Write-Behind Queue Tests
+Ordering, coalescing and backpressure of the background writer
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import ConnectionPool  # noqa: E402
+from db_writer import WriteBehindWriter  # noqa: E402
+
+CREATE_SQL = "CREATE TABLE items (name TEXT PRIMARY KEY, value TEXT)"
+UPSERT_SQL = "INSERT OR REPLACE INTO items (name, value) VALUES (?, ?)"
+DELETE_SQL = "DELETE FROM items"
+
+
+def make_pool(tmp_path) -> ConnectionPool:
+    pool = ConnectionPool(str(tmp_path / "writer.db"))
+    with pool.transaction() as conn:
+        conn.execute(CREATE_SQL)
+    return pool
+
+
+def rows(pool: ConnectionPool):
+    return pool.get_connection().execute("SELECT name, value FROM items ORDER BY name").fetchall()
+
+
+def stall(writer: WriteBehindWriter) -> threading.Event:
+    """Hold the writer thread before its next commit until the event is set"""
+    release = threading.Event()
+    commit = writer._commit
+
+    def stalled_commit(ops):
+        release.wait(10)
+        commit(ops)
+
+    writer._commit = stalled_commit
+    return release
+
+
+def test_coalesced_ops_keep_the_latest_value(tmp_path):
+    pool = make_pool(tmp_path)
+    writer = WriteBehindWriter(pool)
+    release = stall(writer)
+    for value in ("draft", "final"):
+        writer.submit(UPSERT_SQL, ("a", value), coalesce_key=("item", "a"))
+    writer.submit(UPSERT_SQL, ("b", "only"), coalesce_key=("item", "b"))
+    release.set()
+
+    assert writer.flush(5)
+    assert rows(pool) == [("a", "final"), ("b", "only")]
+    assert writer.get_stats()["coalesced"] >= 1
+    writer.close()
+
+
+def test_full_queue_blocks_instead_of_writing_ahead(tmp_path):
+    pool = make_pool(tmp_path)
+    writer = WriteBehindWriter(pool, max_queue=1, batch_size=1, put_timeout=0.05)
+    release = stall(writer)
+
+    # The first op is held by the stalled writer, the DELETE fills the queue,
+    # and the INSERT that follows must wait rather than commit before it
+    writer.submit(UPSERT_SQL, ("a", "old"))
+    writer.submit(DELETE_SQL, ())
+    submitter = threading.Thread(target=writer.submit, args=(UPSERT_SQL, ("a", "new")))
+    submitter.start()
+    submitter.join(0.3)
+    assert submitter.is_alive(), "submit waits for room in the queue"
+    assert writer.get_stats()["full_waits"] >= 1
+    release.set()
+    submitter.join(5)
+
+    assert writer.flush(5)
+    assert rows(pool) == [("a", "new")]
+    assert writer.get_stats()["sync_writes"] == 0
+    writer.close()
+
+
+def test_writes_after_close_are_synchronous(tmp_path):
+    pool = make_pool(tmp_path)
+    writer = WriteBehindWriter(pool)
+    writer.close()
+    writer.submit(UPSERT_SQL, ("a", "late"))
+    assert rows(pool) == [("a", "late")]
+    assert writer.get_stats()["sync_writes"] == 1
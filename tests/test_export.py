@@ -0,0 +1,73 @@
+"""
+TalentScout AI Hiring Assistant - Export Tests
+Incremental exports of completed interviews
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import DatabaseManager  # noqa: E402
+from export import export_candidates, export_conversations  # noqa: E402
+from hiring_assistant import CandidateInfo  # noqa: E402
+
+# Past any completion stamped during the test, so nothing waits to settle
+UNTIL = "9999-12-31"
+
+
+def start_interview(db: DatabaseManager, session_id: str, name: str) -> CandidateInfo:
+    candidate = CandidateInfo(session_id=session_id, full_name=name, email=f"{session_id}@example.com")
+    db.save_candidate(candidate)
+    db.log_conversation(session_id, "user", f"My name is {name}", "name_collection")
+    db.log_conversation(session_id, "assistant", "Thanks! What is your email?", "email_collection")
+    return candidate
+
+
+def finish_interview(db: DatabaseManager, session_id: str):
+    db.log_conversation(session_id, "user", "My final answer", "technical_questions")
+    db.log_conversation(session_id, "assistant", "Thank you for your time!", "conclusion")
+    db.mark_completed(session_id)
+
+
+def exported(path: Path, field: str):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)[field] for line in f]
+
+
+def test_completed_export_picks_up_interviews_finished_after_a_run(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"), write_behind=False)
+    conn = db.pool.get_connection()
+
+    start_interview(db, "session-a", "Ada Lovelace")
+    start_interview(db, "session-b", "Grace Hopper")
+    finish_interview(db, "session-b")
+
+    first = export_candidates(conn, tmp_path / "run1.jsonl", completed=True, until=UNTIL)
+    first_messages = export_conversations(conn, tmp_path / "run1-messages.jsonl", completed=True, until=UNTIL)
+    assert exported(tmp_path / "run1.jsonl", "session_id") == ["session-b"]
+    assert set(exported(tmp_path / "run1-messages.jsonl", "session_id")) == {"session-b"}
+
+    # A finishes without any profile field changing, so a candidate save is skipped
+    finish_interview(db, "session-a")
+
+    export_candidates(conn, tmp_path / "run2.jsonl", since=first.watermark, completed=True, until=UNTIL)
+    export_conversations(conn, tmp_path / "run2-messages.jsonl", since=first_messages.watermark,
+                         completed=True, until=UNTIL)
+    assert exported(tmp_path / "run2.jsonl", "session_id") == ["session-a"]
+    messages = exported(tmp_path / "run2-messages.jsonl", "session_id")
+    assert messages == ["session-a"] * 4, "messages logged before the first run are included"
+    db.close()
+
+
+def test_completed_export_leaves_unsettled_completions_for_the_next_run(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"), write_behind=False)
+    conn = db.pool.get_connection()
+    start_interview(db, "session-a", "Ada Lovelace")
+    finish_interview(db, "session-a")
+
+    result = export_candidates(conn, tmp_path / "out.jsonl", completed=True, until="2000-01-01")
+    assert result.rows == 0
+    assert result.watermark == ""
+    db.close()
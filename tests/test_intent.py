@@ -0,0 +1,48 @@
+"""
+TalentScout AI Hiring Assistant - Exit Intent Tests
+Standalone utterances, strong words outside free-text stages and names
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from intent import ExitIntentDetector  # noqa: E402
+
+DETECTOR = ExitIntentDetector()
+
+
+@pytest.mark.parametrize("text", ["bye", "Exit please", "ok I’m done now", "please end the interview",
+                                  "  Thank you!  ", "Bye Everyone"])
+def test_standalone_utterances_exit_in_every_stage(text):
+    assert DETECTOR.is_exit(text)
+    assert DETECTOR.is_exit(text, free_text=True)
+
+
+@pytest.mark.parametrize("text", ["Sorry, I need to exit now, my train is here", "gotta go, bye",
+                                  "This is taking too long. Goodbye"])
+def test_strong_words_exit_outside_free_text(text):
+    assert DETECTOR.is_exit(text)
+    assert not DETECTOR.is_exit(text, free_text=True)
+
+
+@pytest.mark.parametrize("text", ["Backend Developer", "Bend, Oregon", "Stoppenberg, Germany",
+                                  "Goodbye Creek, Texas", "Close to Pune, India",
+                                  "Senior engineer, I'd like to stop doing on-call", "mark.endo@example.com"])
+def test_answers_that_mention_exit_words_continue(text):
+    assert not DETECTOR.is_exit(text)
+
+
+def test_free_text_answers_continue():
+    answer = "I would close the connection and check the exit code before the end of the job"
+    assert not DETECTOR.is_exit(answer, free_text=True)
+
+
+def test_single_word_detector_without_strong_words():
+    detector = ExitIntentDetector(strong=(), weak=("exit", "quit", "bye", "goodbye"), filler=(), max_words=1)
+    assert detector.is_exit(" Goodbye! ")
+    assert not detector.is_exit("ok bye")
+    assert not detector.is_exit("stop")
@@ -0,0 +1,57 @@
+"""
+TalentScout AI Hiring Assistant - Migration Tests
+Schema versions and resumable backfills
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from migrations import MIGRATIONS, AddColumn, Backfill, Migration, current_version, migrate  # noqa: E402
+
+
+def test_fresh_database_reaches_the_latest_version(tmp_path):
+    conn = sqlite3.connect(tmp_path / "candidates.db")
+    latest = max(migration.version for migration in MIGRATIONS)
+    assert migrate(conn) == latest
+    assert migrate(conn) == latest
+    versions = conn.execute("SELECT count(*) FROM schema_version").fetchone()[0]
+    assert versions == len(MIGRATIONS)
+    conn.close()
+
+
+class Crash(Exception):
+    pass
+
+
+def test_interrupted_backfill_resumes_after_its_last_batch(tmp_path):
+    conn = sqlite3.connect(tmp_path / "items.db")
+    with conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value INTEGER)")
+        conn.executemany("INSERT INTO items (value) VALUES (?)", [(n,) for n in range(1, 11)])
+
+    ranges = []
+
+    def double(conn, first, last):
+        ranges.append((first, last))
+        conn.execute("UPDATE items SET doubled = value * 2 WHERE id BETWEEN ? AND ?", (first, last))
+        if len(ranges) == 2:
+            raise Crash()
+
+    migrations = (Migration(1, "double values", (AddColumn("items", "doubled", "INTEGER"),),
+                            Backfill("items", double, batch_size=3)),)
+    with pytest.raises(Crash):
+        migrate(conn, migrations)
+    assert current_version(conn) == 0
+    assert conn.execute("SELECT count(*) FROM items WHERE doubled IS NOT NULL").fetchone()[0] == 3
+
+    # The DDL re-runs, and the batch that crashed is redone but the one before it is not
+    assert migrate(conn, migrations) == 1
+    assert ranges == [(1, 3), (4, 6), (4, 6), (7, 9), (10, 10)]
+    assert conn.execute("SELECT count(*) FROM items WHERE doubled = value * 2").fetchone()[0] == 10
+    assert conn.execute("SELECT count(*) FROM migration_progress").fetchone()[0] == 0
+    conn.close()
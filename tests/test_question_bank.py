@@ -0,0 +1,36 @@
+"""
+TalentScout AI Hiring Assistant - Question Bank Tests
+Seniority parsing of free-text experience answers
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_bank import seniority_from_experience  # noqa: E402
+
+
+@pytest.mark.parametrize("answer, level", [
+    ("5 years 6 months", "senior"),
+    ("4 years 11 months", "mid"),
+    ("18 months", "junior"),
+    ("3-5 years", "senior"),
+    ("fresher", "junior"),
+    ("recently graduated, no experience", "junior"),
+    ("entry-level", "junior"),
+    ("", "mid"),
+])
+def test_seniority_from_experience(answer, level):
+    assert seniority_from_experience(answer) == level
+
+
+@pytest.mark.parametrize("answer", [
+    "6 years of international experience",
+    "5 years, nonetheless mostly backend",
+    "7 years including an internal platform team",
+])
+def test_junior_keywords_only_match_whole_words(answer):
+    assert seniority_from_experience(answer) == "senior"
@@ -0,0 +1,70 @@
+"""
+TalentScout AI Hiring Assistant - Question Generator Tests
+LLM response caching, retake dedup and backend selection
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import question_bank  # noqa: E402
+from question_bank import QuestionBank  # noqa: E402
+from question_generator import (  # noqa: E402
+    BankQuestionGenerator, LLMQuestionGenerator, QuestionRequest, ResponseCache, StubLLMBackend,
+    create_question_generator,
+)
+
+REQUEST = QuestionRequest(tech_stack=("python", "django"), seniority="mid", position="Backend Engineer")
+
+
+@pytest.fixture(autouse=True)
+def bank(tmp_path, monkeypatch):
+    bank = QuestionBank(str(tmp_path / "bank.db"))
+    monkeypatch.setattr(question_bank, "_question_bank", bank)
+    return bank
+
+
+class StaleFirstReadCache(ResponseCache):
+    """Misses the first counted read, as if another request filled the cache just after it"""
+
+    def __init__(self):
+        super().__init__(path=None)
+        self.stale_reads = 1
+
+    def get(self, key, count=True):
+        if count and self.stale_reads:
+            self.stale_reads -= 1
+            return None
+        return super().get(key, count)
+
+
+def test_cache_is_checked_again_before_calling_the_model():
+    backend = StubLLMBackend()
+    generator = LLMQuestionGenerator(backend, cache=StaleFirstReadCache())
+    generator.cache.put(REQUEST.cache_key(), ["What is a Python generator?"])
+
+    assert generator.generate(REQUEST) == ["What is a Python generator?"]
+    assert backend.calls == 0
+
+
+def test_retake_is_not_served_the_same_cached_questions():
+    backend = StubLLMBackend()
+    generator = LLMQuestionGenerator(backend, cache=ResponseCache(path=None))
+
+    first = generator.generate(REQUEST, candidate_key="candidate-a")
+    other = generator.generate(REQUEST, candidate_key="candidate-b")
+    retake = generator.generate(REQUEST, candidate_key="candidate-a")
+
+    assert backend.calls == 1
+    assert other == first, "other candidates share the cached questions"
+    assert retake, "the bank tops the retake up"
+    assert not set(retake) & set(first)
+
+
+def test_llm_backend_is_opt_in(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    assert isinstance(create_question_generator(), BankQuestionGenerator)
+    assert isinstance(create_question_generator("llm", "stub"), LLMQuestionGenerator)
@@ -0,0 +1,68 @@
+"""
+TalentScout AI Hiring Assistant - Session Registry Tests
+Spilling idle sessions to the database and restoring them
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import DatabaseManager  # noqa: E402
+from sessions import DatabaseSessionStore, SessionRegistry  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"), write_behind=False)
+    yield db
+    db.close()
+
+
+def make_registry(db, **kwargs) -> SessionRegistry:
+    store = DatabaseSessionStore(db, to_state=dict, from_state=dict)
+    return SessionRegistry(lambda: {"turns": 0}, store=store, **kwargs)
+
+
+def test_evicted_sessions_are_spilled_and_loaded_back(db):
+    registry = make_registry(db, max_sessions=1)
+    with registry.session("a") as (_, state):
+        state["turns"] = 3
+    with registry.session("b"):
+        pass
+
+    assert "a" not in registry
+    assert registry.get_stats()["spilled"] == 1
+    with registry.session("a") as (_, state):
+        assert state == {"turns": 3}
+    assert registry.get_stats()["restored"] == 1
+
+
+def test_restore_keeps_the_live_session(db):
+    registry = make_registry(db)
+    with registry.session("a") as (_, state):
+        state["turns"] = 1
+        registry.checkpoint("a", state)
+        state["turns"] = 2
+
+    assert registry.restore("a")
+    with registry.session("a") as (_, state):
+        assert state == {"turns": 2}
+    assert registry.get_stats()["restored"] == 0
+
+
+def test_restore_loads_from_the_store_on_a_miss(db):
+    writer = make_registry(db)
+    with writer.session("a") as (_, state):
+        state["turns"] = 5
+        writer.checkpoint("a", state)
+
+    # Another worker, which has never seen the session
+    registry = make_registry(db)
+    assert registry.restore("a")
+    assert not registry.restore("unknown")
+    with registry.session("a") as (_, state):
+        assert state == {"turns": 5}
+    assert registry.get_stats()["restored"] == 1
@@ -0,0 +1,45 @@
+"""
+TalentScout AI Hiring Assistant - Skill Storage Tests
+Incremental, all-or-nothing updates of a candidate's skill rows
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import DatabaseManager  # noqa: E402
+
+
+def test_skill_changes_are_written_incrementally(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"), write_behind=False)
+    db.save_skills("session-a", ["Python", "React"])
+    assert db.get_skills("session-a") == ["Python", "React"]
+
+    statements = []
+    db.pool.get_connection().set_trace_callback(statements.append)
+    db.save_skills("session-a", ["Python", "Go"], previous=["Python", "React"])
+    db.pool.get_connection().set_trace_callback(None)
+
+    assert db.get_skills("session-a") == ["Go", "Python"]
+    writes = [s for s in statements if s.lstrip().startswith(("INSERT", "DELETE"))]
+    assert len(writes) == 2, "only React is deleted and only Go inserted"
+
+    db.save_skills("session-a", ["Go", "Python"], previous=["Python", "Go"])
+    assert db.find_sessions_with_skill("go") == ["session-a"]
+    db.close()
+
+
+def test_skill_update_is_one_transaction_through_the_writer(tmp_path):
+    db = DatabaseManager(str(tmp_path / "candidates.db"))
+    db.save_skills("session-a", ["Python", "React"])
+    db.save_skills("session-a", ["Rust"], previous=["Python", "React"])
+    assert db.flush(5)
+    assert db.get_skills("session-a") == ["Rust"]
+
+    # A compound op that fails part way leaves no partial update behind
+    db.writer.submit(("DELETE FROM candidate_skills WHERE session_id = ?", "INSERT INTO no_such_table VALUES (?)"),
+                     (("session-a",), (1,)))
+    assert db.flush(5)
+    assert db.get_skills("session-a") == ["Rust"]
+    db.close()
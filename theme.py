@@ -0,0 +1,88 @@
+"""
+TalentScout AI Hiring Assistant - Theme Assets
+Minified, hashed theme markup built once per process
+"""
+
+import hashlib
+import logging
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+THEME_CSS_PATH = Path(__file__).resolve().parent / "static" / "theme.css"
+
+# Default for clients that don't pass ?lite=...; lite mode drops animations,
+# particles and the web-font download for low-power devices.
+LITE_UI = os.getenv("TALENTSCOUT_LITE_UI", "0") == "1"
+
+PARTICLES_HTML = '<div class="particles">' + '<div class="particle"></div>' * 9 + '</div>'
+
+LITE_CSS = """
+*, *::before, *::after {
+    animation: none !important;
+    transition: none !important;
+}
+.particles { display: none !important; }
+.main, .chat-message, .sidebar-card { backdrop-filter: none !important; }
+"""
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"\s*([{}:;,>])\s*")
+_IMPORT_RE = re.compile(r"@import\s+url\([^)]*\)[^;]*;")
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _COMMENT_RE.sub("", css)
+    css = _WHITESPACE_RE.sub(" ", css)
+    css = _PUNCTUATION_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@lru_cache(maxsize=None)
+def theme_markup(lite: bool = False) -> str:
+    """Style block (plus particles) to inject on every run
+
+    The markup is byte-identical across reruns, so once the browser has it
+    Streamlit's message cache sends only its hash instead of the payload.
+    """
+    css = THEME_CSS_PATH.read_text(encoding="utf-8")
+    if lite:
+        css = _IMPORT_RE.sub("", css) + LITE_CSS
+    css = minify_css(css)
+    digest = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    markup = f'<style data-theme="{digest}">{css}</style>'
+    if not lite:
+        markup += PARTICLES_HTML
+    return markup
+
+
+def forward_msg_bytes(markup: str) -> Tuple[int, int]:
+    """Serialized ForwardMsg bytes for injecting markup on first load and on a rerun
+
+    Uses Streamlit's own message hashing: a message at or over
+    ``global.minCachedMessageSize`` is sent in full once per browser and as
+    a hash reference after that.
+    """
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+    from streamlit.runtime.forward_msg_cache import create_reference_msg, populate_hash_if_needed
+
+    msg = ForwardMsg()
+    msg.delta.new_element.markdown.body = markup
+    msg.delta.new_element.markdown.allow_html = True
+    populate_hash_if_needed(msg)
+    first = msg.ByteSize()
+    return first, create_reference_msg(msg).ByteSize() if msg.metadata.cacheable else first
+
+
+def payload_report() -> Dict[str, int]:
+    """ForwardMsg bytes of the full and lite themes on first load and per rerun"""
+    report = {}
+    for name, lite in (("full", False), ("lite", True)):
+        report[f"{name}_first_load_bytes"], report[f"{name}_rerun_bytes"] = forward_msg_bytes(theme_markup(lite))
+    return report